@@ -0,0 +1,64 @@
+"""
+Benchmarks of DictUtils getters and SchemaValidator.
+
+    python -m benchmarks --output before.json
+    python -m benchmarks --output after.json
+    python -m benchmarks --compare before.json after.json --threshold 10
+
+With one file --compare runs the benchmarks and compares them with the file.
+The exit code is 1 if a case is slower than the baseline by more than --threshold percent.
+"""
+import argparse
+import json
+import sys
+
+from benchmarks.cases import all_cases
+from benchmarks.runner import run, compare, dumps
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', help="write the JSON results to the file")
+    parser.add_argument('--compare', nargs='+', metavar='FILE', help="baseline [current] result files")
+    parser.add_argument('--threshold', type=float, default=10.0, help="allowed slowdown in percent")
+    parser.add_argument('--filter', help="run only the cases containing the substring")
+    parser.add_argument('--repeat', type=int, default=5, help="number of runs of each case, the best is taken")
+    parser.add_argument('--min-time', type=float, default=0.2, help="minimal duration of a run in seconds")
+    args = parser.parse_args(argv)
+
+    if args.compare and len(args.compare) > 2:
+        parser.error("--compare takes one or two files")
+
+    if args.compare and len(args.compare) == 2:
+        current = _load(args.compare[1])
+    else:
+        current = run(all_cases(), args.repeat, args.min_time, args.filter)
+        if args.output:
+            with open(args.output, 'w') as f:
+                f.write(dumps(current))
+                f.write('\n')
+        elif not args.compare:
+            print(dumps(current))
+
+    if not args.compare:
+        return 0
+
+    rows = compare(_load(args.compare[0]), current, args.threshold)
+    regressions = 0
+    for name, before, after, change, regression in rows:
+        regressions += regression
+        mark = 'REGRESSION' if regression else ''
+        print(f"{name:<60} {before:>14.1f} {after:>14.1f} {change:>+8.1f}% {mark}")
+
+    print(f"{len(rows)} cases compared, {regressions} slower than the threshold {args.threshold}%")
+    return 1 if regressions else 0
+
+
+def _load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
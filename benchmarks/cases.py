@@ -0,0 +1,158 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from power_dict import codegen
+from power_dict.instrumentation import Collector, Instrumentation
+from power_dict.schema_validator import SchemaValidator
+from power_dict.utils import DictUtils
+
+GETTER_VALUES = {
+    "object": {'a': 1},
+    "str": " value ",
+    "int": "12345",
+    "float": "12.5",
+    "decimal": "1999.99",
+    "bool": "yes",
+    "date": "2018-11-23",
+    "datetime": "2018-11-23 01:45:59",
+    "list": [1, 2, 3],
+}
+
+TYPED_VALUES = {
+    "int": 12345,
+    "float": 12.5,
+    "decimal": Decimal("1999.99"),
+    "bool": True,
+    "date": date(2018, 11, 23),
+    "datetime": datetime(2018, 11, 23, 1, 45, 59),
+}
+
+GETTERS = {
+    "object": ("get_dict_property", "get_required_dict_property"),
+    "str": ("get_str_dict_property", "get_required_str_dict_property"),
+    "int": ("get_int_dict_property", "get_required_int_dict_property"),
+    "float": ("get_float_dict_property", "get_required_float_dict_property"),
+    "decimal": ("get_decimal_dict_property", "get_required_decimal_dict_property"),
+    "bool": ("get_bool_dict_property", "get_required_bool_dict_property"),
+    "date": ("get_date_dict_property", "get_required_date_dict_property"),
+    "datetime": ("get_datetime_dict_property", "get_required_datetime_dict_property"),
+    "list": ("get_list_dict_property", "get_required_list_dict_property"),
+}
+
+SCHEMA_TYPES = ["str", "int", "float", "decimal", "bool", "date", "datetime", "enum", "list", "object"]
+
+
+def getter_cases() -> dict:
+    cases = {}
+    for data_type, (optional, required) in GETTERS.items():
+        properties = {'key': GETTER_VALUES[data_type]}
+        optional_func = getattr(DictUtils, optional)
+        required_func = getattr(DictUtils, required)
+
+        cases[f"getters.{optional}"] = lambda f=optional_func, p=properties: f(p, 'key')
+        cases[f"getters.{optional}.missing"] = lambda f=optional_func: f({}, 'key')
+        cases[f"getters.{required}"] = lambda f=required_func, p=properties: f(p, 'key')
+        cases[f"getters.get_value.{data_type}"] = \
+            lambda t=data_type, p=properties: DictUtils.get_value(p, 'key', data_type=t)
+        cases[f"getters.get_required_value.{data_type}"] = \
+            lambda t=data_type, p=properties: DictUtils.get_required_value(p, 'key', data_type=t)
+
+        if data_type in TYPED_VALUES:
+            typed = {'key': TYPED_VALUES[data_type]}
+            cases[f"getters.{optional}.typed"] = lambda f=optional_func, p=typed: f(p, 'key')
+            cases[f"getters.{required}.typed"] = lambda f=required_func, p=typed: f(p, 'key')
+
+    return cases
+
+
+def path_cases() -> dict:
+    cases = {}
+    for depth in (1, 3, 5, 10):
+        properties = "12345"
+        keys = [f"level_{i}" for i in range(depth)]
+        for key in reversed(keys):
+            properties = {key: properties, 'other': 1}
+
+        path = '.'.join(keys)
+        cases[f"path.get_setting_by_path.depth_{depth}"] = \
+            lambda p=properties, k=path: DictUtils.get_setting_by_path(p, k, data_type="int")
+
+    return cases
+
+
+def make_schema(size: int) -> tuple:
+    schema = []
+    context = {}
+    for i in range(size):
+        data_type = SCHEMA_TYPES[i % len(SCHEMA_TYPES)]
+        name = f"field_{i}"
+        item = {'name': name, 'type': data_type, 'required': i % 2 == 0}
+
+        if data_type == "enum":
+            item['choices'] = ['male', 'female']
+            context[name] = 'male'
+        elif data_type == "list":
+            item['items'] = {'type': 'int'}
+            context[name] = ['1', '2', '3']
+        else:
+            context[name] = GETTER_VALUES[data_type]
+
+        if i % 3 == 0:
+            item['validators'] = [lambda v: v is not None]
+
+        schema.append(item)
+
+    return schema, context
+
+
+def schema_cases() -> dict:
+    cases = {}
+    for size in (5, 50, 500):
+        schema, context = make_schema(size)
+        cases[f"schema.validate.fields_{size}"] = \
+            lambda c=context, s=schema: SchemaValidator.validate(c, s)
+        cases[f"schema.compiled.fields_{size}"] = \
+            lambda c=context, v=SchemaValidator.compile(schema).validate: v(c)
+        cases[f"schema.codegen.fields_{size}"] = \
+            lambda c=context, v=codegen.generate(SchemaValidator.compile(schema)): v(c)
+
+    for size in (10, 1000, 100000):
+        schema = [{'name': 'ids', 'type': 'list', 'required': True, 'items': {'type': 'int'}}]
+        context = {'ids': [str(i) for i in range(size)]}
+        cases[f"schema.validate.list_items_{size}"] = \
+            lambda c=context, s=schema: SchemaValidator.validate(c, s)
+
+    return cases
+
+
+def all_cases() -> dict:
+    cases = {}
+    cases.update(getter_cases())
+    cases.update(path_cases())
+    cases.update(schema_cases())
+    cases.update(instrumentation_cases())
+    return cases
+
+
+def instrumentation_cases() -> dict:
+    collector = Collector()
+
+    def with_collector(func):
+        def run():
+            Instrumentation.install(collector)
+            try:
+                func()
+            finally:
+                Instrumentation.uninstall()
+
+        return run
+
+    properties = {'key': "12345"}
+    schema, context = make_schema(50)
+
+    return {
+        "instrumentation.get_value.int.collector":
+            with_collector(lambda: DictUtils.get_value(properties, 'key', data_type="int")),
+        "instrumentation.validate.fields_50.collector":
+            with_collector(lambda: SchemaValidator.validate(context, schema)),
+    }
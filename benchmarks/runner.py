@@ -0,0 +1,57 @@
+import json
+import platform
+import timeit
+
+
+def measure(func, repeat: int = 5, min_time: float = 0.2) -> float:
+    """
+    Time of one call of func in nanoseconds: the best of 'repeat' runs of at least min_time seconds each
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+
+        number = number * 10 if elapsed < min_time / 10 else int(number * min_time / elapsed) + 1
+
+    best = min([elapsed] + timer.repeat(repeat - 1, number))
+    return best / number * 1e9
+
+
+def run(cases: dict, repeat: int = 5, min_time: float = 0.2, pattern: str = None) -> dict:
+    results = {}
+    for name in sorted(cases):
+        if pattern is not None and pattern not in name:
+            continue
+
+        results[name] = {'ns_per_op': round(measure(cases[name], repeat, min_time), 1)}
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'results': results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list:
+    """
+    Compare two runs
+    :param baseline: results of the baseline run
+    :param current: results of the current run
+    :param threshold: allowed slowdown in percent
+    :return: rows (name, baseline ns, current ns, change in percent, is regression)
+    """
+    rows = []
+    for name in sorted(set(baseline['results']) & set(current['results'])):
+        before = baseline['results'][name]['ns_per_op']
+        after = current['results'][name]['ns_per_op']
+        change = (after - before) / before * 100 if before else 0.0
+        rows.append((name, before, after, change, change > threshold))
+
+    return rows
+
+
+def dumps(results: dict) -> str:
+    return json.dumps(results, indent=2, sort_keys=True)
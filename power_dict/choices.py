@@ -0,0 +1,315 @@
+from collections import OrderedDict
+from operator import is_
+from threading import Lock
+
+from power_dict.errors import InvalidSchemeError
+from power_dict.utils import DictUtils
+
+# the error message lists at most this number of options
+MAX_OPTIONS_IN_MESSAGE = 20
+
+_MISSING = object()
+
+_registry = {}
+_registry_lock = Lock()
+
+# the choices prepared by cached_choices
+_CACHED_MAXSIZE = 128
+_cached = OrderedDict()
+_cached_lock = Lock()
+
+
+class Choices:
+    """
+    Choices of the enum with a hash index: exact values, aliases and, optionally, case-insensitive values.
+    An alias or a value in another case is replaced with the choice it stands for
+    """
+    __slots__ = ('_state',)
+
+    def __init__(self, values, case_insensitive: bool = False, aliases: dict = None):
+        self._state = None
+        self.update(values, case_insensitive, aliases)
+
+    @property
+    def values(self) -> list:
+        """
+        List of choices
+        """
+        return self._state.values
+
+    @property
+    def options(self) -> str:
+        """
+        Choices in the error message
+        """
+        return self._state.options
+
+    @property
+    def case_insensitive(self) -> bool:
+        """
+        A str value matches a str choice in any case?
+        """
+        return self._state.case_insensitive
+
+    @property
+    def aliases(self) -> dict:
+        """
+        Dict of alias -> choice or None
+        """
+        return self._state.aliases
+
+    def update(self, values, case_insensitive: bool = False, aliases: dict = None):
+        """
+        Replace the choices. The compiled schemes using them see the new choices.
+        The new state is built aside and replaced at once, so a concurrent resolve sees the old or the new choices
+        :param values: iterable of choices
+        :param case_insensitive: a str value matches a str choice in any case
+        :param aliases: dict of alias -> choice
+        :return:
+        """
+        values = list(values)
+        aliases = dict(aliases) if aliases else None
+
+        try:
+            lookup = frozenset(values)
+        except TypeError:
+            # unhashable choices are compared one by one
+            lookup = None
+
+        mapping = None
+        if aliases is not None or case_insensitive:
+            if lookup is None:
+                raise InvalidSchemeError("Aliases and case-insensitive choices must be hashable")
+
+            mapping = {}
+            for alias, value in (aliases or {}).items():
+                if value not in lookup:
+                    raise InvalidSchemeError(f"The alias '{alias}' refers to the unknown choice '{value}'")
+
+                mapping[alias] = value
+
+            if case_insensitive:
+                for key, value in [*((value, value) for value in values), *mapping.items()]:
+                    if isinstance(key, str):
+                        mapping.setdefault(key.casefold(), value)
+
+        self._state = _ChoicesState(values, _format_options(values), bool(case_insensitive), aliases,
+                                    lookup, mapping)
+
+    def resolve(self, value, default=None):
+        """
+        The choice of the value
+        :param value: value, alias or, for case-insensitive choices, the value in any case
+        :param default: returned if the value is not available
+        :return: the value itself, the choice of the alias or default
+        """
+        return _resolve(self._state, value, default)
+
+    def resolve_all(self, values, copy: bool = True) -> tuple:
+        """
+        The choices of the list items, None items are kept
+        :param values: list
+        :param copy: build a new list, otherwise the list itself is returned if all items are choices
+        :return: list and the first item that is not available or None
+        """
+        state = self._state
+        lookup = state.lookup
+        if lookup is not None:
+            try:
+                if lookup.issuperset(values):
+                    return (values if not copy and values.__class__ is list else list(values)), None
+            except TypeError:
+                pass
+
+        result = []
+        for value in values:
+            if value is not None:
+                choice = _resolve(state, value, _MISSING)
+                if choice is _MISSING:
+                    return result, value
+
+                value = choice
+
+            result.append(value)
+
+        return result, None
+
+    def error_message(self, value) -> str:
+        """
+        The message of the not available value
+        :param value:
+        :return: message
+        """
+        return f"The value '{value}' is not available for selection. Possible options: {self._state.options}"
+
+    def __len__(self):
+        return len(self._state.values)
+
+    def __contains__(self, value):
+        return self.resolve(value, _MISSING) is not _MISSING
+
+
+class _ChoicesState:
+    """
+    Immutable state of Choices
+    """
+    __slots__ = ('values', 'options', 'case_insensitive', 'aliases', 'lookup', 'mapping')
+
+    def __init__(self, values: list, options: str, case_insensitive: bool, aliases, lookup, mapping):
+        self.values = values
+        self.options = options
+        self.case_insensitive = case_insensitive
+        self.aliases = aliases
+        self.lookup = lookup
+        self.mapping = mapping
+
+
+class ChoiceRegistry:
+    """
+    Named choices shared by the schemes: a field with 'choices_registry': name uses the registered choices
+    instead of its own 'choices'. One index is kept in memory for all schemes
+    """
+
+    @staticmethod
+    def register(name: str, values, case_insensitive: bool = False, aliases: dict = None) -> Choices:
+        """
+        Register the choices. The choices registered with the same name before are replaced in place,
+        so the compiled schemes using them see the new choices
+        :param name: registry name
+        :param values: iterable of choices
+        :param case_insensitive: a str value matches a str choice in any case
+        :param aliases: dict of alias -> choice
+        :return: Choices
+        """
+        if DictUtils.str_is_null_or_empty(name):
+            raise InvalidSchemeError("The name of the choices registry is required")
+
+        with _registry_lock:
+            choices = _registry.get(name)
+            if choices is None:
+                choices = _registry[name] = Choices(values, case_insensitive, aliases)
+            else:
+                choices.update(values, case_insensitive, aliases)
+
+        return choices
+
+    @staticmethod
+    def unregister(name: str = None):
+        """
+        Remove the registered choices. The schemes compiled before keep them
+        :param name: registry name, all registries if None
+        :return:
+        """
+        with _registry_lock:
+            if name is None:
+                _registry.clear()
+            else:
+                _registry.pop(name, None)
+
+    @staticmethod
+    def get(name: str) -> Choices:
+        """
+        The registered choices
+        :param name: registry name
+        :return: Choices
+        """
+        choices = _registry.get(name)
+        if choices is None:
+            raise InvalidSchemeError(f"The choices registry '{name}' is not registered")
+
+        return choices
+
+
+def _resolve(state: _ChoicesState, value, default):
+    lookup = state.lookup
+    if lookup is None:
+        return value if value in state.values else default
+
+    mapping = state.mapping
+    try:
+        if value in lookup:
+            return value
+
+        if mapping is None:
+            return default
+
+        choice = mapping.get(value, _MISSING)
+    except TypeError:
+        return value if value in state.values else default
+
+    if choice is not _MISSING:
+        return choice
+
+    if state.case_insensitive and isinstance(value, str):
+        return mapping.get(value.casefold(), default)
+
+    return default
+
+
+def get_choices(rule: dict, required_error=None) -> Choices:
+    """
+    Choices of the enum field or of the enum items: the registry 'choices_registry'
+    or the 'choices' list with the 'case_insensitive' and 'choice_aliases' rules
+    :param rule: field or 'items' rule
+    :param required_error: error message if 'choices' is none
+    :return: Choices
+    """
+    name = DictUtils.get_str_dict_property(rule, 'choices_registry', None)
+    if name is not None:
+        return ChoiceRegistry.get(name)
+
+    values = DictUtils.get_required_list_dict_property(rule, 'choices', required_error=required_error)
+    case_insensitive = DictUtils.get_bool_dict_property(rule, 'case_insensitive', default_value=False)
+    aliases = DictUtils.get_dict_property(rule, 'choice_aliases')
+
+    return Choices(values, case_insensitive, aliases)
+
+
+def cached_choices(rule: dict, required_error=None) -> Choices:
+    """
+    The same as get_choices, but the choices are prepared once per rule dictionary
+    and prepared again if a value of the rule is replaced. SchemaValidator.invalidate drops them
+    :param rule: field or 'items' rule
+    :param required_error: error message if 'choices' is none
+    :return: Choices
+    """
+    if rule.__class__ is not dict or rule.get('choices_registry') is not None:
+        return get_choices(rule, required_error)
+
+    key = id(rule)
+    # the values themselves: the entry keeps them alive, so a replaced value is never mistaken for the old one
+    # with a reused id
+    version = tuple(rule.values())
+
+    with _cached_lock:
+        entry = _cached.get(key)
+        if entry is not None and len(entry[1]) == len(version) and all(map(is_, entry[1], version)):
+            _cached.move_to_end(key)
+            return entry[2]
+
+    choices = get_choices(rule, required_error)
+
+    with _cached_lock:
+        # the entry keeps the rule alive, so its id is not reused
+        _cached[key] = (rule, version, choices)
+        if len(_cached) > _CACHED_MAXSIZE:
+            _cached.popitem(last=False)
+
+    return choices
+
+
+def clear_cached_choices():
+    """
+    Drop the choices prepared by cached_choices
+    :return:
+    """
+    with _cached_lock:
+        _cached.clear()
+
+
+def _format_options(values: list) -> str:
+    if len(values) <= MAX_OPTIONS_IN_MESSAGE:
+        return str(values)
+
+    shown = ', '.join(map(repr, values[:MAX_OPTIONS_IN_MESSAGE]))
+    return f"[{shown}, ...] ({len(values) - MAX_OPTIONS_IN_MESSAGE} more)"
@@ -0,0 +1,377 @@
+import os
+from collections import OrderedDict
+from threading import Lock
+from datetime import date, datetime
+from decimal import Decimal
+
+from power_dict.compiled_schema import CompiledSchema, schema_keys, _FORMAT_TYPES, _Failure, \
+    _none_failure, _validator_message, _parse_default
+from power_dict.errors import InvalidParameterError, InvalidSchemeError, NoneParameterError, \
+    NotAllowedParameterError
+from power_dict.utils import DictUtils, is_empty, _TYPE_PARSERS, _TYPE_CLASSES, _PARSE_ERRORS
+
+# values of these types are a part of the fingerprint, other values are identified by id
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None), Decimal, date, datetime))
+
+_enabled = os.environ.get('POWER_DICT_CODEGEN', '').lower() in ('1', 'true', 'yes')
+_maxsize = 256
+_cache = OrderedDict()
+_cache_lock = Lock()
+_hits = 0
+_misses = 0
+# changed by clear, the functions taken from the previous cache are not used any more
+_generation = 0
+
+
+class CodegenBackend:
+    """
+    Optional backend of SchemaValidator.validate: every scheme is turned into one straight-line Python function
+    with inlined conversions, required checks and defaults. The functions are cached by the scheme fingerprint.
+    A scheme that can't be generated is validated by the interpreted backend.
+    The backend is enabled by default if the environment variable POWER_DICT_CODEGEN=1
+    """
+
+    @staticmethod
+    def enable(maxsize: int = 256):
+        """
+        Enable the backend. The previous cache is dropped
+        :param maxsize: maximum number of cached functions
+        :return:
+        """
+        global _enabled, _maxsize
+        _enabled = True
+        _maxsize = maxsize
+        CodegenBackend.clear()
+
+    @staticmethod
+    def disable():
+        """
+        Disable the backend and drop the cache
+        :return:
+        """
+        global _enabled
+        _enabled = False
+        CodegenBackend.clear()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """
+        The backend is enabled?
+        :return: status
+        """
+        return _enabled
+
+    @staticmethod
+    def clear():
+        """
+        Drop the cached functions and reset the counters
+        :return:
+        """
+        global _hits, _misses, _generation
+        with _cache_lock:
+            _cache.clear()
+            _hits = 0
+            _misses = 0
+            _generation += 1
+
+    @staticmethod
+    def info() -> dict:
+        """
+        Cache counters
+        :return: dict with hits, misses, maxsize and currsize
+        """
+        with _cache_lock:
+            return {'hits': _hits, 'misses': _misses, 'maxsize': _maxsize, 'currsize': len(_cache)}
+
+
+def get_validator(schema: list, key_policy=None):
+    """
+    The generated function of the scheme from the cache or a new one
+    :param schema:
+    :param key_policy: accepted key styles of all fields, see SchemaValidator.compile
+    :return: callable(context, sanitize_schema) or None if the scheme can't be generated
+    """
+    global _hits, _misses
+
+    key = fingerprint(schema)
+    if key_policy is not None:
+        key = (_freeze(key_policy), key)
+
+    with _cache_lock:
+        if key in _cache:
+            _hits += 1
+            _cache.move_to_end(key)
+            return _cache[key]
+
+        _misses += 1
+        generation = _generation
+
+    # the function is generated without the lock, two threads may generate the same scheme
+    try:
+        validator = generate(CompiledSchema(schema, schema_keys(schema, key_policy), key_policy))
+    except Exception:
+        # the errors of the scheme are raised by the interpreted backend in the same order as before
+        validator = None
+
+    with _cache_lock:
+        # the function generated before clear is not cached
+        if generation == _generation:
+            _cache[key] = validator
+            if len(_cache) > _maxsize:
+                _cache.popitem(last=False)
+
+    return validator
+
+
+def fingerprint(schema) -> tuple:
+    """
+    Hashable fingerprint of the scheme. Callables and mutable default values are identified by id,
+    the cached function keeps them alive, so the ids are not reused
+    :param schema:
+    :return: tuple
+    """
+    return _freeze(schema)
+
+
+def _freeze(value):
+    cls = value.__class__
+    if cls is str:
+        return value
+
+    if cls is dict:
+        return tuple([(key, item if item.__class__ is str else
+                       _identity(item) if key == 'default_value' else _freeze(item))
+                      for key, item in value.items()])
+
+    if cls is list or cls is tuple:
+        return cls, tuple([item if item.__class__ is str else _freeze(item) for item in value])
+
+    return _identity(value)
+
+
+def _identity(value):
+    # 1, 1.0 and True are equal keys, so the type is a part of the key
+    if value.__class__ in _SCALAR_TYPES:
+        return value.__class__, value
+
+    return id, id(value)
+
+
+def generate(compiled: CompiledSchema):
+    """
+    Generate the validation function of the compiled scheme
+    :param compiled: CompiledSchema
+    :return: callable(context, sanitize_schema=True) -> dict
+    """
+    namespace = {
+        'KEYS': compiled.keys,
+        # keeps the scheme alive, so the ids in the fingerprint are not reused
+        'COMPILED': compiled,
+        '_Failure': _Failure,
+        '_is_empty': is_empty,
+        '_PARSE_ERRORS': _PARSE_ERRORS,
+        '_validator_message': _validator_message,
+        'InvalidParameterError': InvalidParameterError,
+        'InvalidSchemeError': InvalidSchemeError,
+        'NoneParameterError': NoneParameterError,
+        'NotAllowedParameterError': NotAllowedParameterError,
+    }
+
+    lines = [
+        "def validate(context, sanitize_schema=True):",
+        "    if sanitize_schema:",
+        "        for key in context.keys():",
+        "            if key not in KEYS:",
+        "                raise NotAllowedParameterError(f\"The parameter '{key}' is not allowed\")",
+    ]
+
+    if not compiled.fields:
+        lines.append("    return context")
+    else:
+        lines.append("    if context is None:")
+        lines.append("        context = {}")
+        lines.append("    get = context.get")
+
+        for index, field in enumerate(compiled.fields):
+            _Field(index, field, namespace).emit(lines)
+
+        items = ', '.join(f"N{index}: v{index}" for index in range(len(compiled.fields)))
+        lines.append(f"    return {{{items}}}")
+
+    source = '\n'.join(lines) + '\n'
+    exec(compile(source, f"<power_dict schema {id(compiled):x}>", 'exec'), namespace)
+
+    validate = namespace['validate']
+    validate.source = source
+    return validate
+
+
+class _Field:
+    def __init__(self, index: int, field, namespace: dict):
+        self.index = index
+        self.field = field
+        self.namespace = namespace
+        self.v = f"v{index}"
+
+        item = field.item
+        self.required = DictUtils.get_bool_dict_property(item, 'required', default_value=False)
+        self.default_value = DictUtils.get_dict_property(item, 'default_value')
+        self.required_error = DictUtils.get_str_dict_property(item, 'required_error', None)
+        self.format = DictUtils.get_str_dict_property(item, 'format', None)
+
+        namespace[f"N{index}"] = field.name
+        namespace[f"K{index}"] = field.key
+        namespace[f"A{index}"] = field.lookup
+
+    def const(self, prefix: str, value) -> str:
+        name = f"{prefix}{self.index}"
+        self.namespace[name] = value
+        return name
+
+    def emit_get(self, lines: list):
+        v = self.v
+        if self.field.aliases:
+            lines.extend([
+                f"    {v} = get(K{self.index})",
+                f"    if {v} is None:",
+                f"        {v} = A{self.index}(context)",
+            ])
+        else:
+            lines.append(f"    {v} = get(K{self.index})")
+
+    def emit(self, lines: list):
+        field = self.field
+        item_type = field.type
+
+        if item_type in _TYPE_PARSERS and (self.format is None or item_type in _FORMAT_TYPES):
+            self.emit_parse(lines)
+        elif item_type == "str" and self.format is None:
+            self.emit_str(lines)
+        else:
+            self.emit_generic(lines)
+
+        self.emit_validators(lines)
+
+    def emit_parse(self, lines: list):
+        v = self.v
+        item_type = self.field.type
+        parse, optional_noun, required_noun = _TYPE_PARSERS[item_type]
+        if item_type in _FORMAT_TYPES:
+            item_format = self.format
+            raw_parse = parse
+
+            def parse(value):
+                return raw_parse(value, format=item_format)
+
+        parse = self.const('P', parse)
+        exact = self.const('T', _TYPE_CLASSES.get(item_type))
+
+        if self.required:
+            none_error = self.const('RE', _none_failure(self.field.key, self.required_error).message)
+            error = self.const('E', f'Parameter "{self.field.key}" could not be converted to {required_noun}')
+            self.emit_get(lines)
+            lines.extend([
+                f"    if {v}.__class__ is not {exact}:",
+                f"        if {v} is None:",
+                f"            raise NoneParameterError({none_error})",
+                f"        try:",
+                f"            s, {v} = {parse}({v})",
+                f"        except _PARSE_ERRORS:",
+                f"            s = False",
+                f"        if not s:",
+                f"            raise InvalidParameterError({error})",
+            ])
+            return
+
+        error = self.const('E', f'Parameter "{self.field.key}" could not be converted to {optional_noun}')
+        default_status, default_result = _parse_default(self.namespace[parse], self.default_value)
+        self.emit_get(lines)
+        lines.extend([
+            f"    if {v}.__class__ is {exact}:",
+            f"        pass",
+            f"    elif {v} is None or _is_empty({v}):",
+        ])
+        if default_status:
+            lines.append(f"        {v} = {self.const('D', default_result)}")
+        else:
+            lines.append(f"        raise InvalidParameterError({error})")
+
+        lines.extend([
+            f"    else:",
+            f"        try:",
+            f"            s, {v} = {parse}({v})",
+            f"        except _PARSE_ERRORS:",
+            f"            s = False",
+            f"        if not s:",
+            f"            raise InvalidParameterError({error})",
+        ])
+
+    def emit_str(self, lines: list):
+        v = self.v
+
+        if self.required:
+            none_error = self.const('RE', _none_failure(self.field.key, self.required_error).message)
+            self.emit_get(lines)
+            lines.extend([
+                f"    if {v} is None:",
+                f"        raise NoneParameterError({none_error})",
+                f"    if {v}.__class__ is not str:",
+                f"        {v} = str({v})",
+                f"    if not {v}.strip():",
+                f"        raise NoneParameterError({none_error})",
+            ])
+            return
+
+        empty = self.const('D', str('' if self.default_value is None else self.default_value).strip())
+        self.emit_get(lines)
+        lines.extend([
+            f"    if {v}.__class__ is str:",
+            f"        {v} = {v}.strip() or {empty}",
+            f"    elif {v} is None or _is_empty({v}):",
+            f"        {v} = {empty}",
+            f"    else:",
+            f"        {v} = str({v}).strip()",
+        ])
+
+    def emit_generic(self, lines: list):
+        v = self.v
+        read = self.const('R', self.field.read)
+        transform_list = self.const('L', self.field.transform_list)
+        self.emit_get(lines)
+        lines.extend([
+            f"    {v} = {read}({v})",
+            f"    if {v}.__class__ is _Failure:",
+            f"        raise {v}.exception(N{self.index})",
+        ])
+
+        if self.field.type != "enum":
+            lines.extend([
+                f"    if isinstance({v}, list):",
+                f"        {v} = {transform_list}({v})",
+                f"        if {v}.__class__ is _Failure:",
+                f"            raise {v}.exception(N{self.index})",
+            ])
+
+    def emit_validators(self, lines: list):
+        if not self.field.validators:
+            return
+
+        v = self.v
+        if self.field.adaptive is not None:
+            check = self.const('C', self.field.check)
+            lines.extend([
+                f"    if {v} is not None:",
+                f"        f = {check}({v})",
+                f"        if f is not None:",
+                f"            raise f.exception(N{self.index})",
+            ])
+            return
+
+        lines.append(f"    if {v} is not None:")
+        for number, (f, message) in enumerate(self.field.validators):
+            f = self.const(f'V{number}_', f)
+            message = self.const(f'M{number}_', message)
+            lines.extend([
+                f"        if not {f}({v}):",
+                f"            raise InvalidSchemeError(_validator_message(N{self.index}, {message}, {v}))",
+            ])
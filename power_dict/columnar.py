@@ -0,0 +1,101 @@
+from datetime import date, datetime
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+VECTORIZED_TYPES = ("int", "float", "bool", "date", "datetime")
+
+
+def vectorize(data_type: str, values):
+    """
+    Convert the column 'values' to the type data_type in one pass: with NumPy for numeric arrays,
+    otherwise with one call of the built-in parser per cell.
+    None is returned if the column contains empty or invalid cells, the caller converts such columns cell by cell
+    :param data_type: int, float, bool, date or datetime
+    :param values: list or one-dimensional array
+    :return: list of converted values or None
+    """
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        if values.ndim != 1:
+            return None
+
+        if values.dtype.kind in 'iufb':
+            result = _NUMPY_CONVERTERS[data_type](values)
+            if result is not None:
+                return result
+
+        values = values.tolist()
+
+    try:
+        return list(map(_CONVERTERS[data_type], values))
+    except (ValueError, TypeError, KeyError, OverflowError):
+        return None
+
+
+def to_list(values) -> list:
+    """
+    Copy the values to a list. Numeric NumPy arrays are converted to Python numbers in one pass
+    :param values: iterable or one-dimensional array
+    :return: list
+    """
+    if numpy is not None and isinstance(values, numpy.ndarray) and values.ndim == 1 \
+            and values.dtype.kind in 'iufb':
+        return values.tolist()
+
+    return list(values)
+
+
+def _int_array(array):
+    if array.dtype.kind in 'iub':
+        return array.astype(numpy.int64).tolist() if array.dtype.kind == 'b' else array.tolist()
+
+    return None
+
+
+def _float_array(array):
+    return array.astype(numpy.float64).tolist()
+
+
+def _bool_array(array):
+    kind = array.dtype.kind
+    if kind == 'b':
+        return array.tolist()
+
+    if kind in 'iu':
+        true_mask = array == 1
+        if numpy.all(true_mask | (array == 0)):
+            return true_mask.tolist()
+
+    return None
+
+
+def _not_an_array(array):
+    return None
+
+
+def _parse_bool(value) -> bool:
+    return _BOOL_VALUES[str(value).lower()]
+
+
+_BOOL_VALUES = {
+    "yes": True, "true": True, "t": True, "1": True,
+    "no": False, "false": False, "f": False, "0": False,
+}
+
+_CONVERTERS = {
+    "int": int,
+    "float": float,
+    "bool": _parse_bool,
+    "date": date.fromisoformat,
+    "datetime": datetime.fromisoformat,
+}
+
+_NUMPY_CONVERTERS = {
+    "int": _int_array,
+    "float": _float_array,
+    "bool": _bool_array,
+    "date": _not_an_array,
+    "datetime": _not_an_array,
+}
@@ -0,0 +1,1235 @@
+import asyncio
+import inspect
+import json
+from collections import ChainMap, OrderedDict
+from collections.abc import Mapping
+from itertools import chain
+from operator import is_
+from threading import Lock
+from time import perf_counter
+
+from power_dict import instrumentation
+from power_dict.choices import Choices, get_choices, _MISSING
+from power_dict.columnar import vectorize, to_list, VECTORIZED_TYPES
+from power_dict.errors import InvalidParameterError, InvalidSchemeError, NoneParameterError, \
+    NotAllowedParameterError
+from power_dict.internal_validators import items_converter, enum_items_choices, resolve_validator, \
+    order_validators, validator_cost, sync_validator
+from power_dict.results import BatchResult, RecordError, FieldError, ValidationResult, LazyValidatedDict
+from power_dict.utils import DictUtils, is_empty, _TYPE_PARSERS, _PARSE_ERRORS
+
+_FORMAT_TYPES = ("datetime", "date")
+
+# the items of these types are converted to the same values from NumPy scalars and from Python numbers
+_NUMERIC_ITEM_TYPES = ("int", "float", "bool")
+
+# the required fields of these types are missing with a blank value too
+_BLANK_MISSING_TYPES = ("str", "enum")
+
+_VALIDATION_ERRORS = (InvalidParameterError, NoneParameterError, InvalidSchemeError, NotAllowedParameterError)
+
+# the adaptive validators of a field are reordered after this number of checks
+ADAPTIVE_EPOCH = 1000
+
+# the nested schemes prepared by convert_nested and convert_nested_items
+_NESTED_MAXSIZE = 128
+_nested = OrderedDict()
+_nested_lock = Lock()
+
+
+class CompiledSchema:
+    """
+    The scheme prepared once by SchemaValidator.compile for repeated validation
+    """
+
+    def __init__(self, schema: list, keys: set, key_policy=None):
+        self.schema = schema
+        self.keys = frozenset(keys)
+        self.key_policy = key_policy
+        self.fields = tuple(_FieldPlan(item, key_policy) for item in schema) if schema else ()
+        self.field_index = {field.name: field for field in self.fields}
+        self.aliased = any(field.aliases for field in self.fields)
+
+    def validate(self, context: dict, sanitize_schema: bool = True, collect_errors: bool = False,
+                 strip_unknown: bool = False, inplace: bool = False):
+        """
+        Validation and transformation of 'context' dictionary in accordance with the rules of the compiled scheme
+        :param context:
+        :param sanitize_schema:
+        :param collect_errors: return ValidationResult with the errors of all fields instead of raising the first one
+        :param strip_unknown: drop the unknown keys instead of raising NotAllowedParameterError
+        :param inplace: write the result to 'context' after all fields have been validated and return it
+        :return: dict or ValidationResult if collect_errors
+        """
+        if inplace:
+            return write_back(context, self.validate(context, sanitize_schema, collect_errors, strip_unknown))
+
+        if strip_unknown:
+            if not self.fields:
+                return ValidationResult({}, []) if collect_errors else {}
+
+            sanitize_schema = False
+
+        if collect_errors:
+            return self.__validate_collect(context, sanitize_schema)
+
+        if sanitize_schema:
+            keys = self.keys
+            for key in context.keys():
+                if key not in keys:
+                    raise NotAllowedParameterError(f"The parameter '{key}' is not allowed")
+
+        if not self.fields:
+            return context
+
+        if context is None:
+            context = {}
+
+        if instrumentation._collector is not None:
+            return self.__validate_instrumented(context, instrumentation._collector)
+
+        new_context = {}
+        if self.aliased:
+            for field in self.fields:
+                new_context[field.name] = field.transform(field.lookup(context))
+        else:
+            for field in self.fields:
+                new_context[field.name] = field.transform(context.get(field.key))
+
+        return new_context
+
+    def __validate_collect(self, context: dict, sanitize_schema: bool) -> ValidationResult:
+        new_context, failures = self._collect(context, sanitize_schema)
+        errors = [FieldError(path, failure.code, failure.message) for path, failure in failures]
+        return ValidationResult(new_context, errors)
+
+    def _collect(self, context: dict, sanitize_schema: bool) -> tuple:
+        """
+        Validation of all fields without raising
+        :return: new context, list of (path, _Failure)
+        """
+        failures = []
+
+        if sanitize_schema:
+            keys = self.keys
+            for key in context.keys():
+                if key not in keys:
+                    failures.append((key, _Failure(NotAllowedParameterError, FieldError.NOT_ALLOWED,
+                                                   f"The parameter '{key}' is not allowed")))
+
+        if not self.fields:
+            return ({} if failures else context), failures
+
+        if context is None:
+            context = {}
+
+        new_context = {}
+        for field in self.fields:
+            value = field.convert(field.lookup(context))
+
+            if value.__class__ is _Failure:
+                failures.extend(value.paths(field.name))
+                continue
+
+            if value is not None and field.validators:
+                failure = field.check(value)
+                if failure is not None:
+                    failures.append((field.name, failure))
+                    continue
+
+            new_context[field.name] = value
+
+        return new_context, failures
+
+    def __validate_instrumented(self, context: dict, collector) -> dict:
+        new_context = {}
+        for field in self.fields:
+            name = field.name
+            start = perf_counter()
+            try:
+                value = field.convert(field.lookup(context))
+            except Exception as e:
+                collector.on_failure(name, e)
+                raise
+
+            if value.__class__ is _Failure:
+                error = value.exception(name)
+                collector.on_failure(name, error)
+                raise error
+
+            collector.on_convert(name, field.type, perf_counter() - start)
+
+            if value is not None and field.validators:
+                start = perf_counter()
+                try:
+                    failure = field.check(value)
+                except Exception as e:
+                    collector.on_failure(name, e)
+                    raise
+
+                if failure is not None:
+                    error = failure.exception(name)
+                    collector.on_failure(name, error)
+                    raise error
+
+                collector.on_validate(name, perf_counter() - start)
+
+            new_context[name] = value
+
+        return new_context
+
+    def validate_lazy(self, context: dict, sanitize_schema: bool = True):
+        """
+        Check the keys and the presence of the required fields, the fields are converted and validated
+        the first time they are read
+        :param context:
+        :param sanitize_schema:
+        :return: LazyValidatedDict
+        """
+        if sanitize_schema:
+            keys = self.keys
+            for key in context.keys():
+                if key not in keys:
+                    raise NotAllowedParameterError(f"The parameter '{key}' is not allowed")
+
+        if not self.fields:
+            return context
+
+        if context is None:
+            context = {}
+
+        for field in self.fields:
+            if field.missing is not None and field.is_missing(field.lookup(context)):
+                raise field.missing.exception(field.name)
+
+        return LazyValidatedDict(self.field_index, context)
+
+    def validate_patch(self, previous: dict, patch: dict, sanitize_schema: bool = True) -> dict:
+        """
+        Validation of the partial update of the validated dictionary: only the fields of the patch are converted
+        and validated, the other fields keep their previous values. As in validate, the name of the field wins
+        over its alias, so an alias of the patch is ignored if the previous value is not None.
+        The raised error is the same as the error of validate of the merged dictionary
+        :param previous: result of validate
+        :param patch: changed keys with raw values
+        :param sanitize_schema:
+        :return: merged dict
+        """
+        if not self.fields:
+            return self.validate({**previous, **patch}, sanitize_schema)
+
+        if sanitize_schema:
+            keys = self.keys
+            for key in chain(previous.keys(), patch.keys()):
+                if key not in keys:
+                    raise NotAllowedParameterError(f"The parameter '{key}' is not allowed")
+
+        merged = ChainMap(patch, previous)
+        new_context = {}
+        for field in self.fields:
+            name = field.name
+            if field.key in patch or (field.aliases and not patch.keys().isdisjoint(field.aliases)):
+                if field.key not in patch and previous.get(field.key) is not None:
+                    new_context[name] = previous[field.key]
+                else:
+                    new_context[name] = field.transform(field.lookup(merged))
+            elif name in previous:
+                new_context[name] = previous[name]
+            else:
+                new_context[name] = field.transform(None)
+
+        return new_context
+
+    async def validate_async(self, context: dict, sanitize_schema: bool = True, concurrency: int = None) -> dict:
+        """
+        Validation and transformation of 'context' dictionary with awaitable user validators.
+        The validators of different fields run concurrently, the validators of one field run one after another.
+        The raised error is the same as the error of validate
+        :param context:
+        :param sanitize_schema:
+        :param concurrency: maximum number of awaited validators at once, unlimited if None
+        :return: dict
+        """
+        if concurrency is not None and concurrency < 1:
+            raise InvalidParameterError("The parameter 'concurrency' must be greater than 0")
+
+        if sanitize_schema:
+            keys = self.keys
+            for key in context.keys():
+                if key not in keys:
+                    raise NotAllowedParameterError(f"The parameter '{key}' is not allowed")
+
+        if not self.fields:
+            return context
+
+        if context is None:
+            context = {}
+
+        semaphore = None if concurrency is None else asyncio.Semaphore(concurrency)
+        new_context = {}
+        checks = []
+        names = []
+        error = None
+        for field in self.fields:
+            # the validators of the previous fields run before the error of this field is raised
+            try:
+                value = field.convert(field.lookup(context))
+            except Exception as e:
+                error = e
+                break
+
+            if value.__class__ is _Failure:
+                error = value.exception(field.name)
+                break
+
+            if value is not None and field.validators:
+                checks.append(field.check_async(value, semaphore))
+                names.append(field.name)
+
+            new_context[field.name] = value
+
+        if checks:
+            for name, failure in zip(names, await asyncio.gather(*checks, return_exceptions=True)):
+                if isinstance(failure, BaseException):
+                    raise failure
+
+                if failure is not None:
+                    raise failure.exception(name)
+
+        if error is not None:
+            raise error
+
+        return new_context
+
+    def validate_many(self, contexts, sanitize_schema: bool = True, stop_on_error: bool = False) -> BatchResult:
+        """
+        Validation and transformation of every context of the iterable 'contexts'
+        :param contexts: iterable of dictionaries
+        :param sanitize_schema:
+        :param stop_on_error: stop on the first invalid context, otherwise collect all errors
+        :return: BatchResult
+        """
+        validate = self.validate
+        data = []
+        indexes = []
+        errors = []
+        processed = 0
+
+        for index, context in enumerate(contexts):
+            processed += 1
+            try:
+                data.append(validate(context, sanitize_schema))
+            except _VALIDATION_ERRORS as e:
+                errors.append(RecordError(index, e))
+                if stop_on_error:
+                    break
+            else:
+                indexes.append(index)
+
+        return BatchResult(data, indexes, errors, processed)
+
+    def iter_validate(self, source, error_sink=None, sanitize_schema: bool = True):
+        """
+        Lazy validation and transformation of the stream of contexts.
+        'source' is a file object of JSON lines or any iterable of dictionaries; blank lines are skipped.
+        An invalid record is passed to error_sink(line_number, error) and the stream goes on,
+        without error_sink the error is raised
+        :param source: iterable of JSON lines or dictionaries
+        :param error_sink: callable(line_number: int, error: Exception)
+        :param sanitize_schema:
+        :return: generator of validated dictionaries
+        """
+        validate = self.validate
+
+        for line_number, record in enumerate(source, 1):
+            try:
+                if isinstance(record, (str, bytes)):
+                    if not record.strip():
+                        continue
+
+                    try:
+                        record = json.loads(record)
+                    except ValueError as e:
+                        raise InvalidParameterError(f"The line {line_number} is not a valid JSON: {e}")
+
+                if not isinstance(record, dict):
+                    raise InvalidParameterError(f"The line {line_number} is not a dictionary")
+
+                value = validate(record, sanitize_schema)
+            except _VALIDATION_ERRORS as e:
+                if error_sink is None:
+                    raise
+
+                error_sink(line_number, e)
+            else:
+                yield value
+
+    def validate_columns(self, columns: dict, sanitize_schema: bool = True) -> dict:
+        """
+        Validation and transformation of the columnar data: dictionary of field -> list of values.
+        int, float, bool, date and datetime columns are converted in one pass with NumPy if it is installed
+        :param columns: dict of lists or one-dimensional arrays of equal length
+        :param sanitize_schema:
+        :return: dict of lists
+        """
+        if sanitize_schema:
+            keys = self.keys
+            for key in columns.keys():
+                if key not in keys:
+                    raise NotAllowedParameterError(f"The parameter '{key}' is not allowed")
+
+        if not self.fields:
+            return columns
+
+        size = None
+        for key, values in columns.items():
+            if values is None:
+                continue
+
+            if size is None:
+                size = len(values)
+            elif len(values) != size:
+                raise InvalidParameterError(f"The column '{key}' has {len(values)} values, {size} expected")
+
+        if size is None:
+            size = 0
+
+        new_columns = {}
+        for field in self.fields:
+            values = field.lookup(columns)
+            if values is None:
+                values = [None] * size
+
+            new_columns[field.name] = field.transform_column(values)
+
+        return new_columns
+
+
+class _FieldPlan:
+    __slots__ = ('name', 'key', 'aliases', 'item', 'type', 'read', 'transform_list', 'validators', 'async_validators',
+                 'adaptive', 'vector_type', 'missing')
+
+    def __init__(self, item: dict, key_policy=None):
+        self.name = DictUtils.get_required_dict_property(item, 'name')
+        self.key = DictUtils.get_required_str_dict_property(item, 'name')
+        self.aliases = field_aliases(item, key_policy)
+        self.item = item
+
+        item_type = DictUtils.get_str_dict_property(item, 'type', 'str')
+        self.type = item_type
+        required = DictUtils.get_bool_dict_property(item, 'required', default_value=False)
+        default_value = DictUtils.get_dict_property(item, 'default_value')
+        required_error = DictUtils.get_str_dict_property(item, 'required_error', None)
+        item_format = DictUtils.get_str_dict_property(item, 'format', None)
+
+        # the failure of the required field without value
+        self.missing = _none_failure(self.key, required_error) if required else None
+
+        if item_type == "enum":
+            self.read = _enum_reader(item, self.key, required, default_value, required_error)
+        elif item_type == "dict":
+            self.read = _dict_reader(item, self.key, required, default_value, required_error)
+        elif item_format is not None and item_type not in _FORMAT_TYPES:
+            self.read = _unsupported_format_reader(self.key, item_type)
+        elif item_type in _TYPE_PARSERS:
+            if required:
+                self.read = _required_parse_reader(self.key, item_type, required_error, item_format)
+            else:
+                self.read = _parse_reader(self.key, item_type, default_value, item_format)
+        elif item_type == "str":
+            if required:
+                self.read = _required_str_reader(self.key, required_error)
+            else:
+                self.read = _str_reader(default_value)
+        elif item_type == "list":
+            copy = _list_copier(item)
+            if required:
+                self.read = _required_list_reader(self.key, required_error, copy)
+            else:
+                self.read = _list_reader(self.key, default_value, copy)
+        else:
+            if required:
+                self.read = _required_object_reader(self.key, required_error)
+            else:
+                self.read = _object_reader(default_value)
+
+        self.transform_list = _list_transformer(item, self.key, required)
+        # the coroutine function validators are awaited by validate_async and rejected by the sync validation
+        self.async_validators, costs = _compile_user_validators(item)
+        self.validators = tuple((sync_validator(f, self.name), message) for f, message in self.async_validators)
+
+        if len(self.validators) > 1 and DictUtils.get_bool_dict_property(item, 'adaptive_validators',
+                                                                          default_value=False):
+            self.adaptive = _AdaptiveValidators(self.validators, costs)
+        else:
+            self.adaptive = None
+
+        if item_type in VECTORIZED_TYPES and item_format is None:
+            self.vector_type = item_type
+        else:
+            self.vector_type = None
+
+    def lookup(self, context: dict):
+        """
+        The value of the field or of the first alias given
+        """
+        value = context.get(self.key)
+        if value is None:
+            for alias in self.aliases:
+                value = context.get(alias)
+                if value is not None:
+                    break
+
+        return value
+
+    def is_missing(self, value) -> bool:
+        """
+        The value of the required field is missing: None, or a blank string for str and enum as in their readers
+        """
+        if value is None:
+            return True
+
+        return self.type in _BLANK_MISSING_TYPES and not str(value).strip()
+
+    def transform(self, value):
+        value = self.convert(value)
+
+        if value.__class__ is _Failure:
+            raise value.exception(self.name)
+
+        if value is not None and self.validators:
+            failure = self.check(value)
+            if failure is not None:
+                raise failure.exception(self.name)
+
+        return value
+
+    def convert(self, value):
+        """
+        Read and convert the value, the error is returned as _Failure
+        """
+        value = self.read(value)
+
+        if isinstance(value, list):
+            return self.transform_list(value)
+
+        return value
+
+    def transform_column(self, values) -> list:
+        if self.vector_type is not None:
+            converted = vectorize(self.vector_type, values)
+            if converted is not None:
+                if self.validators:
+                    for value in converted:
+                        failure = self.check(value)
+                        if failure is not None:
+                            raise failure.exception(self.name)
+
+                return converted
+
+        transform = self.transform
+        return [transform(value) for value in values]
+
+    def check(self, value):
+        """
+        Run the user validators, the error is returned as _Failure
+        """
+        if self.adaptive is not None:
+            return self.adaptive.check(self.name, value)
+
+        for f, message in self.validators:
+            if not f(value):
+                return _Failure(InvalidSchemeError, FieldError.VALIDATOR, _validator_message(self.name, message, value))
+
+        return None
+
+    async def check_async(self, value, semaphore):
+        """
+        Run the user validators, an awaitable result is awaited. The error is returned as _Failure
+        """
+        for f, message in self.async_validators:
+            result = f(value)
+            if inspect.isawaitable(result):
+                if semaphore is None:
+                    result = await result
+                else:
+                    async with semaphore:
+                        result = await result
+
+            if not result:
+                return _Failure(InvalidSchemeError, FieldError.VALIDATOR, _validator_message(self.name, message, value))
+
+        return None
+
+
+class _AdaptiveValidators:
+    """
+    User validators of the field reordered by the observed rejections: every ADAPTIVE_EPOCH checks
+    the validators are sorted by the rejection rate per unit of cost, ties keep the cost order.
+    The order only speeds up the rejection: the reported error is always the first failure in the cost order
+    """
+    __slots__ = ('checks', 'costs', 'order', 'calls', 'rejections', 'count', 'lock')
+
+    def __init__(self, checks: tuple, costs: tuple):
+        self.checks = checks
+        self.costs = costs
+        self.order = tuple(enumerate(checks))
+        self.calls = [0] * len(checks)
+        self.rejections = [0] * len(checks)
+        self.count = 0
+        self.lock = Lock()
+
+    def check(self, name, value):
+        """
+        Run the validators in the current order, the error is returned as _Failure.
+        After a failure the validators skipped before it in the cost order are run,
+        so the error doesn't depend on the current order
+        """
+        calls = self.calls
+        order = self.order
+        failure = None
+        for position, (index, (f, message)) in enumerate(order):
+            calls[index] += 1
+            if not f(value):
+                self.rejections[index] += 1
+                failed = index
+                passed = {earlier for earlier, _ in order[:position]}
+                for earlier in range(index):
+                    if earlier not in passed:
+                        calls[earlier] += 1
+                        if not self.checks[earlier][0](value):
+                            self.rejections[earlier] += 1
+                            failed = earlier
+                            break
+
+                message = self.checks[failed][1]
+                failure = _Failure(InvalidSchemeError, FieldError.VALIDATOR, _validator_message(name, message, value))
+                break
+
+        self.count += 1
+        if self.count >= ADAPTIVE_EPOCH:
+            self.reorder()
+
+        return failure
+
+    def reorder(self):
+        """
+        Sort the validators by the rejection rate per unit of cost and halve the counters,
+        so the recent checks weigh more
+        """
+        with self.lock:
+            if self.count < ADAPTIVE_EPOCH:
+                return
+
+            calls, rejections, costs = self.calls, self.rejections, self.costs
+
+            def rank(index):
+                score = rejections[index] / calls[index] / costs[index] if calls[index] else 0.0
+                return -score, index
+
+            self.order = tuple((index, self.checks[index]) for index in sorted(range(len(self.checks)), key=rank))
+            self.calls = [count // 2 for count in calls]
+            self.rejections = [count // 2 for count in rejections]
+            self.count = 0
+
+
+class _Failure:
+    """
+    The error of the field returned instead of raised.
+    The failure of a nested scheme holds the failures of the nested fields as (relative path, _Failure)
+    """
+    __slots__ = ('error', 'code', 'message', 'nested')
+
+    def __init__(self, error, code: str, message: str, nested: list = None):
+        self.error = error
+        self.code = code
+        self.message = message
+        self.nested = nested
+
+    def exception(self, field: str) -> Exception:
+        if self.nested is None:
+            return self.error(self.message)
+
+        path, failure = self.nested[0]
+        return failure.error(f"{field}{path}: {failure.message}")
+
+    def paths(self, field: str) -> list:
+        if self.nested is None:
+            return [(field, self)]
+
+        return [(field + path, failure) for path, failure in self.nested]
+
+
+def _nested_failure(nested: list) -> _Failure:
+    path, failure = nested[0]
+    return _Failure(failure.error, failure.code, failure.message, nested)
+
+
+def _validator_message(name, message, value) -> str:
+    if message is None:
+        return f"The parameter '{name} does not match the specified condition"
+
+    if '#VALUE#' in message and not DictUtils.str_is_null_or_empty(value):
+        return message.replace('#VALUE#', str(value))
+
+    return message
+
+
+def _none_failure(key, required_error) -> _Failure:
+    # the message of DictUtils.raise_none_parameter_error
+    message = required_error if required_error is not None else f'Parameter "{key}" is none'
+    return _Failure(NoneParameterError, FieldError.REQUIRED, message)
+
+
+def _choice_failure(value, choices: Choices) -> _Failure:
+    return _Failure(InvalidSchemeError, FieldError.CHOICE, choices.error_message(value))
+
+
+def _parse_reader(key, item_type, default_value, item_format):
+    parse, noun, _ = _TYPE_PARSERS[item_type]
+    if item_type in _FORMAT_TYPES:
+        parse = _bind_format(parse, item_format)
+
+    default_status, default_result = _parse_default(parse, default_value)
+    failure = _Failure(InvalidParameterError, FieldError.INVALID, f'Parameter "{key}" could not be converted to {noun}')
+
+    def read(value):
+        if value is None or is_empty(value):
+            status, result = default_status, default_result
+        else:
+            try:
+                status, result = parse(value)
+            except _PARSE_ERRORS:
+                return failure
+
+        return result if status else failure
+
+    return read
+
+
+def _parse_default(parse, default_value) -> tuple:
+    # a default value the parser rejects, e.g. a list, fails only when it is used, like in the getters of DictUtils
+    try:
+        return parse(default_value)
+    except _PARSE_ERRORS:
+        return False, None
+
+
+def _required_parse_reader(key, item_type, required_error, item_format):
+    parse, _, noun = _TYPE_PARSERS[item_type]
+    if item_type in _FORMAT_TYPES:
+        parse = _bind_format(parse, item_format)
+
+    none_failure = _none_failure(key, required_error)
+    failure = _Failure(InvalidParameterError, FieldError.INVALID, f'Parameter "{key}" could not be converted to {noun}')
+
+    def read(value):
+        if value is None:
+            return none_failure
+
+        try:
+            status, result = parse(value)
+        except _PARSE_ERRORS:
+            return failure
+
+        return result if status else failure
+
+    return read
+
+
+def _bind_format(parse, item_format):
+    def parse_with_format(value):
+        return parse(value, format=item_format)
+
+    return parse_with_format
+
+
+def _str_reader(default_value):
+    empty_result = str('' if default_value is None else default_value).strip()
+
+    def read(value):
+        if value is None or is_empty(value):
+            return empty_result
+
+        return str(value).strip()
+
+    return read
+
+
+def _required_str_reader(key, required_error):
+    none_failure = _none_failure(key, required_error)
+
+    def read(value):
+        if value is None:
+            return none_failure
+
+        value = str(value)
+        if not value.strip():
+            return none_failure
+
+        return value
+
+    return read
+
+
+def _list_reader(key, default_value, copy):
+    failure = _list_failure(key)
+
+    def read(value):
+        if value is None:
+            return default_value
+
+        try:
+            return copy(value)
+        except TypeError:
+            return failure
+
+    return read
+
+
+def _required_list_reader(key, required_error, copy):
+    none_failure = _none_failure(key, required_error)
+    failure = _list_failure(key)
+
+    def read(value):
+        if value is None:
+            return none_failure
+
+        try:
+            return copy(value)
+        except TypeError:
+            return failure
+
+    return read
+
+
+def _list_failure(key) -> _Failure:
+    return _Failure(InvalidParameterError, FieldError.INVALID, f'Parameter "{key}" could not be converted to a list')
+
+
+def _list_copier(item: dict):
+    items = DictUtils.get_dict_property(item, 'items')
+    if items is None:
+        if DictUtils.get_bool_dict_property(item, 'copy', default_value=True):
+            return list
+
+        def keep(value):
+            return value if value.__class__ is list else list(value)
+
+        return keep
+
+    # the items converter builds a new list, so the list itself is not copied
+    if DictUtils.get_str_dict_property(items, 'type', 'str') in _NUMERIC_ITEM_TYPES:
+        def copy(value):
+            return value if value.__class__ is list else to_list(value)
+    else:
+        def copy(value):
+            return value if value.__class__ is list else list(value)
+
+    return copy
+
+
+def _object_reader(default_value):
+    def read(value):
+        if value is None:
+            return default_value
+
+        return value
+
+    return read
+
+
+def _required_object_reader(key, required_error):
+    none_failure = _none_failure(key, required_error)
+
+    def read(value):
+        if value is None:
+            return none_failure
+
+        return value
+
+    return read
+
+
+def _enum_reader(item, key, required, default_value, required_error):
+    choices = get_choices(item, required_error)
+    resolve = choices.resolve
+    none_failure = _none_failure(key, required_error)
+
+    def read(value):
+        if required:
+            if value is None:
+                return none_failure
+
+            str_value = str(value)
+            if not str_value.strip():
+                return none_failure
+        elif value is None or is_empty(value):
+            str_value = None if default_value is None else str(default_value).strip()
+        else:
+            str_value = str(value).strip()
+
+        if str_value is None:
+            return None
+
+        choice = resolve(str_value, _MISSING)
+        if choice is _MISSING:
+            return _choice_failure(str_value, choices)
+
+        return choice
+
+    return read
+
+
+def _unsupported_format_reader(key, item_type):
+    # only date and datetime are parsed with a format
+    failure = _Failure(InvalidSchemeError, FieldError.SCHEMA, unsupported_format_message(key, item_type))
+
+    def read(value):
+        return failure
+
+    return read
+
+
+def unsupported_format_message(key, item_type) -> str:
+    """
+    The error of the field with 'format' of a type other than date and datetime
+    :param key: name of the field
+    :param item_type: type of the field
+    :return: message
+    """
+    return f"The parameter '{key}' of type '{item_type}' doesn't support 'format'"
+
+
+def _list_transformer(item: dict, key: str, required: bool):
+    # items_list, unique_list and empty_list with the rules of the field read once
+    empty = DictUtils.get_bool_dict_property(item, 'empty', default_value=True)
+    unique = DictUtils.get_bool_dict_property(item, 'unique', default_value=False)
+    copy = DictUtils.get_bool_dict_property(item, 'copy', default_value=True)
+    convert_items = _items_converter(DictUtils.get_dict_property(item, 'items'), key, copy)
+
+    conflict = _Failure(InvalidSchemeError, FieldError.SCHEMA,
+                        "A schema conflict. The combination of properties required=False and empty=False "
+                        "is not allowed.")
+    empty_failure = _Failure(InvalidSchemeError, FieldError.EMPTY, "The list can't be empty.")
+
+    def transform(value: list):
+        if convert_items is not None:
+            value = convert_items(value)
+            if value.__class__ is _Failure:
+                return value
+
+        if unique:
+            value = list(set(value))
+
+        if not empty:
+            if not required:
+                return conflict
+
+            if len(value) == 0:
+                return empty_failure
+
+        return value
+
+    return transform
+
+
+def _items_converter(items, key: str, copy: bool = True):
+    if items is None:
+        return None
+
+    item_type = DictUtils.get_str_dict_property(items, 'type', 'str')
+
+    if item_type == "dict":
+        nested, sanitize_schema = _compile_nested(items)
+        failure = _Failure(InvalidParameterError, FieldError.INVALID, "The item could not be converted to a dict")
+
+        def convert_dicts(value: list):
+            new_value = []
+            failures = []
+            for index, element in enumerate(value):
+                element = _validate_nested(nested, sanitize_schema, element, f"[{index}]", failure)
+                if element.__class__ is _Failure:
+                    failures.extend(element.paths(""))
+                else:
+                    new_value.append(element)
+
+            if failures:
+                return _nested_failure(failures)
+
+            return new_value
+
+        return convert_dicts
+
+    if item_type == "enum":
+        choices = enum_items_choices(items)
+
+        def convert_enum(value: list):
+            result, invalid = choices.resolve_all(value, copy)
+            if invalid is not None:
+                return _choice_failure(invalid, choices)
+
+            return result
+
+        return convert_enum
+
+    return items_converter(items, copy)
+
+
+def _dict_reader(item, key, required, default_value, required_error):
+    nested, sanitize_schema = _compile_nested(item)
+    none_failure = _none_failure(key, required_error)
+    failure = _Failure(InvalidParameterError, FieldError.INVALID, f'Parameter "{key}" could not be converted to a dict')
+
+    def read(value):
+        if value is None:
+            if required:
+                return none_failure
+
+            if default_value is None:
+                return None
+
+            value = default_value
+
+        return _validate_nested(nested, sanitize_schema, value, "", failure)
+
+    return read
+
+
+def _compile_nested(item: dict) -> tuple:
+    schema = DictUtils.get_required_list_dict_property(item, 'schema')
+    sanitize_schema = DictUtils.get_bool_dict_property(item, 'sanitize_schema', default_value=True)
+    return CompiledSchema(schema, schema_keys(schema)), sanitize_schema
+
+
+def _validate_nested(nested: CompiledSchema, sanitize_schema: bool, value, path: str, failure: _Failure):
+    # path is relative to the field: '' for a dict field, '[index]' for an item of a list
+    if not isinstance(value, Mapping):
+        return _nested_failure([(path, failure)]) if path else failure
+
+    new_value, failures = nested._collect(value, sanitize_schema)
+    if failures:
+        return _nested_failure([(f"{path}.{nested_path}", f) for nested_path, f in failures])
+
+    return new_value
+
+
+def schema_keys(schema: list, key_policy=None) -> set:
+    """
+    Names and aliases of the fields of the scheme
+    :param schema:
+    :param key_policy: accepted key styles, see field_aliases
+    :return: set of keys
+    """
+    keys = set()
+
+    if schema is None or len(schema) == 0:
+        return keys
+
+    for item in schema:
+        name = DictUtils.get_required_dict_property(item, 'name')
+        if name in keys:
+            raise InvalidSchemeError(f"The parameter '{name}' is repeated")
+
+        keys.add(name)
+
+    for item in schema:
+        for alias in field_aliases(item, key_policy):
+            if alias in keys:
+                raise InvalidSchemeError(f"The parameter '{alias}' is repeated")
+
+            keys.add(alias)
+
+    return keys
+
+
+def field_aliases(item: dict, key_policy=None) -> tuple:
+    """
+    Aliases of the field: the 'aliases' list of the field and the names of the key policy.
+    The key policy is 'camel', 'pascal', 'kebab', callable(name) -> alias or list of aliases,
+    or a tuple or a list of them
+    :param item: field of the scheme
+    :param key_policy:
+    :return: tuple of aliases
+    """
+    name = DictUtils.get_required_dict_property(item, 'name')
+    aliases = DictUtils.get_dict_property(item, 'aliases')
+    aliases = [aliases] if isinstance(aliases, str) else list(aliases or ())
+
+    if key_policy is not None and isinstance(name, str):
+        policies = key_policy if isinstance(key_policy, (tuple, list)) else (key_policy,)
+        for policy in policies:
+            if not callable(policy):
+                if policy not in _KEY_POLICIES:
+                    raise InvalidSchemeError(f"Unknown key policy '{policy}'")
+
+                policy = _KEY_POLICIES[policy]
+
+            alias = policy(name)
+            aliases.extend([alias] if isinstance(alias, str) else alias)
+
+    result = []
+    for alias in aliases:
+        if alias != name and alias not in result:
+            result.append(alias)
+
+    return tuple(result)
+
+
+def _camel_case(name: str) -> str:
+    first, *rest = name.split('_')
+    return first + ''.join(part[:1].upper() + part[1:] for part in rest)
+
+
+def _pascal_case(name: str) -> str:
+    return ''.join(part[:1].upper() + part[1:] for part in name.split('_'))
+
+
+def _kebab_case(name: str) -> str:
+    return name.replace('_', '-')
+
+
+_KEY_POLICIES = {
+    'camel': _camel_case,
+    'pascal': _pascal_case,
+    'kebab': _kebab_case,
+}
+
+
+def write_back(context: dict, result):
+    """
+    Make 'context' the same as the result of the validation: the values are replaced, the keys missing
+    in the result are removed. An invalid ValidationResult doesn't change 'context'
+    :param context: validated dictionary
+    :param result: dict or ValidationResult
+    :return: context or ValidationResult with context as data
+    """
+    if result.__class__ is ValidationResult:
+        if result.is_valid:
+            result.data = write_back(context, result.data)
+
+        return result
+
+    if context is None or result is context:
+        return result
+
+    for key in [key for key in context if key not in result]:
+        del context[key]
+
+    context.update(result)
+    return context
+
+
+def convert_nested(item: dict, value) -> dict:
+    """
+    Conversion of the value of the 'dict' field with a nested scheme. The nested scheme is prepared once
+    per field dictionary. The first error is raised with the path of the nested field, e.g. 'address.city'
+    :param item: field of the scheme
+    :param value: raw value
+    :return: converted value
+    """
+    field = _prepared_nested(item, _FieldPlan)
+    value = field.read(value)
+    if value.__class__ is _Failure:
+        raise value.exception(field.name)
+
+    return value
+
+
+def convert_nested_items(item: dict, value: list) -> list:
+    """
+    Conversion of the list items with a nested scheme: 'items': {'type': 'dict', 'schema': [...]}.
+    The nested scheme is prepared once per field dictionary. The first error is raised with the path
+    of the nested field, e.g. 'orders[17].price'
+    :param item: field of the scheme
+    :param value: list of raw items
+    :return: list of converted items
+    """
+    name = DictUtils.get_dict_property(item, 'name', '')
+    value = _prepared_nested(item, _nested_items_converter)(value)
+    if value.__class__ is _Failure:
+        raise value.exception(name)
+
+    return value
+
+
+def _nested_items_converter(item: dict):
+    return _items_converter(DictUtils.get_dict_property(item, 'items'), DictUtils.get_dict_property(item, 'name', ''))
+
+
+def _prepared_nested(item: dict, prepare):
+    # the converter of the field with a nested scheme is prepared once per field dictionary
+    # and prepared again if a value of the field or of the nested scheme is replaced
+    key = (id(item), prepare)
+    version = _nested_version(item)
+
+    with _nested_lock:
+        entry = _nested.get(key)
+        if entry is not None and _same_version(entry[1], version):
+            _nested.move_to_end(key)
+            return entry[2]
+
+    converter = prepare(item)
+
+    with _nested_lock:
+        # the entry keeps the field alive, so its id is not reused
+        _nested[key] = (item, version, converter)
+        if len(_nested) > _NESTED_MAXSIZE:
+            _nested.popitem(last=False)
+
+    return converter
+
+
+def clear_nested():
+    """
+    Drop the nested schemes prepared by convert_nested and convert_nested_items
+    :return:
+    """
+    with _nested_lock:
+        _nested.clear()
+
+
+def _nested_version(value) -> list:
+    # the values of the dictionaries and the dictionaries in the lists, e.g. the fields of 'schema'. The entry
+    # keeps them alive, so a replaced value is never mistaken for the old one with a reused id
+    version = []
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        for item in value.values():
+            version.append(item)
+            if item.__class__ is dict:
+                stack.append(item)
+            elif item.__class__ is list and item and item[0].__class__ is dict:
+                for element in item:
+                    if element.__class__ is dict:
+                        version.append(element)
+                        stack.append(element)
+
+    return version
+
+
+def _same_version(version: list, other: list) -> bool:
+    return len(version) == len(other) and all(map(is_, version, other))
+
+
+def _compile_user_validators(item: dict) -> tuple:
+    validators = DictUtils.get_list_dict_property(item, 'validators')
+    if not validators:
+        return (), ()
+
+    checks = []
+    costs = []
+    for validator in order_validators(validators):
+        cost = validator_cost(validator)
+        message = None
+        validator = resolve_validator(validator)
+        if not callable(validator):
+            message = DictUtils.get_str_dict_property(validator, 'message')
+            validator = resolve_validator(DictUtils.get_required_dict_property(validator, 'f'))
+
+        if callable(validator):
+            checks.append((validator, message))
+            costs.append(cost)
+
+    return tuple(checks), tuple(costs)
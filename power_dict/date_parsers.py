@@ -0,0 +1,212 @@
+import re
+from datetime import date, datetime
+from functools import lru_cache
+
+from try_parse.utils import ParseUtils
+
+from power_dict import instrumentation
+
+# strptime gives the same result as fromisoformat for strings of the exact ISO shape
+_ISO_FORMATS = {
+    '%Y-%m-%d': re.compile(r'\d{4}-\d{2}-\d{2}', re.ASCII),
+    '%Y-%m-%d %H:%M:%S': re.compile(r'\d{4}-\d{2}-\d{2} ([01]\d|2[0-3]):\d{2}:\d{2}', re.ASCII),
+    '%Y-%m-%dT%H:%M:%S': re.compile(r'\d{4}-\d{2}-\d{2}T([01]\d|2[0-3]):\d{2}:\d{2}', re.ASCII),
+}
+
+# directive -> (position of the datetime argument, width)
+_FIXED_WIDTH_DIRECTIVES = {'Y': (0, 4), 'm': (1, 2), 'd': (2, 2), 'H': (3, 2), 'M': (4, 2), 'S': (5, 2)}
+
+# strptime defaults of the year, month, day, hour, minute and second
+_STRPTIME_DEFAULTS = (1900, 1, 1, 0, 0, 0)
+
+_cached_parse = None
+
+
+def try_parse_date(i, format: str = None) -> (bool, date):
+    """
+    Parse object to date. The same as ParseUtils.try_parse_date, but ISO strings are parsed with fromisoformat
+    and the results are cached if ParseCache is enabled
+    :param i: object
+    :param format: date format
+    :return: status, date object
+    """
+    if i is None:
+        return True, i
+
+    cls = i.__class__
+    if cls is date:
+        return True, i
+
+    if cls is str:
+        if _cached_parse is None:
+            return _parse_str(date, i, format)
+
+        if instrumentation._collector is None:
+            return _cached_parse(date, i, format)
+
+        return instrumentation.measure_cache('date_parse', _cached_parse, date, i, format)
+
+    return ParseUtils.try_parse_date(i, format=format)
+
+
+def try_parse_datetime(i, format: str = None) -> (bool, datetime):
+    """
+    Parse object to datetime. The same as ParseUtils.try_parse_datetime, but ISO strings are parsed
+    with fromisoformat and the results are cached if ParseCache is enabled
+    :param i: object
+    :param format: datetime format
+    :return: status, datetime object
+    """
+    if i is None:
+        return True, i
+
+    cls = i.__class__
+    if cls is datetime:
+        return True, i
+
+    if cls is str:
+        if _cached_parse is None:
+            return _parse_str(datetime, i, format)
+
+        if instrumentation._collector is None:
+            return _cached_parse(datetime, i, format)
+
+        return instrumentation.measure_cache('date_parse', _cached_parse, datetime, i, format)
+
+    return ParseUtils.try_parse_datetime(i, format=format)
+
+
+@lru_cache(maxsize=256)
+def compile_format(format: str):
+    """
+    Build the parser of the datetime format once.
+    Strings of the exact shape of a fixed-width format made of %Y, %m, %d, %H, %M, %S and literals
+    are parsed by slicing, other strings and formats are parsed by strptime with the same result
+    :param format: datetime format
+    :return: callable(str) -> datetime, raises ValueError
+    """
+    iso_format = _ISO_FORMATS.get(format)
+    if iso_format is not None:
+        def parse_iso(value: str) -> datetime:
+            if iso_format.fullmatch(value):
+                return datetime.fromisoformat(value)
+
+            return datetime.strptime(value, format)
+
+        return parse_iso
+
+    fields = _parse_fixed_width_format(format)
+    if fields is None:
+        def parse_strptime(value: str) -> datetime:
+            return datetime.strptime(value, format)
+
+        return parse_strptime
+
+    pattern, positions = fields
+
+    def parse_fixed_width(value: str) -> datetime:
+        match = pattern.fullmatch(value)
+        if match is None:
+            return datetime.strptime(value, format)
+
+        args = list(_STRPTIME_DEFAULTS)
+        for position, text in zip(positions, match.groups()):
+            args[position] = int(text)
+
+        return datetime(*args)
+
+    return parse_fixed_width
+
+
+def _parse_fixed_width_format(format: str):
+    regex = []
+    positions = []
+    i = 0
+    while i < len(format):
+        char = format[i]
+        if char != '%':
+            regex.append(re.escape(char))
+            i += 1
+            continue
+
+        directive = _FIXED_WIDTH_DIRECTIVES.get(format[i + 1:i + 2])
+        if directive is None:
+            return None
+
+        position, width = directive
+        if position in positions:
+            return None
+
+        regex.append(f'(\\d{{{width}}})')
+        positions.append(position)
+        i += 2
+
+    if not positions:
+        return None
+
+    return re.compile(''.join(regex), re.ASCII), tuple(positions)
+
+
+def _parse_str(target, value: str, format: str):
+    try:
+        if format is None:
+            return True, target.fromisoformat(value)
+
+        result = compile_format(format)(value)
+        return True, result.date() if target is date else result
+    except ValueError:
+        return False, None
+
+
+class ParseCache:
+    """
+    Opt-in bounded LRU cache of date and datetime parse results keyed by (string, format)
+    """
+
+    @staticmethod
+    def enable(maxsize: int = 4096):
+        """
+        Enable the cache. The previous cache is dropped
+        :param maxsize: maximum number of cached results
+        :return:
+        """
+        global _cached_parse
+        _cached_parse = lru_cache(maxsize=maxsize)(_parse_str)
+
+    @staticmethod
+    def disable():
+        """
+        Disable and drop the cache
+        :return:
+        """
+        global _cached_parse
+        _cached_parse = None
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """
+        The cache is enabled?
+        :return: status
+        """
+        return _cached_parse is not None
+
+    @staticmethod
+    def clear():
+        """
+        Drop the cached results and reset the counters
+        :return:
+        """
+        if _cached_parse is not None:
+            _cached_parse.cache_clear()
+
+    @staticmethod
+    def info() -> dict:
+        """
+        Cache counters
+        :return: dict with hits, misses, maxsize and currsize
+        """
+        if _cached_parse is None:
+            return {'hits': 0, 'misses': 0, 'maxsize': 0, 'currsize': 0}
+
+        info = _cached_parse.cache_info()
+        return {'hits': info.hits, 'misses': info.misses, 'maxsize': info.maxsize, 'currsize': info.currsize}
@@ -0,0 +1,157 @@
+from time import perf_counter
+
+_collector = None
+
+
+class Collector:
+    """
+    Receiver of the instrumentation events. Override the methods you need and install it with Instrumentation.install
+    """
+
+    def on_convert(self, field: str, data_type: str, elapsed: float):
+        """
+        The value of the field has been read and converted
+        :param field: field name or dictionary key
+        :param data_type: data type of the field
+        :param elapsed: time in seconds
+        :return:
+        """
+
+    def on_validate(self, field: str, elapsed: float):
+        """
+        The user validators of the field have been run
+        :param field: field name
+        :param elapsed: time in seconds
+        :return:
+        """
+
+    def on_failure(self, field: str, error: Exception):
+        """
+        The conversion or validation of the field has failed
+        :param field: field name or dictionary key
+        :param error: raised exception
+        :return:
+        """
+
+    def on_cache(self, cache: str, hit: bool):
+        """
+        Lookup in the cache
+        :param cache: cache name
+        :param hit: the value has been found in the cache
+        :return:
+        """
+
+
+class StatsCollector(Collector):
+    """
+    Collector aggregating the events in memory: counts and total times per field, failures by exception type
+    and cache hits
+    """
+
+    def __init__(self):
+        self.conversions = {}
+        self.validations = {}
+        self.failures = {}
+        self.caches = {}
+
+    def on_convert(self, field: str, data_type: str, elapsed: float):
+        StatsCollector.__add_time(self.conversions, field, elapsed)
+
+    def on_validate(self, field: str, elapsed: float):
+        StatsCollector.__add_time(self.validations, field, elapsed)
+
+    def on_failure(self, field: str, error: Exception):
+        key = (field, type(error).__name__)
+        self.failures[key] = self.failures.get(key, 0) + 1
+
+    def on_cache(self, cache: str, hit: bool):
+        stats = self.caches.get(cache)
+        if stats is None:
+            stats = self.caches[cache] = {'hits': 0, 'misses': 0}
+
+        stats['hits' if hit else 'misses'] += 1
+
+    def snapshot(self) -> dict:
+        """
+        Copy of the collected statistics
+        :return: dict with conversions, validations, failures and caches
+        """
+        return {
+            'conversions': {field: dict(stats) for field, stats in self.conversions.items()},
+            'validations': {field: dict(stats) for field, stats in self.validations.items()},
+            'failures': dict(self.failures),
+            'caches': {cache: dict(stats) for cache, stats in self.caches.items()},
+        }
+
+    def reset(self):
+        """
+        Drop the collected statistics
+        :return:
+        """
+        self.conversions = {}
+        self.validations = {}
+        self.failures = {}
+        self.caches = {}
+
+    @staticmethod
+    def __add_time(target: dict, field: str, elapsed: float):
+        stats = target.get(field)
+        if stats is None:
+            target[field] = {'count': 1, 'total': elapsed}
+        else:
+            stats['count'] += 1
+            stats['total'] += elapsed
+
+
+class Instrumentation:
+    """
+    Opt-in instrumentation of SchemaValidator and DictUtils.get_value.
+    Without an installed collector the instrumented code only checks that the collector is None
+    """
+
+    @staticmethod
+    def install(collector: Collector):
+        """
+        Install the collector instead of the previous one
+        :param collector: Collector
+        :return:
+        """
+        global _collector
+        _collector = collector
+
+    @staticmethod
+    def uninstall():
+        """
+        Remove the installed collector
+        :return:
+        """
+        global _collector
+        _collector = None
+
+    @staticmethod
+    def get_collector() -> Collector:
+        """
+        Installed collector
+        :return: Collector or None
+        """
+        return _collector
+
+
+def measure_value(func, properties, key, data_type, kwargs):
+    collector = _collector
+    start = perf_counter()
+    try:
+        value = func(properties, key, **kwargs)
+    except Exception as e:
+        collector.on_failure(key, e)
+        raise
+
+    collector.on_convert(key, data_type, perf_counter() - start)
+    return value
+
+
+def measure_cache(cache: str, cached_func, *args):
+    before = cached_func.cache_info().hits
+    value = cached_func(*args)
+    _collector.on_cache(cache, cached_func.cache_info().hits != before)
+    return value
@@ -1,7 +1,12 @@
-from try_parse.utils import ParseUtils
+import importlib
+import inspect
+from functools import lru_cache, reduce
+from operator import itemgetter
 
+from power_dict.choices import Choices, cached_choices
+from power_dict.columnar import vectorize, VECTORIZED_TYPES
 from power_dict.errors import InvalidSchemeError
-from power_dict.utils import DictUtils
+from power_dict.utils import DictUtils, _TYPE_PARSERS, _TYPE_CLASSES, _PARSE_ERRORS
 
 
 def empty_list(item_schema: dict, value):
@@ -33,37 +38,199 @@ def items_list(item_schema: dict, value):
     if isinstance(value, list):
         items = DictUtils.get_dict_property(item_schema, 'items')
 
-        def __convert(item):
-            item_type = DictUtils.get_str_dict_property(items, 'type', 'str')
-            def __convert_enum(str_value):
-                choices = DictUtils.get_required_list_dict_property(items, 'choices', 'str')
-                if str_value is not None and str_value not in choices:
-                    raise InvalidSchemeError(
-                        f"The value '{str_value}' is not available for selection. Possible options: {choices}")
+        if items is not None and DictUtils.get_str_dict_property(items, 'type', 'str') == "dict":
+            # compiled_schema imports this module
+            from power_dict.compiled_schema import convert_nested_items
+            return convert_nested_items(item_schema, value)
 
-                return True, str_value
+        if items is not None:
+            copy = DictUtils.get_bool_dict_property(item_schema, 'copy', default_value=True)
+            if len(value) == 0:
+                return [] if copy else value
 
-            map_func = {
-                "enum": __convert_enum,
-                "str": lambda x: (True, str(x)),
-                "int": ParseUtils.try_parse_int,
-                "datetime": ParseUtils.try_parse_datetime,
-                "date": ParseUtils.try_parse_date,
-                "bool": ParseUtils.try_parse_bool,
-                "decimal": ParseUtils.try_parse_decimal,
-                "float": ParseUtils.try_parse_float
-            }
+            return items_converter(items, copy)(value)
 
-            if item_type not in map_func:
-                return item
+    return value
 
-            func = map_func[item_type]
-            success, __value = func(item)
-            return __value if success else None
 
+def items_converter(items: dict, copy: bool = True):
+    """
+    Prepare the conversion of the list items once: the parser of the items type and the choices of enum.
+    Items that could not be parsed are converted to None
+    :param items: 'items' rule of the list field
+    :param copy: build a new list, otherwise the list itself is returned if no item has to be converted
+    :return: callable(list) -> list
+    """
+    item_type = DictUtils.get_str_dict_property(items, 'type', 'str')
 
-        if items is not None:
-            new_value = list(list(map(__convert, value)))
-            return new_value
+    if item_type == "enum":
+        choices = enum_items_choices(items)
 
-    return value
+        def convert_enum(value) -> list:
+            result, invalid = choices.resolve_all(value, copy)
+            if invalid is not None:
+                raise InvalidSchemeError(choices.error_message(invalid))
+
+            return result
+
+        return convert_enum
+
+    converter = _items_converter(item_type)
+    if copy:
+        return converter
+
+    exact = _TYPE_CLASSES.get(item_type)
+    if exact is None:
+        if item_type in _TYPE_PARSERS:
+            return converter
+
+        def keep_list(value) -> list:
+            return value if value.__class__ is list else converter(value)
+
+        return keep_list
+
+    def convert_or_keep(value) -> list:
+        # the converters return the items of the exact type as is
+        if value.__class__ is list:
+            for element in value:
+                if element.__class__ is not exact:
+                    return converter(value)
+
+            return value
+
+        return converter(value)
+
+    return convert_or_keep
+
+
+def _items_converter(item_type: str):
+    if item_type == "str":
+        def convert_str(value) -> list:
+            return list(map(str, value))
+
+        return convert_str
+
+    parser = _TYPE_PARSERS.get(item_type)
+    if parser is None:
+        return list
+
+    parse = parser[0]
+
+    def parse_item(item):
+        try:
+            return parse(item)
+        except _PARSE_ERRORS:
+            return False, None
+
+    def convert(value) -> list:
+        try:
+            return [result if status else None for status, result in map(parse, value)]
+        except _PARSE_ERRORS:
+            # an item like a list or a dict, the slow path keeps None for it like for any other failed item
+            return [result if status else None for status, result in map(parse_item, value)]
+
+    if item_type not in VECTORIZED_TYPES:
+        return convert
+
+    def convert_vectorized(value) -> list:
+        # the built-in parsers give the same results as try_parse, any failed item falls back to try_parse
+        result = vectorize(item_type, value)
+        if result is None:
+            result = convert(value)
+
+        return result
+
+    return convert_vectorized
+
+
+def enum_items_choices(items: dict) -> Choices:
+    """
+    Prepare the choices of the enum items once
+    :param items: 'items' rule of the list field
+    :return: Choices
+    """
+    return cached_choices(items, 'str')
+
+
+def resolve_validator(validator):
+    """
+    Import the user validator given by the name 'package.module:function' or 'package.module.function'.
+    Other validators are returned as is
+    :param validator: callable or name
+    :return: validator
+    """
+    if isinstance(validator, str):
+        return _import_validator(validator)
+
+    return validator
+
+
+def sync_validator(validator, name):
+    """
+    The user validator for the sync validation. A coroutine function can only be awaited by validate_async,
+    so it is replaced with a validator raising InvalidSchemeError instead of passing with an un-awaited coroutine
+    :param validator: callable
+    :param name: name of the field
+    :return: validator
+    """
+    if not inspect.iscoroutinefunction(validator):
+        return validator
+
+    def reject(value):
+        raise InvalidSchemeError(coroutine_validator_message(name))
+
+    return reject
+
+
+def coroutine_validator_message(name) -> str:
+    """
+    The error of a coroutine function validator in the sync validation
+    :param name: name of the field
+    :return: message
+    """
+    return f"The validator of the parameter '{name}' is a coroutine function, use validate_async"
+
+
+def order_validators(validators: list) -> list:
+    """
+    Sort the user validators by the 'cost' hint of {'f': ..., 'cost': ...}: the cheap validators run first.
+    The cost is 1 by default, the validators of the same cost keep their order
+    :param validators: list of validators
+    :return: list
+    """
+    return [validator for _, validator in sorted(zip(map(validator_cost, validators), validators),
+                                                 key=itemgetter(0))]
+
+
+def validator_cost(validator) -> float:
+    """
+    The cost hint of the user validator
+    :param validator: callable, name or {'f': ..., 'message': ..., 'cost': ...}
+    :return: positive number, 1 by default
+    """
+    if not isinstance(validator, dict):
+        return 1.0
+
+    cost = DictUtils.get_float_dict_property(validator, 'cost', default_value=1)
+    if not cost > 0:
+        raise InvalidSchemeError(f"The cost of the validator must be a positive number, got '{cost}'")
+
+    return cost
+
+
+@lru_cache(maxsize=None)
+def _import_validator(name: str):
+    module_name, separator, attributes = name.partition(':')
+    if not separator:
+        module_name, _, attributes = name.rpartition('.')
+
+    try:
+        module = importlib.import_module(module_name)
+        validator = reduce(getattr, attributes.split('.'), module)
+    except (ImportError, AttributeError, ValueError) as e:
+        raise InvalidSchemeError(f"The validator '{name}' could not be imported: {e}")
+
+    if not callable(validator):
+        raise InvalidSchemeError(f"The validator '{name}' is not callable")
+
+    return validator
@@ -0,0 +1,102 @@
+import sys
+from collections.abc import Mapping
+
+from power_dict.utils import DictUtils
+
+
+class PathIndex:
+    """
+    Flattened index of the nested dictionary: the value of every path is found with one lookup.
+    The index keeps references to the values of the source dictionary,
+    call invalidate(path) or rebuild() after a subtree of the source has been changed
+    """
+
+    def __init__(self, properties: dict, separator: str = "."):
+        self.properties = properties
+        self.separator = separator
+        self._index = {}
+        self.rebuild()
+
+    def get(self, path: str, **kwargs) -> object:
+        """
+        Get the dictionary value and cast it to type data_type by path.
+        The same as DictUtils.get_setting_by_path(properties, path, **kwargs)
+        :param path: key as full path
+        :return: data_type object
+        """
+        if DictUtils.str_is_null_or_empty(path) or self.properties is None:
+            return None
+
+        separator, kwargs = DictUtils._InternalUtils.remove_key(kwargs, 'separator', self.separator)
+        if separator != self.separator:
+            return DictUtils.get_setting_by_path(self.properties, path, separator=separator, **kwargs)
+
+        return DictUtils.get_value(self._index, path, **kwargs)
+
+    def rebuild(self):
+        """
+        Build the index of the whole source dictionary again
+        :return:
+        """
+        self._index = {}
+        if isinstance(self.properties, Mapping):
+            self.__add_children(self.properties, None)
+
+    def invalidate(self, path: str = None):
+        """
+        Build the index of the subtree again after it has been changed, replaced, added or removed
+        :param path: path of the subtree, the whole dictionary if None
+        :return:
+        """
+        if path is None:
+            self.rebuild()
+            return
+
+        prefix = path + self.separator
+        for key in [key for key in self._index if key == path or key.startswith(prefix)]:
+            del self._index[key]
+
+        parents, key = DictUtils._InternalUtils.split_path(path, self.separator)
+        if DictUtils.str_is_null_or_empty(key) or self.separator in key:
+            return
+
+        if parents and self.separator.join(parents) not in self._index:
+            return
+
+        parent = DictUtils._InternalUtils.walk_path(self.properties, parents)
+        if not isinstance(parent, Mapping):
+            return
+
+        value = DictUtils.get_dict_property(parent, key)
+        if value is not None:
+            self.__add(path, value)
+
+    def memory_usage(self) -> int:
+        """
+        Size of the index in bytes: the hash table and the path strings. The values belong to the source dictionary
+        :return: size in bytes
+        """
+        return sys.getsizeof(self._index) + sum(sys.getsizeof(key) for key in self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, path):
+        return path in self._index
+
+    def __add_children(self, properties: Mapping, prefix):
+        separator = self.separator
+        for key, value in properties.items():
+            if not isinstance(key, str) or DictUtils.str_is_null_or_empty(key) or separator in key:
+                # get_setting_by_path never reaches such keys
+                continue
+
+            if value is None:
+                continue
+
+            self.__add(key if prefix is None else prefix + separator + key, value)
+
+    def __add(self, path: str, value):
+        self._index[path] = value
+        if isinstance(value, Mapping):
+            self.__add_children(value, path)
@@ -0,0 +1,132 @@
+from collections.abc import Mapping
+
+
+class RecordError:
+    """
+    Validation error of a single record of a batch
+    """
+    __slots__ = ('index', 'error')
+
+    def __init__(self, index: int, error: Exception):
+        self.index = index
+        self.error = error
+
+    def __repr__(self):
+        return f"RecordError(index={self.index}, error={self.error!r})"
+
+
+class BatchResult:
+    """
+    Result of the batch validation.
+    'data' holds the valid outputs in input order, 'indexes' holds the input index of each of them
+    """
+
+    def __init__(self, data: list, indexes: list, errors: list, processed: int):
+        self.data = data
+        self.indexes = indexes
+        self.errors = errors
+        self.processed = processed
+
+    @property
+    def is_valid(self) -> bool:
+        """
+        All processed records are valid?
+        :return: status
+        """
+        return not self.errors
+
+    def __repr__(self):
+        return f"BatchResult(valid={len(self.data)}, errors={len(self.errors)}, processed={self.processed})"
+
+
+class FieldError:
+    """
+    Validation error of a single field.
+    'code' is one of not_allowed, required, invalid, choice, empty, schema, validator
+    """
+    __slots__ = ('field', 'code', 'message')
+
+    NOT_ALLOWED = 'not_allowed'
+    REQUIRED = 'required'
+    INVALID = 'invalid'
+    CHOICE = 'choice'
+    EMPTY = 'empty'
+    SCHEMA = 'schema'
+    VALIDATOR = 'validator'
+
+    def __init__(self, field: str, code: str, message: str):
+        self.field = field
+        self.code = code
+        self.message = message
+
+    def __eq__(self, other):
+        if not isinstance(other, FieldError):
+            return NotImplemented
+
+        return (self.field, self.code, self.message) == (other.field, other.code, other.message)
+
+    def __repr__(self):
+        return f"FieldError(field={self.field!r}, code={self.code!r}, message={self.message!r})"
+
+
+class ValidationResult:
+    """
+    Result of the validation with collect_errors=True.
+    'data' holds the valid fields, 'errors' holds a FieldError for every invalid field in the scheme order
+    """
+
+    def __init__(self, data: dict, errors: list):
+        self.data = data
+        self.errors = errors
+
+    @property
+    def is_valid(self) -> bool:
+        """
+        All fields are valid?
+        :return: status
+        """
+        return not self.errors
+
+    def __repr__(self):
+        return f"ValidationResult(valid={self.is_valid}, errors={self.errors!r})"
+
+
+class LazyValidatedDict(Mapping):
+    """
+    Result of the lazy validation: every field is converted and validated the first time it is read,
+    the result is cached. Reading a field raises the same error as validate would raise for it
+    """
+
+    def __init__(self, fields: dict, context: dict):
+        self._fields = fields
+        # a copy, so the later changes of the source context don't change the results
+        self._context = dict(context)
+        self._values = {}
+
+    def __getitem__(self, name):
+        values = self._values
+        if name in values:
+            return values[name]
+
+        field = self._fields[name]
+        value = values[name] = field.transform(field.lookup(self._context))
+        return value
+
+    def __iter__(self):
+        return iter(self._fields)
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __contains__(self, name):
+        return name in self._fields
+
+    def materialize(self) -> dict:
+        """
+        Convert and validate all fields that have not been read yet
+        :return: dict, the same as the result of validate
+        """
+        return {name: self[name] for name in self._fields}
+
+    def __repr__(self):
+        return f"LazyValidatedDict(fields={len(self._fields)}, converted={len(self._values)})"
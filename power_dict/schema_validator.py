@@ -1,39 +1,239 @@
-from power_dict.errors import InvalidSchemeError, NotAllowedParameterError
-from power_dict.internal_validators import empty_list, unique_list, items_list
+import os
+import pickle
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from operator import is_
+from threading import Lock
+
+from power_dict import codegen, instrumentation
+from power_dict.choices import cached_choices, clear_cached_choices, _MISSING
+from power_dict.compiled_schema import CompiledSchema, schema_keys, field_aliases, convert_nested, write_back, \
+    unsupported_format_message, clear_nested
+from power_dict.errors import InvalidSchemeError, NotAllowedParameterError, InvalidParameterError
+from power_dict.internal_validators import empty_list, unique_list, items_list, resolve_validator, \
+    order_validators, sync_validator
+from power_dict.results import BatchResult, ValidationResult
 from power_dict.utils import DictUtils
 
 
 class SchemaValidator:
     @staticmethod
-    def validate(context: dict, schema: list, sanitize_schema: bool = True) -> dict:
+    def validate(context: dict, schema: list, sanitize_schema: bool = True, collect_errors: bool = False,
+                 strip_unknown: bool = False, key_policy=None, inplace: bool = False):
         """
-        Validation and transformation of 'context' dictionary in accordance with the rules of the scheme
+        Validation and transformation of 'context' dictionary in accordance with the rules of the scheme.
+        The prepared scheme is cached for the next calls with the same scheme object
         :param context:
         :param schema:
         :param sanitize_schema:
-        :return:
+        :param collect_errors: return ValidationResult with the errors of all fields instead of raising the first one
+        :param strip_unknown: drop the unknown keys instead of raising NotAllowedParameterError
+        :param key_policy: accepted key styles of all fields: 'camel', 'pascal', 'kebab', callable(name)
+        or a tuple or a list of them
+        :param inplace: write the result to 'context' after all fields have been validated and return it
+        :return: dict or ValidationResult if collect_errors
         """
+        if inplace:
+            return write_back(context, SchemaValidator.validate(context, schema, sanitize_schema, collect_errors,
+                                                                strip_unknown, key_policy))
+
+        if strip_unknown:
+            if not schema:
+                return ValidationResult({}, []) if collect_errors else {}
+
+            sanitize_schema = False
+
+        prepared = _prepare(schema, key_policy)
+        if prepared is not None:
+            if collect_errors:
+                return prepared.compiled.validate(context, sanitize_schema, collect_errors=True)
+
+            if codegen._enabled and instrumentation._collector is None:
+                return prepared.generated()(context, sanitize_schema)
+
+            return prepared.compiled.validate(context, sanitize_schema)
+
+        if collect_errors:
+            return SchemaValidator.compile(schema, key_policy).validate(context, sanitize_schema, collect_errors=True)
+
         if sanitize_schema:
-            schema_keys = SchemaValidator.__get_schema_keys(schema)
+            schema_keys = SchemaValidator.__get_schema_keys(schema, key_policy)
             SchemaValidator.__sanitize_schema(context, schema_keys)
 
-        return SchemaValidator.__transform_context(context, schema)
+        return SchemaValidator.__transform_context(context, schema, key_policy)
 
     @staticmethod
-    def __get_schema_keys(schema: list) -> set:
-        keys = set()
+    def validate_lazy(context: dict, schema: list, sanitize_schema: bool = True):
+        """
+        Lazy validation of 'context' dictionary: the keys and the presence of the required fields are checked at once,
+        every field is converted and validated the first time it is read. Call materialize() to validate all fields
+        :param context:
+        :param schema:
+        :param sanitize_schema:
+        :return: LazyValidatedDict
+        """
+        prepared = _prepare(schema)
+        compiled = prepared.compiled if prepared is not None else SchemaValidator.compile(schema)
 
-        if schema is None or len(schema) == 0:
-            return keys
+        return compiled.validate_lazy(context, sanitize_schema)
 
-        for item in schema:
-            name = DictUtils.get_required_dict_property(item, 'name')
-            if name in keys:
-                raise InvalidSchemeError(f"The parameter '{name}' is repeated")
+    @staticmethod
+    def validate_patch(previous_valid: dict, patch: dict, schema: list, sanitize_schema: bool = True) -> dict:
+        """
+        Validation of the partial update of the validated dictionary: only the keys of the patch are converted
+        and only their validators are run. The values of the other keys are taken from 'previous_valid' as is,
+        so the result and the raised error are the same as of validate of the merged dictionary
+        if 'previous_valid' is a result of validate with the same scheme
+        :param previous_valid: result of validate
+        :param patch: changed keys with raw values
+        :param schema:
+        :param sanitize_schema:
+        :return: merged dict
+        """
+        prepared = _prepare(schema)
+        compiled = prepared.compiled if prepared is not None else SchemaValidator.compile(schema)
+
+        return compiled.validate_patch(previous_valid, patch, sanitize_schema)
+
+    @staticmethod
+    async def validate_async(context: dict, schema: list, sanitize_schema: bool = True,
+                             concurrency: int = None) -> dict:
+        """
+        Validation and transformation of 'context' dictionary with sync and coroutine function validators.
+        The validators of different fields run concurrently with asyncio.gather,
+        the raised error is the same as the error of validate. The validators of nested schemes must be sync
+        :param context:
+        :param schema:
+        :param sanitize_schema:
+        :param concurrency: maximum number of awaited validators at once, unlimited if None
+        :return: dict
+        """
+        prepared = _prepare(schema)
+        compiled = prepared.compiled if prepared is not None else SchemaValidator.compile(schema)
 
-            keys.add(name)
+        return await compiled.validate_async(context, sanitize_schema, concurrency)
 
-        return keys
+    @staticmethod
+    def invalidate(schema: list = None):
+        """
+        Drop the prepared scheme cached by validate. Call it after an in-place change of a value of a field,
+        e.g. an appended choice or an edited 'items'; replaced, added and removed fields and values are detected.
+        The choices and the nested schemes prepared for the interpreted path are dropped for all schemes
+        :param schema: scheme, all schemes if None
+        :return:
+        """
+        clear_cached_choices()
+        clear_nested()
+
+        with _prepared_lock:
+            if schema is None:
+                _prepared.clear()
+            else:
+                for key in [key for key, prepared in _prepared.items() if prepared.schema is schema]:
+                    del _prepared[key]
+
+    @staticmethod
+    def validate_many(contexts, schema: list, sanitize_schema: bool = True, stop_on_error: bool = False) -> BatchResult:
+        """
+        Validation and transformation of every context of the iterable 'contexts'. The scheme is prepared once
+        :param contexts: iterable of dictionaries
+        :param schema:
+        :param sanitize_schema:
+        :param stop_on_error: stop on the first invalid context, otherwise collect all errors
+        :return: BatchResult
+        """
+        return SchemaValidator.compile(schema).validate_many(contexts, sanitize_schema, stop_on_error)
+
+    @staticmethod
+    def validate_parallel(contexts, schema: list, workers: int = None, chunk_size: int = 1000,
+                          sanitize_schema: bool = True) -> BatchResult:
+        """
+        Validation and transformation of a batch of contexts in a pool of processes.
+        The scheme is sent to every worker once, at most 2 chunks per worker are in flight,
+        so a generator is read as the workers go. The scheme must be picklable:
+        use validator names like 'package.module:function' instead of lambdas and local functions
+        :param contexts: iterable of dictionaries
+        :param schema:
+        :param workers: number of processes, os.cpu_count() by default
+        :param chunk_size: number of contexts sent to a worker at once
+        :param sanitize_schema:
+        :return: BatchResult with results in input order
+        """
+        if chunk_size < 1:
+            raise InvalidParameterError("The parameter 'chunk_size' must be greater than 0")
+
+        compiled = SchemaValidator.compile(schema)
+
+        if workers == 1:
+            return compiled.validate_many(contexts, sanitize_schema)
+
+        try:
+            pickle.dumps(schema)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            raise InvalidSchemeError(
+                f"The scheme can't be sent to the worker processes: {e}. "
+                f"Use validator names like 'package.module:function' instead of lambdas and local functions")
+
+        data = []
+        indexes = []
+        errors = []
+        processed = 0
+
+        # at most 2 chunks per worker are in flight, so the input is read as the workers go
+        window = 2 * (workers or os.cpu_count() or 1)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(schema, sanitize_schema)) as executor:
+            for chunk in _map_bounded(executor, _validate_chunk, _chunks(contexts, chunk_size), window):
+                data.extend(chunk.data)
+                indexes.extend(chunk.indexes)
+                errors.extend(chunk.errors)
+                processed += chunk.processed
+
+        return BatchResult(data, indexes, errors, processed)
+
+    @staticmethod
+    def iter_validate(source, schema: list, error_sink=None, sanitize_schema: bool = True):
+        """
+        Lazy validation and transformation of the stream of contexts with constant memory.
+        'source' is a file object of JSON lines or any iterable of dictionaries; blank lines are skipped.
+        An invalid record is passed to error_sink(line_number, error) and the stream goes on,
+        without error_sink the error is raised
+        :param source: iterable of JSON lines or dictionaries
+        :param schema:
+        :param error_sink: callable(line_number: int, error: Exception)
+        :param sanitize_schema:
+        :return: generator of validated dictionaries
+        """
+        return SchemaValidator.compile(schema).iter_validate(source, error_sink, sanitize_schema)
+
+    @staticmethod
+    def validate_columns(columns: dict, schema: list, sanitize_schema: bool = True) -> dict:
+        """
+        Validation and transformation of the columnar data: dictionary of field -> list of values.
+        int, float, bool, date and datetime columns are converted in one pass with NumPy if it is installed
+        :param columns: dict of lists or one-dimensional arrays of equal length
+        :param schema:
+        :param sanitize_schema:
+        :return: dict of lists
+        """
+        return SchemaValidator.compile(schema).validate_columns(columns, sanitize_schema)
+
+    @staticmethod
+    def compile(schema: list, key_policy=None) -> CompiledSchema:
+        """
+        Check the scheme once and prepare it for repeated validation of contexts
+        :param schema:
+        :param key_policy: accepted key styles of all fields: 'camel', 'pascal', 'kebab', callable(name)
+        or a tuple or a list of them
+        :return: CompiledSchema
+        """
+        return CompiledSchema(schema, SchemaValidator.__get_schema_keys(schema, key_policy), key_policy)
+
+    @staticmethod
+    def __get_schema_keys(schema: list, key_policy=None) -> set:
+        return schema_keys(schema, key_policy)
 
     @staticmethod
     def __sanitize_schema(context: dict, keys: set):
@@ -43,7 +243,7 @@ class SchemaValidator:
                 raise NotAllowedParameterError(f"The parameter '{key}' is not allowed")
 
     @staticmethod
-    def __transform_context(context: dict, schema: list) -> dict:
+    def __transform_context(context: dict, schema: list, key_policy=None) -> dict:
         if schema is None or len(schema) == 0:
             return context
 
@@ -51,7 +251,15 @@ class SchemaValidator:
         for item in schema:
             name = DictUtils.get_required_dict_property(item, 'name')
 
-            value = SchemaValidator.__get_item_value(item, context)
+            item_context = context
+            if DictUtils.get_dict_property(context, name) is None:
+                for alias in field_aliases(item, key_policy):
+                    alias_value = DictUtils.get_dict_property(context, alias)
+                    if alias_value is not None:
+                        item_context = {name: alias_value}
+                        break
+
+            value = SchemaValidator.__get_item_value(item, item_context)
 
             value = SchemaValidator.__check_internal_validators(item, value)
 
@@ -69,22 +277,31 @@ class SchemaValidator:
         required_error = DictUtils.get_str_dict_property(item, 'required_error', None)
         item_format = DictUtils.get_str_dict_property(item, 'format', None)
 
+        if item_type == "dict":
+            return convert_nested(item, DictUtils.get_dict_property(context, name))
+
         if item_type == "enum":
-            choices = DictUtils.get_required_list_dict_property(item, 'choices', required_error=required_error)
+            choices = cached_choices(item, required_error)
 
             if required:
                 str_value = DictUtils.get_required_str_dict_property(context, name, required_error=required_error)
             else:
                 str_value = DictUtils.get_str_dict_property(context, name, default_value)
 
-            if str_value is not None and str_value not in choices:
-                raise InvalidSchemeError(
-                    f"The value '{str_value}' is not available for selection. Possible options: {choices}")
+            if str_value is None:
+                return None
 
-            return str_value
+            choice = choices.resolve(str_value, _MISSING)
+            if choice is _MISSING:
+                raise InvalidSchemeError(choices.error_message(str_value))
+
+            return choice
         else:
             kwargs = {}
             if item_format is not None:
+                if item_type not in ("datetime", "date"):
+                    raise InvalidSchemeError(unsupported_format_message(name, item_type))
+
                 kwargs['format'] = item_format
 
             if item_type is not None:
@@ -94,11 +311,17 @@ class SchemaValidator:
                 if required_error is not None:
                     kwargs['required_error'] = required_error
 
+                if item_type == "list" and not DictUtils.get_bool_dict_property(item, 'copy', default_value=True):
+                    kwargs['copy'] = False
+
                 return DictUtils.get_required_value(context, name, **kwargs)
             else:
                 if default_value is not None:
                     kwargs['default_value'] = default_value
 
+                if item_type == "list" and not DictUtils.get_bool_dict_property(item, 'copy', default_value=True):
+                    kwargs['copy'] = False
+
                 return DictUtils.get_value(context, name, **kwargs)
 
     @staticmethod
@@ -111,17 +334,19 @@ class SchemaValidator:
         if validators is not None and len(validators) > 0:
             name = DictUtils.get_required_dict_property(item_schema, 'name')
 
-            for validator in validators:
+            for validator in order_validators(validators):
                 error = None
+                validator = resolve_validator(validator)
                 if not callable(validator):
                     message = DictUtils.get_str_dict_property(validator, 'message')
-                    validator = DictUtils.get_required_dict_property(validator, 'f')
+                    validator = resolve_validator(DictUtils.get_required_dict_property(validator, 'f'))
 
                     if not DictUtils.str_is_null_or_empty(value) and '#VALUE#' in message:
                         message = message.replace('#VALUE#', str(value))
 
                     error = f"{message}"
 
+                validator = sync_validator(validator, name)
                 if callable(validator) and not validator(value):
                     if error is None:
                         error = f"The parameter '{name} does not match the specified condition"
@@ -142,3 +367,125 @@ class SchemaValidator:
                 value = validator(item_schema, value)
 
         return value
+
+
+_PREPARED_MAXSIZE = 128
+
+_prepared = OrderedDict()
+_prepared_lock = Lock()
+
+
+class _PreparedSchema:
+    """
+    The scheme prepared by validate. 'compiled' is None if the scheme can't be compiled,
+    such schemes are validated by the interpreted path that raises the errors of the scheme in the same order
+    """
+    __slots__ = ('schema', 'version', 'key_policy', 'compiled', '_generated', '_generation')
+
+    def __init__(self, schema: list, version: tuple, key_policy=None):
+        self.schema = schema
+        self.version = version
+        self.key_policy = key_policy
+        self._generated = None
+        self._generation = None
+
+        try:
+            self.compiled = SchemaValidator.compile(schema, key_policy)
+        except Exception:
+            self.compiled = None
+
+    def generated(self):
+        if self._generation != codegen._generation:
+            self._generated = codegen.get_validator(self.schema, self.key_policy) or self.compiled.validate
+            self._generation = codegen._generation
+
+        return self._generated
+
+
+def _prepare(schema: list, key_policy=None):
+    if schema.__class__ is not list or not schema:
+        return None
+
+    try:
+        version = _schema_version(schema)
+    except TypeError:
+        # the fields are not dictionaries
+        return None
+
+    if key_policy.__class__ is list:
+        # a list policy is a part of the memo key
+        key_policy = tuple(key_policy)
+
+    key = id(schema) if key_policy is None else (id(schema), key_policy)
+    with _prepared_lock:
+        prepared = _prepared.get(key)
+        if prepared is not None and _same_version(prepared.version, version):
+            _prepared.move_to_end(key)
+            return prepared if prepared.compiled is not None else None
+
+    prepared = _PreparedSchema(schema, version, key_policy)
+
+    with _prepared_lock:
+        # the entry keeps the scheme alive, so its id is not reused
+        _prepared[key] = prepared
+        if len(_prepared) > _PREPARED_MAXSIZE:
+            _prepared.popitem(last=False)
+
+    return prepared if prepared.compiled is not None else None
+
+
+def _schema_version(schema: list) -> tuple:
+    # the fields and their values: the version keeps them alive, so a replaced field or value is never mistaken
+    # for the old one with a reused id
+    return tuple(chain(schema, chain.from_iterable(map(dict.values, schema))))
+
+
+def _same_version(version: tuple, other: tuple) -> bool:
+    # by identity: an equal value may still be converted differently, e.g. the default value 1 and True of a str field
+    return len(version) == len(other) and all(map(is_, version, other))
+
+
+_worker_schema = None
+_worker_sanitize_schema = True
+
+
+def _init_worker(schema: list, sanitize_schema: bool):
+    global _worker_schema, _worker_sanitize_schema
+    _worker_schema = SchemaValidator.compile(schema)
+    _worker_sanitize_schema = sanitize_schema
+
+
+def _validate_chunk(chunk) -> BatchResult:
+    start, contexts = chunk
+    result = _worker_schema.validate_many(contexts, _worker_sanitize_schema)
+
+    result.indexes = [start + index for index in result.indexes]
+    for error in result.errors:
+        error.index += start
+
+    return result
+
+
+def _map_bounded(executor, func, iterable, window: int):
+    # executor.map submits the whole iterable at once
+    futures = deque()
+    for item in iterable:
+        if len(futures) >= window:
+            yield futures.popleft().result()
+
+        futures.append(executor.submit(func, item))
+
+    while futures:
+        yield futures.popleft().result()
+
+
+def _chunks(contexts, chunk_size: int):
+    iterator = iter(contexts)
+    start = 0
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+
+        yield start, chunk
+        start += len(chunk)
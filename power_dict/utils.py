@@ -1,8 +1,12 @@
 import datetime
+from functools import lru_cache
+from threading import Lock
 from try_parse.utils import ParseUtils
 from decimal import Decimal
 
-from power_dict.errors import InvalidParameterError, NoneParameterError
+from power_dict import instrumentation
+from power_dict.date_parsers import try_parse_date, try_parse_datetime
+from power_dict.errors import InvalidParameterError, NoneParameterError, InvalidSchemeError
 
 
 class DictUtils:
@@ -16,24 +20,12 @@ class DictUtils:
         """
         data_type, kwargs = DictUtils._InternalUtils.remove_key(kwargs, 'data_type', "str")
 
-        map_func = {
-            "object": DictUtils.get_dict_property,
-            "str": DictUtils.get_str_dict_property,
-            "int": DictUtils.get_int_dict_property,
-            "datetime": DictUtils.get_datetime_dict_property,
-            "date": DictUtils.get_date_dict_property,
-            "bool": DictUtils.get_bool_dict_property,
-            "decimal": DictUtils.get_decimal_dict_property,
-            "list": DictUtils.get_list_dict_property,
-            "float": DictUtils.get_float_dict_property
-        }
-
-        if data_type not in map_func:
-            func = DictUtils.get_dict_property
-        else:
-            func = map_func[data_type]
+        func = DictUtils._InternalUtils.value_getter(data_type)
+
+        if instrumentation._collector is None:
+            return func(properties, key, **kwargs)
 
-        return func(properties, key, **kwargs)
+        return instrumentation.measure_value(func, properties, key, data_type, kwargs)
 
     @staticmethod
     def get_required_value(properties: dict, key: str, **kwargs) -> object:
@@ -45,24 +37,12 @@ class DictUtils:
         """
         data_type, kwargs = DictUtils._InternalUtils.remove_key(kwargs, 'data_type', "str")
 
-        map_func = {
-            "object": DictUtils.get_required_dict_property,
-            "str": DictUtils.get_required_str_dict_property,
-            "int": DictUtils.get_required_int_dict_property,
-            "datetime": DictUtils.get_required_datetime_dict_property,
-            "date": DictUtils.get_required_date_dict_property,
-            "bool": DictUtils.get_required_bool_dict_property,
-            "decimal": DictUtils.get_required_decimal_dict_property,
-            "list": DictUtils.get_required_list_dict_property,
-            "float": DictUtils.get_required_float_dict_property
-        }
-
-        if data_type not in map_func:
-            func = DictUtils.get_required_dict_property
-        else:
-            func = map_func[data_type]
+        func = DictUtils._InternalUtils.value_getter(data_type, required=True)
+
+        if instrumentation._collector is None:
+            return func(properties, key, **kwargs)
 
-        return func(properties, key, **kwargs)
+        return instrumentation.measure_value(func, properties, key, data_type, kwargs)
 
     @staticmethod
     def get_setting_by_path(properties: dict, path: str, **kwargs) -> object:
@@ -75,20 +55,23 @@ class DictUtils:
         if not DictUtils.str_is_null_or_empty(path) and properties is not None:
             separator, kwargs = DictUtils._InternalUtils.remove_key(kwargs, 'separator', ".")
 
-            ps = path.split(separator)
-            i = 0
-            ps_len = len(ps)
+            parents, key = DictUtils._InternalUtils.split_path(path, separator)
+            properties = DictUtils._InternalUtils.walk_path(properties, parents)
 
-            if ps_len > 0:
-                for key in ps:
-                    i = i + 1
-                    if i == ps_len:
-                        return DictUtils.get_value(properties, key, **kwargs)
-
-                    properties = DictUtils.get_dict_property(properties, key)
+            return DictUtils.get_value(properties, key, **kwargs)
 
         return None
 
+    @staticmethod
+    def compile_path(path: str, separator: str = ".", **kwargs) -> 'CompiledPath':
+        """
+        Prepare the path once for repeated reads with the rules of get_setting_by_path
+        :param path: key as full path
+        :param separator: path separator
+        :return: CompiledPath
+        """
+        return CompiledPath(path, separator, **kwargs)
+
     @staticmethod
     def get_dict_property(properties: dict, key: str, default_value=None) -> object:
         """
@@ -137,7 +120,12 @@ class DictUtils:
         """
         value = DictUtils.get_dict_property(properties, key)
 
-        if DictUtils.str_is_null_or_empty(value):
+        if value.__class__ is str:
+            stripped = value.strip()
+            if stripped:
+                return stripped
+
+        if is_empty(value):
             if default_value is None:
                 return None
             value = default_value
@@ -156,7 +144,7 @@ class DictUtils:
         value = DictUtils.get_required_dict_property(properties, key, required_error)
         value = str(value)
 
-        if DictUtils.str_is_null_or_empty(value):
+        if not value.strip():
             DictUtils.raise_none_parameter_error(key, required_error)
 
         return value
@@ -172,10 +160,16 @@ class DictUtils:
         """
         value = DictUtils.get_dict_property(properties, key)
 
-        if DictUtils.str_is_null_or_empty(value):
+        if value.__class__ is int:
+            return value
+
+        if is_empty(value):
             value = default_value
 
-        status, result = ParseUtils.try_parse_int(value)
+        try:
+            status, result = ParseUtils.try_parse_int(value)
+        except _PARSE_ERRORS:
+            status, result = False, None
         if status:
             return result
         else:
@@ -192,7 +186,13 @@ class DictUtils:
         """
         value = DictUtils.get_required_dict_property(properties, key, required_error)
 
-        status, result = ParseUtils.try_parse_int(value)
+        if value.__class__ is int:
+            return value
+
+        try:
+            status, result = ParseUtils.try_parse_int(value)
+        except _PARSE_ERRORS:
+            status, result = False, None
         if status:
             return result
         else:
@@ -211,10 +211,13 @@ class DictUtils:
         """
         value = DictUtils.get_dict_property(properties, key)
 
-        if DictUtils.str_is_null_or_empty(value):
+        if value.__class__ is datetime.datetime:
+            return value
+
+        if is_empty(value):
             value = default_value
 
-        status, result = ParseUtils.try_parse_datetime(value, format=format)
+        status, result = try_parse_datetime(value, format=format)
         if status:
             return result
         else:
@@ -233,7 +236,10 @@ class DictUtils:
         """
         value = DictUtils.get_required_dict_property(properties, key, required_error)
 
-        status, result = ParseUtils.try_parse_datetime(value, format=format)
+        if value.__class__ is datetime.datetime:
+            return value
+
+        status, result = try_parse_datetime(value, format=format)
         if status:
             return result
         else:
@@ -251,10 +257,13 @@ class DictUtils:
         """
         value = DictUtils.get_dict_property(properties, key)
 
-        if DictUtils.str_is_null_or_empty(value):
+        if value.__class__ is datetime.date:
+            return value
+
+        if is_empty(value):
             value = default_value
 
-        status, result = ParseUtils.try_parse_date(value, format=format)
+        status, result = try_parse_date(value, format=format)
         if status:
             return result
         else:
@@ -273,7 +282,10 @@ class DictUtils:
         """
         value = DictUtils.get_required_dict_property(properties, key, required_error)
 
-        status, result = ParseUtils.try_parse_date(value, format=format)
+        if value.__class__ is datetime.date:
+            return value
+
+        status, result = try_parse_date(value, format=format)
         if status:
             return result
         else:
@@ -290,7 +302,10 @@ class DictUtils:
         """
         value = DictUtils.get_dict_property(properties, key)
 
-        if DictUtils.str_is_null_or_empty(value):
+        if value.__class__ is bool:
+            return value
+
+        if is_empty(value):
             value = default_value
 
         status, result = ParseUtils.try_parse_bool(value)
@@ -309,6 +324,10 @@ class DictUtils:
         :return: bool object
         """
         value = DictUtils.get_required_dict_property(properties, key, required_error)
+
+        if value.__class__ is bool:
+            return value
+
         status, result = ParseUtils.try_parse_bool(value)
         if status:
             return result
@@ -326,10 +345,16 @@ class DictUtils:
         """
         value = DictUtils.get_dict_property(properties, key)
 
-        if DictUtils.str_is_null_or_empty(value):
+        if value.__class__ is Decimal:
+            return value
+
+        if is_empty(value):
             value = default_value
 
-        status, result = ParseUtils.try_parse_decimal(value)
+        try:
+            status, result = ParseUtils.try_parse_decimal(value)
+        except _PARSE_ERRORS:
+            status, result = False, None
         if status:
             return result
         else:
@@ -346,39 +371,58 @@ class DictUtils:
         """
         value = DictUtils.get_required_dict_property(properties, key, required_error)
 
-        status, result = ParseUtils.try_parse_decimal(value)
+        if value.__class__ is Decimal:
+            return value
+
+        try:
+            status, result = ParseUtils.try_parse_decimal(value)
+        except _PARSE_ERRORS:
+            status, result = False, None
         if status:
             return result
         else:
             raise InvalidParameterError(f'Parameter "{key}" could not be converted to a decimal')
 
     @staticmethod
-    def get_list_dict_property(properties: dict, key: str, default_value=None) -> list:
+    def get_list_dict_property(properties: dict, key: str, default_value=None, copy: bool = True) -> list:
         """
         Get the dictionary value and cast it to 'list'
         :param properties: dict data
         :param key: key
         :param default_value: default value
+        :param copy: copy the list, otherwise the list value itself is returned
         :return: list object
         """
         v = DictUtils.get_dict_property(properties, key)
         if v is None:
             return default_value
-        else:
+        elif not copy and v.__class__ is list:
+            return v
+
+        try:
             return list(v)
+        except TypeError:
+            raise InvalidParameterError(f'Parameter "{key}" could not be converted to a list')
 
     @staticmethod
-    def get_required_list_dict_property(properties: dict, key: str, required_error=None) -> list:
+    def get_required_list_dict_property(properties: dict, key: str, required_error=None, copy: bool = True) -> list:
         """
         Get the required dictionary value and cast it to 'list'
         :param properties: dict data
         :param key: key
         :param required_error: error message if parameter is none
+        :param copy: copy the list, otherwise the list value itself is returned
         :return: list object
         """
         required_object = DictUtils.get_required_dict_property(properties, key, required_error)
 
-        return list(required_object)
+        if not copy and required_object.__class__ is list:
+            return required_object
+
+        try:
+            return list(required_object)
+        except TypeError:
+            raise InvalidParameterError(f'Parameter "{key}" could not be converted to a list')
 
     @staticmethod
     def get_float_dict_property(properties: dict, key: str, default_value=None) -> float:
@@ -391,10 +435,16 @@ class DictUtils:
         """
         value = DictUtils.get_dict_property(properties, key)
 
-        if DictUtils.str_is_null_or_empty(value):
+        if value.__class__ is float:
+            return value
+
+        if is_empty(value):
             value = default_value
 
-        status, result = ParseUtils.try_parse_float(value)
+        try:
+            status, result = ParseUtils.try_parse_float(value)
+        except _PARSE_ERRORS:
+            status, result = False, None
         if status:
             return result
         else:
@@ -411,7 +461,13 @@ class DictUtils:
         """
         value = DictUtils.get_required_dict_property(properties, key, required_error)
 
-        status, result = ParseUtils.try_parse_float(value)
+        if value.__class__ is float:
+            return value
+
+        try:
+            status, result = ParseUtils.try_parse_float(value)
+        except _PARSE_ERRORS:
+            status, result = False, None
         if status:
             return result
         else:
@@ -424,7 +480,7 @@ class DictUtils:
         :param text: string
         :return: status
         """
-        return text is None or not str(text).strip()
+        return is_empty(text)
 
     @staticmethod
     def raise_none_parameter_error(key=None, error=None):
@@ -453,3 +509,275 @@ class DictUtils:
                 del kwargs[key]
 
             return value, kwargs
+
+        @staticmethod
+        def value_getter(data_type: str, required: bool = False):
+            if required:
+                return _REQUIRED_VALUE_GETTERS.get(data_type, DictUtils.get_required_dict_property)
+
+            return _VALUE_GETTERS.get(data_type, DictUtils.get_dict_property)
+
+        @staticmethod
+        @lru_cache(maxsize=1024)
+        def split_path(path: str, separator: str) -> tuple:
+            """
+            Split the path into the parent keys and the last key.
+            get_dict_property returns None for an empty key, so the parents are None if one of them is empty
+            """
+            keys = path.split(separator)
+            parents = tuple(keys[:-1])
+
+            for key in parents:
+                if DictUtils.str_is_null_or_empty(key):
+                    parents = None
+                    break
+
+            return parents, keys[-1]
+
+        @staticmethod
+        def walk_path(properties, parents: tuple):
+            if parents is None:
+                return None
+
+            for key in parents:
+                if properties is None:
+                    return None
+
+                properties = properties[key] if key in properties else None
+
+            return properties
+
+
+# str(value).strip() of these values is never empty
+_NOT_EMPTY_TYPES = frozenset((int, float, bool, Decimal, datetime.date, datetime.datetime))
+
+
+def is_empty(value) -> bool:
+    """
+    The same as DictUtils.str_is_null_or_empty without the str() copy of strings and typed values
+    :param value:
+    :return: status
+    """
+    cls = value.__class__
+    if cls is str:
+        return not value.strip()
+
+    if cls in _NOT_EMPTY_TYPES:
+        return False
+
+    return value is None or not str(value).strip()
+
+
+_VALUE_GETTERS = {
+    "object": DictUtils.get_dict_property,
+    "str": DictUtils.get_str_dict_property,
+    "int": DictUtils.get_int_dict_property,
+    "datetime": DictUtils.get_datetime_dict_property,
+    "date": DictUtils.get_date_dict_property,
+    "bool": DictUtils.get_bool_dict_property,
+    "decimal": DictUtils.get_decimal_dict_property,
+    "list": DictUtils.get_list_dict_property,
+    "float": DictUtils.get_float_dict_property
+}
+
+_REQUIRED_VALUE_GETTERS = {
+    "object": DictUtils.get_required_dict_property,
+    "str": DictUtils.get_required_str_dict_property,
+    "int": DictUtils.get_required_int_dict_property,
+    "datetime": DictUtils.get_required_datetime_dict_property,
+    "date": DictUtils.get_required_date_dict_property,
+    "bool": DictUtils.get_required_bool_dict_property,
+    "decimal": DictUtils.get_required_decimal_dict_property,
+    "list": DictUtils.get_required_list_dict_property,
+    "float": DictUtils.get_required_float_dict_property
+}
+
+# raised by the try-parse functions of ParseUtils for values like lists, dicts and infinity
+_PARSE_ERRORS = (TypeError, OverflowError)
+
+# try-parse function, the type in the error message of the optional and of the required value
+_TYPE_PARSERS = {
+    "int": (ParseUtils.try_parse_int, "a number", "a int"),
+    "float": (ParseUtils.try_parse_float, "a float", "a float"),
+    "decimal": (ParseUtils.try_parse_decimal, "a decimal", "a decimal"),
+    "bool": (ParseUtils.try_parse_bool, "a bool", "a bool"),
+    "datetime": (try_parse_datetime, "a datetime", "a datetime"),
+    "date": (try_parse_date, "a date", "a date"),
+}
+
+# the values of these classes are returned as is by the converters of the type
+_TYPE_CLASSES = {
+    "str": str,
+    "int": int,
+    "float": float,
+    "bool": bool,
+    "decimal": Decimal,
+    "datetime": datetime.datetime,
+    "date": datetime.date,
+}
+
+_BUILT_IN_TYPES = frozenset((*_VALUE_GETTERS, "enum", "dict"))
+
+_types_lock = Lock()
+
+
+class TypeRegistry:
+    """
+    Custom types of values. The converters of a type are built once and put into the dispatch tables
+    used by DictUtils.get_value, DictUtils.get_required_value, SchemaValidator and the 'items' of lists,
+    so a registered type is converted the same way as a built-in one
+    """
+
+    @staticmethod
+    def register(name: str, parse, python_type: type = None, noun: str = None):
+        """
+        Register the type. The prepared schemes are dropped, so the next validation uses the new converters
+        :param name: 'type' of the schema field and 'data_type' of DictUtils.get_value
+        :param parse: callable(value) -> (status, result) like ParseUtils.try_parse_int. ValueError and TypeError
+        are failures, None is not parsed
+        :param python_type: the values of this class are returned as is
+        :param noun: the type in the error message, "a <name>" by default
+        :return:
+        """
+        if DictUtils.str_is_null_or_empty(name):
+            raise InvalidSchemeError("The name of the type is required")
+
+        if name in _BUILT_IN_TYPES:
+            raise InvalidSchemeError(f"The type '{name}' is built-in")
+
+        if not callable(parse):
+            raise InvalidSchemeError(f"The parser of the type '{name}' is not callable")
+
+        if noun is None:
+            noun = f"a {name}"
+
+        parse = _type_parser(parse, python_type)
+
+        with _types_lock:
+            _TYPE_PARSERS[name] = (parse, noun, noun)
+            if python_type is None:
+                _TYPE_CLASSES.pop(name, None)
+            else:
+                _TYPE_CLASSES[name] = python_type
+
+            _VALUE_GETTERS[name] = _optional_getter(parse, noun)
+            _REQUIRED_VALUE_GETTERS[name] = _required_getter(parse, noun)
+
+        _drop_prepared_schemes()
+
+    @staticmethod
+    def unregister(name: str = None):
+        """
+        Remove the registered type, the fields of this type are not converted any more
+        :param name: type name, all registered types if None
+        :return:
+        """
+        with _types_lock:
+            names = [name] if name is not None else [name for name in _TYPE_PARSERS if name not in _BUILT_IN_TYPES]
+            for name in names:
+                if name in _BUILT_IN_TYPES:
+                    raise InvalidSchemeError(f"The type '{name}' is built-in")
+
+                for table in (_TYPE_PARSERS, _TYPE_CLASSES, _VALUE_GETTERS, _REQUIRED_VALUE_GETTERS):
+                    table.pop(name, None)
+
+        _drop_prepared_schemes()
+
+    @staticmethod
+    def is_registered(name: str) -> bool:
+        """
+        The type is built-in or registered
+        :param name: type name
+        :return: status
+        """
+        return name in _BUILT_IN_TYPES or name in _TYPE_PARSERS
+
+
+def _type_parser(parse, python_type):
+    def parse_value(value):
+        if value is None:
+            return True, None
+
+        if value.__class__ is python_type:
+            return True, value
+
+        try:
+            return parse(value)
+        except (ValueError, TypeError):
+            return False, None
+
+    return parse_value
+
+
+def _optional_getter(parse, noun: str):
+    def get_property(properties: dict, key: str, default_value=None):
+        value = DictUtils.get_dict_property(properties, key)
+
+        if is_empty(value):
+            value = default_value
+
+        status, result = parse(value)
+        if status:
+            return result
+        else:
+            raise InvalidParameterError(f'Parameter "{key}" could not be converted to {noun}')
+
+    return get_property
+
+
+def _required_getter(parse, noun: str):
+    def get_required_property(properties: dict, key: str, required_error=None):
+        value = DictUtils.get_required_dict_property(properties, key, required_error)
+
+        status, result = parse(value)
+        if status:
+            return result
+        else:
+            raise InvalidParameterError(f'Parameter "{key}" could not be converted to {noun}')
+
+    return get_required_property
+
+
+def _drop_prepared_schemes():
+    # schema_validator and codegen import this module
+    from power_dict.codegen import CodegenBackend
+    from power_dict.schema_validator import SchemaValidator
+
+    SchemaValidator.invalidate()
+    CodegenBackend.clear()
+
+
+class CompiledPath:
+    """
+    The path prepared by DictUtils.compile_path: the keys are split once and the converter is bound
+    """
+    __slots__ = ('path', 'separator', 'parents', 'key', '_func', '_kwargs')
+
+    def __init__(self, path: str, separator: str = ".", **kwargs):
+        self.path = path
+        self.separator = separator
+
+        if DictUtils.str_is_null_or_empty(path):
+            self.parents = None
+            self.key = None
+        else:
+            self.parents, self.key = DictUtils._InternalUtils.split_path(path, separator)
+
+        data_type, kwargs = DictUtils._InternalUtils.remove_key(kwargs, 'data_type', "str")
+        self._func = DictUtils._InternalUtils.value_getter(data_type)
+        self._kwargs = kwargs
+
+    def get(self, properties: dict) -> object:
+        """
+        Get the dictionary value and cast it to type data_type by the compiled path
+        :param properties: dict data
+        :return: data_type object
+        """
+        if self.key is None or properties is None:
+            return None
+
+        properties = DictUtils._InternalUtils.walk_path(properties, self.parents)
+
+        return self._func(properties, self.key, **self._kwargs)
+
+    __call__ = get
@@ -23,6 +23,9 @@ setuptools.setup(
     install_requires=[
         'try-parse'
     ],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     setup_requires=['pytest-runner'],
     tests_require=['pytest'],
     python_requires='>=3.7',
@@ -0,0 +1,113 @@
+import sys
+import unittest
+from threading import Event, Thread
+
+from power_dict.choices import ChoiceRegistry, Choices, cached_choices
+from power_dict.errors import InvalidSchemeError
+from power_dict.schema_validator import SchemaValidator
+
+
+class ChoicesTests(unittest.TestCase):
+    def tearDown(self):
+        ChoiceRegistry.unregister()
+
+    def test_registry(self):
+        currencies = ChoiceRegistry.register('currencies', [f"C{i:04}" for i in range(5000)])
+        schema = [
+            {'name': 'currency', 'type': "enum", 'required': True, 'choices_registry': 'currencies'},
+            {'name': 'accepted', 'type': "list", 'items': {'type': "enum", 'choices_registry': 'currencies'}},
+        ]
+
+        self.assertEqual(SchemaValidator.validate({'currency': "C4999", 'accepted': ["C0001", None]}, schema),
+                         {'currency': "C4999", 'accepted': ["C0001", None]})
+        self.assertIs(ChoiceRegistry.get('currencies'), currencies)
+
+        ChoiceRegistry.register('currencies', ["USD", "EUR"])
+        self.assertEqual(SchemaValidator.validate({'currency': "USD"}, schema)['currency'], "USD")
+
+        with self.assertRaises(InvalidSchemeError):
+            SchemaValidator.validate({'currency': "C4999"}, schema)
+
+    def test_not_registered(self):
+        schema = [{'name': 'currency', 'type': "enum", 'choices_registry': 'unknown'}]
+
+        with self.assertRaisesRegex(InvalidSchemeError, "The choices registry 'unknown' is not registered"):
+            SchemaValidator.validate({'currency': "USD"}, schema)
+
+    def test_case_insensitive_and_aliases(self):
+        schema = [
+            {'name': 'country', 'type': "enum", 'choices': ["RU", "US"], 'case_insensitive': True,
+             'choice_aliases': {'USA': "US"}},
+            {'name': 'tags', 'type': "list",
+             'items': {'type': "enum", 'choices': ["red", "green"], 'choice_aliases': {'r': "red"}}},
+        ]
+
+        self.assertEqual(SchemaValidator.validate({'country': "usa", 'tags': ["r", "green"]}, schema),
+                         {'country': "US", 'tags': ["red", "green"]})
+        self.assertEqual(SchemaValidator.validate({'country': "Ru"}, schema)['country'], "RU")
+
+        with self.assertRaises(InvalidSchemeError):
+            SchemaValidator.validate({'tags': ["R"]}, schema)
+
+        with self.assertRaisesRegex(InvalidSchemeError, "unknown choice"):
+            Choices(["RU"], aliases={'USA': "US"})
+
+    def test_error_message(self):
+        schema = [{'name': 'kind', 'type': "enum", 'choices': ['a', 'b']}]
+        with self.assertRaisesRegex(InvalidSchemeError,
+                                    r"^The value 'c' is not available for selection. Possible options: \['a', 'b'\]$"):
+            SchemaValidator.validate({'kind': 'c'}, schema)
+
+        schema = [{'name': 'kind', 'type': "enum", 'choices': [str(i) for i in range(5000)]}]
+        result = SchemaValidator.validate({'kind': "x"}, schema, collect_errors=True)
+        self.assertEqual(result.errors[0].message,
+                         "The value 'x' is not available for selection. Possible options: "
+                         "['0', '1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12', '13', '14', '15', "
+                         "'16', '17', '18', '19', ...] (4980 more)")
+
+    def test_concurrent_update(self):
+        choices = Choices(['a'], aliases={'x': 'a'})
+        states = [(['a'], {'x': 'a'}), (['b'], {'y': 'b'})]
+        stop = Event()
+
+        def update():
+            number = 0
+            while not stop.is_set():
+                values, aliases = states[number % 2]
+                choices.update(values, True, aliases)
+                number += 1
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        thread = Thread(target=update)
+        thread.start()
+        try:
+            for _ in range(20000):
+                result, invalid = choices.resolve_all(['A', 'X'])
+                # the old or the new choices, never a mix of them
+                self.assertIn((result, invalid), [(['a', 'a'], None), ([], 'A')])
+        finally:
+            stop.set()
+            thread.join()
+            sys.setswitchinterval(interval)
+
+    def test_cached_choices(self):
+        rule = {'type': "enum", 'choices': ['a', 'b']}
+        choices = cached_choices(rule)
+        self.assertIs(cached_choices(rule), choices)
+
+        rule['choices'] = ['c']
+        self.assertEqual(cached_choices(rule).values, ['c'])
+
+        # the first replaced list is freed, so its id may be reused by the second one
+        rule['choices'] = ['p', 'q']
+        rule['choices'] = ['x', 'y']
+        self.assertEqual(cached_choices(rule).values, ['x', 'y'])
+        rule['choices'] = ['c']
+        self.assertEqual(cached_choices(rule).values, ['c'])
+
+        # an in-place change of the list is seen after invalidate
+        rule['choices'].append('d')
+        self.assertEqual(cached_choices(rule).values, ['c'])
+        SchemaValidator.invalidate()
+        self.assertEqual(cached_choices(rule).values, ['c', 'd'])
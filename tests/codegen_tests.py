@@ -0,0 +1,131 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from power_dict import codegen
+from power_dict.codegen import CodegenBackend
+from power_dict.errors import InvalidSchemeError
+from power_dict.schema_validator import SchemaValidator
+from tests import schema_validator_tests
+
+
+class CodegenSchemaValidatorTests(schema_validator_tests.SchemaValidatorTests):
+    """
+    The whole SchemaValidator suite with the code-generating backend
+    """
+
+    def setUp(self):
+        self.enabled = CodegenBackend.is_enabled()
+        CodegenBackend.enable()
+
+    def tearDown(self):
+        self.assertGreater(CodegenBackend.info()['currsize'], 0)
+        if not self.enabled:
+            CodegenBackend.disable()
+
+
+class CodegenBackendTests(unittest.TestCase):
+    schema = [
+        {'name': 'id', 'type': "int", 'required': True},
+        {'name': 'price', 'type': "decimal", 'required': False, 'default_value': "0.5"},
+        {'name': 'day', 'type': "date", 'required': False, 'format': '%d.%m.%Y'},
+        {'name': 'name', 'type': "str", 'required': False, 'validators': [lambda v: len(v) < 5]},
+        {'name': 'gender', 'type': "enum", 'required': False, 'choices': ['male', 'female']},
+        {'name': 'tags', 'type': "list", 'required': False, 'items': {'type': "int"}},
+    ]
+
+    contexts = [
+        {'id': "1"},
+        {'id': 2, 'price': " ", 'day': "23.11.2018", 'name': " abc ", 'gender': "male", 'tags': ("1", "x")},
+        {'id': "x"},
+        {},
+        {'id': "1", 'name': "abcdef"},
+        {'id': "1", 'day': "2018-11-23"},
+        {'id': "1", 'gender': "other"},
+        {'id': "1", 'unknown': 1},
+    ]
+
+    def setUp(self):
+        self.enabled = CodegenBackend.is_enabled()
+        CodegenBackend.enable()
+
+    def tearDown(self):
+        if not self.enabled:
+            CodegenBackend.disable()
+
+    def run_validate(self, context, sanitize_schema=True):
+        try:
+            return SchemaValidator.validate(context, self.schema, sanitize_schema)
+        except Exception as e:
+            return type(e), str(e)
+
+    def run_interpreted(self, context, sanitize_schema=True):
+        # the interpreted backend without the prepared scheme
+        try:
+            if sanitize_schema:
+                keys = SchemaValidator._SchemaValidator__get_schema_keys(self.schema)
+                SchemaValidator._SchemaValidator__sanitize_schema(context, keys)
+
+            return SchemaValidator._SchemaValidator__transform_context(context, self.schema)
+        except Exception as e:
+            return type(e), str(e)
+
+    def test_same_as_interpreted(self):
+        for sanitize_schema in (True, False):
+            CodegenBackend.enable()
+            generated = [self.run_validate(dict(context), sanitize_schema) for context in self.contexts]
+
+            CodegenBackend.disable()
+            compiled = [self.run_validate(dict(context), sanitize_schema) for context in self.contexts]
+            interpreted = [self.run_interpreted(dict(context), sanitize_schema) for context in self.contexts]
+
+            self.assertEqual(generated, interpreted)
+            self.assertEqual(compiled, interpreted)
+
+    def test_cache(self):
+        # an equal scheme object shares the generated function
+        for schema in (self.schema, list(self.schema)):
+            SchemaValidator.validate(self.contexts[0], schema)
+
+        self.assertEqual(CodegenBackend.info(), {'hits': 1, 'misses': 1, 'maxsize': 256, 'currsize': 1})
+
+        validate = codegen.get_validator(self.schema)
+        self.assertIn("def validate(context, sanitize_schema=True):", validate.source)
+
+        self.schema[0]['required'] = False
+        try:
+            self.assertIsNot(codegen.get_validator(self.schema), validate)
+            self.assertEqual(SchemaValidator.validate({}, self.schema)['id'], None)
+        finally:
+            self.schema[0]['required'] = True
+
+    def test_threads(self):
+        CodegenBackend.enable(maxsize=2)
+        schemas = [[{'name': f'field_{number}', 'type': "int"}] for number in range(8)]
+
+        def validate(number):
+            schema = schemas[number % len(schemas)]
+            return codegen.get_validator(schema)({f'field_{number % len(schemas)}': "1"})
+
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(validate, range(2000)))
+
+        self.assertEqual(results[5], {'field_5': 1})
+        info = CodegenBackend.info()
+        self.assertEqual(info['hits'] + info['misses'], 2000)
+        self.assertLessEqual(info['currsize'], 2)
+
+    def test_fallback(self):
+        schema = [{'name': 'id', 'type': "int"}, {'name': 'id', 'type': "str"}]
+        self.assertIsNone(codegen.get_validator(schema))
+        self.assertEqual(SchemaValidator.validate({'id': "1"}, schema, sanitize_schema=False), {'id': "1"})
+
+        with self.assertRaises(InvalidSchemeError):
+            SchemaValidator.validate({'id': "1"}, schema)
+
+    def test_fingerprint(self):
+        def schema(required):
+            return [{'name': 'id', 'type': "int", 'required': required}]
+
+        self.assertEqual(codegen.fingerprint(schema(True)), codegen.fingerprint(schema(True)))
+        self.assertNotEqual(codegen.fingerprint(schema(True)), codegen.fingerprint(schema(1)))
+        self.assertNotEqual(codegen.fingerprint(schema(True)), codegen.fingerprint(schema("True")))
@@ -0,0 +1,50 @@
+import unittest
+
+from power_dict.utils import DictUtils, CompiledPath
+
+
+class CompilePathTests(unittest.TestCase):
+    properties = {
+        "object2": {
+            "object_2.1": 1,
+            "object_2.2": {
+                "object_2.2.1": "2.1"
+            },
+            "none": None,
+        },
+        "str_2": {
+            "str_3": "qwerty"
+        },
+        "list": [1, 2, 3],
+    }
+
+    def test_compile_path(self):
+        target = DictUtils.compile_path('object2->object_2.2->object_2.2.1', separator="->", data_type="float")
+        self.assertIsInstance(target, CompiledPath)
+        self.assertEqual(target.get(self.properties), 2.1)
+        self.assertEqual(target(self.properties), 2.1)
+        self.assertEqual(target({}), None)
+        self.assertEqual(target(None), None)
+
+        target = DictUtils.compile_path('str_2.str_3')
+        self.assertEqual(target(self.properties), "qwerty")
+
+        target = DictUtils.compile_path('list', data_type="list")
+        self.assertEqual(target(self.properties), [1, 2, 3])
+
+    def test_same_as_get_setting_by_path(self):
+        cases = [
+            ('object2->object_2.2->key_not_found', {'separator': "->", 'data_type': "float", 'default_value': 2.2}),
+            ('object2->none->key', {'separator': "->", 'data_type': "int", 'default_value': "3"}),
+            ('object2..object_2.1', {'data_type': "int", 'default_value': 4}),
+            ('object2. .object_2.1', {'default_value': "5"}),
+            ('object2->object_2.1', {'separator': "->", 'data_type': "int"}),
+            ('', {'default_value': 6}),
+            ('not_found', {'data_type': "str"}),
+        ]
+
+        for path, kwargs in cases:
+            expected = DictUtils.get_setting_by_path(self.properties, path, **kwargs)
+            separator = kwargs.pop('separator', '.')
+            target = DictUtils.compile_path(path, separator, **kwargs)
+            self.assertEqual(target(self.properties), expected, path)
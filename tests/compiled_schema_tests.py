@@ -0,0 +1,116 @@
+import unittest
+from datetime import datetime, date
+from decimal import Decimal
+
+from power_dict.compiled_schema import CompiledSchema
+from power_dict.errors import InvalidSchemeError, NoneParameterError, InvalidParameterError, \
+    NotAllowedParameterError
+from power_dict.schema_validator import SchemaValidator
+
+
+def date_of_birth_validator(value) -> bool:
+    return True
+
+
+class CompiledSchemaTests(unittest.TestCase):
+    schema = [
+        {'name': 'username', 'type': "str", 'required': True, 'description': 'Login',
+         'required_error': 'User login is not specified'},
+        {'name': 'age', 'type': "int", 'required': False, 'description': 'Age',
+         'validators': [lambda v: 0 < v <= 50], 'default_value': 18},
+        {'name': 'body_temperature', 'type': "float", 'required': False, "default_value": 36.6},
+        {'name': 'balance', 'type': "decimal", 'required': True, 'description': 'Credit card balance'},
+        {'name': 'password', 'type': "object", 'required': True, 'description': 'Password'},
+        {'name': 'gender', 'type': "enum", 'required': False, 'choices': ['male', 'female']},
+        {'name': 'date_of_birth', 'type': "date", 'required': False,
+         'validators': [{'f': date_of_birth_validator, 'message': 'date_of_birth invalid'}]},
+        {'name': 'last_login', 'type': "datetime", 'required': False, 'format': '%Y-%m-%d %H:%M:%S'},
+        {'name': 'is_admin', 'type': "bool", 'required': False, "default_value": False},
+        {'name': 'nickname', 'type': "str", 'required': False},
+        {'name': 'roles', 'type': "list", 'required': True, 'unique': True, 'items': {'type': 'str'}},
+    ]
+
+    context = {
+        'username': "login_1",
+        'age': "28",
+        'body_temperature': "36.6",
+        'balance': "1999.99",
+        'password': "********",
+        'gender': " male ",
+        'date_of_birth': "2018-11-23",
+        'last_login': "2018-11-23 01:45:59",
+        'is_admin': "yes",
+        'roles': ["user"],
+    }
+
+    def test_compile(self):
+        compiled = SchemaValidator.compile(self.schema)
+        self.assertIsInstance(compiled, CompiledSchema)
+
+        target = compiled.validate(self.context)
+        self.assertEqual(target, SchemaValidator.validate(self.context, self.schema))
+        self.assertEqual(target['age'], 28)
+        self.assertEqual(target['balance'], Decimal('1999.99'))
+        self.assertEqual(target['gender'], 'male')
+        self.assertEqual(target['date_of_birth'], date(2018, 11, 23))
+        self.assertEqual(target['last_login'], datetime(2018, 11, 23, 1, 45, 59))
+        self.assertEqual(target['nickname'], '')
+
+    def test_reuse(self):
+        compiled = SchemaValidator.compile(self.schema)
+
+        for age in ("1", "20", 49, None):
+            context = dict(self.context, age=age)
+            self.assertEqual(compiled.validate(context), SchemaValidator.validate(context, self.schema))
+
+    def test_errors(self):
+        compiled = SchemaValidator.compile(self.schema)
+        contexts = [
+            dict(self.context, age="-1"),
+            dict(self.context, age="x"),
+            dict(self.context, gender="unknown"),
+            dict(self.context, username=None),
+            dict(self.context, balance=None),
+            dict(self.context, balance="abc"),
+            dict(self.context, last_login="23.11.2018"),
+            dict(self.context, unknown_key=1),
+        ]
+
+        for context in contexts:
+            with self.assertRaises(Exception) as expected:
+                SchemaValidator.validate(context, self.schema)
+
+            with self.assertRaises(type(expected.exception)) as actual:
+                compiled.validate(context)
+
+            self.assertIn(type(actual.exception), (InvalidSchemeError, NoneParameterError, InvalidParameterError,
+                                                   NotAllowedParameterError))
+            self.assertEqual(str(actual.exception), str(expected.exception))
+
+    def test_sanitize_schema(self):
+        compiled = SchemaValidator.compile(self.schema)
+        target = compiled.validate(dict(self.context, unknown_key=1), sanitize_schema=False)
+        self.assertNotIn('unknown_key', target)
+
+    def test_invalid_schema(self):
+        with self.assertRaises(InvalidSchemeError):
+            SchemaValidator.compile([{'name': 'a'}, {'name': 'a'}])
+
+        with self.assertRaises(NoneParameterError):
+            SchemaValidator.compile([{'type': 'str'}])
+
+    def test_empty_schema(self):
+        context = {}
+        self.assertIs(SchemaValidator.compile([]).validate(context), context)
+
+    def test_unparseable_default_value(self):
+        # the default value fails when it is used, as in validate
+        schema = [{'name': 'amount', 'type': "float", 'default_value': [1]}]
+        compiled = SchemaValidator.compile(schema)
+
+        self.assertEqual(compiled.validate({'amount': "2"}), {'amount': 2.0})
+        self.assertEqual(compiled.validate_patch({'amount': 2.0}, {'amount': "3"}), {'amount': 3.0})
+        with self.assertRaisesRegex(InvalidParameterError, 'Parameter "amount" could not be converted to a float'):
+            compiled.validate({})
+        with self.assertRaisesRegex(InvalidParameterError, 'Parameter "amount" could not be converted to a float'):
+            SchemaValidator.validate({}, schema)
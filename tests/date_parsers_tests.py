@@ -0,0 +1,89 @@
+import random
+import unittest
+from datetime import date, datetime
+
+from try_parse.utils import ParseUtils
+
+from power_dict.date_parsers import ParseCache, try_parse_date, try_parse_datetime, compile_format
+from power_dict.utils import DictUtils
+
+
+class DateParsersTests(unittest.TestCase):
+    values = [
+        None, '', '2018-11-23', '2018-1-5', '2018-02-30', '2018-11-23 01:45:59', '2018-11-23T01:45:59',
+        '2018-11-23 24:00:00', '2018-11-23 23:59:60', '23.11.2018', '20181123', ' 2018-11-23', '٢٠١٨-11-23',
+        date(2018, 11, 23), datetime(2018, 11, 23, 1, 45, 59), 20181123,
+    ]
+
+    formats = [None, '%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%Y-%m-%dT%H:%M:%S', '%d.%m.%Y']
+
+    def tearDown(self):
+        ParseCache.disable()
+
+    def assert_same_as_parse_utils(self):
+        for value in self.values:
+            for item_format in self.formats:
+                self.assertEqual(try_parse_date(value, item_format), ParseUtils.try_parse_date(value, item_format),
+                                 (value, item_format))
+                self.assertEqual(try_parse_datetime(value, item_format),
+                                 ParseUtils.try_parse_datetime(value, item_format), (value, item_format))
+
+    def test_same_as_parse_utils(self):
+        self.assert_same_as_parse_utils()
+
+    def test_same_as_parse_utils_with_cache(self):
+        ParseCache.enable()
+        self.assert_same_as_parse_utils()
+        self.assert_same_as_parse_utils()
+
+    def test_compile_format(self):
+        parse = compile_format('%d.%m.%Y %H:%M')
+        self.assertIs(parse, compile_format('%d.%m.%Y %H:%M'))
+        self.assertEqual(parse('23.11.2018 01:45'), datetime(2018, 11, 23, 1, 45))
+        self.assertEqual(parse('3.1.2018 1:45'), datetime(2018, 1, 3, 1, 45))
+
+        with self.assertRaises(ValueError):
+            parse('30.02.2018 01:45')
+
+    def test_fixed_width_formats(self):
+        formats = ['%d.%m.%Y', '%Y%m%d', '%d/%m/%Y %H:%M:%S', '%H:%M', '%m-%d', '%Y-%m-%d %H:%M', '%y-%m-%d',
+                   '%Y-%m-%dT%H:%M:%S', '%d %b %Y']
+        rnd = random.Random(7)
+        alphabet = '0123456789012345678901234567890123456789.:/- T'
+
+        for item_format in formats:
+            sample = datetime(2018, 11, 23, 1, 45, 59).strftime(item_format)
+            values = [sample, ' ' + sample, sample + ' ', sample.replace('1', '')]
+            for _ in range(300):
+                chars = list(sample)
+                for _ in range(rnd.randint(1, 3)):
+                    chars[rnd.randrange(len(chars))] = rnd.choice(alphabet)
+                values.append(''.join(chars))
+
+            for value in values:
+                self.assertEqual(try_parse_datetime(value, item_format),
+                                 ParseUtils.try_parse_datetime(value, item_format), (value, item_format))
+                self.assertEqual(try_parse_date(value, item_format),
+                                 ParseUtils.try_parse_date(value, item_format), (value, item_format))
+
+    def test_cache(self):
+        self.assertFalse(ParseCache.is_enabled())
+        self.assertEqual(ParseCache.info()['hits'], 0)
+
+        ParseCache.enable(maxsize=2)
+        self.assertTrue(ParseCache.is_enabled())
+
+        properties = {'date': '2018-11-23', 'datetime': '23.11.2018 01:45'}
+        for _ in range(3):
+            target = DictUtils.get_date_dict_property(properties, 'date')
+            self.assertEqual(target, date(2018, 11, 23))
+            target = DictUtils.get_datetime_dict_property(properties, 'datetime', format='%d.%m.%Y %H:%M')
+            self.assertEqual(target, datetime(2018, 11, 23, 1, 45))
+
+        self.assertEqual(ParseCache.info(), {'hits': 4, 'misses': 2, 'maxsize': 2, 'currsize': 2})
+
+        try_parse_date('2018-11-24')
+        self.assertEqual(ParseCache.info()['currsize'], 2)
+
+        ParseCache.clear()
+        self.assertEqual(ParseCache.info(), {'hits': 0, 'misses': 0, 'maxsize': 2, 'currsize': 0})
@@ -33,3 +33,16 @@ class GetListDictPropertyTests(unittest.TestCase):
 
         with self.assertRaises(NoneParameterError):
             DictUtils.get_required_list_dict_property(self.properties, 'key_not_found')
+
+    def test_copy(self):
+        target = DictUtils.get_list_dict_property(self.properties, 'property_1', copy=False)
+        self.assertIs(target, self.properties['property_1'])
+
+        target = DictUtils.get_list_dict_property(self.properties, 'property_1')
+        self.assertIsNot(target, self.properties['property_1'])
+
+        target = DictUtils.get_required_list_dict_property(self.properties, 'property_1', copy=False)
+        self.assertIs(target, self.properties['property_1'])
+
+        target = DictUtils.get_required_list_dict_property({'property': (1, 2)}, 'property', copy=False)
+        self.assertEqual(target, [1, 2])
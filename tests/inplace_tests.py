@@ -0,0 +1,53 @@
+import unittest
+
+from power_dict.errors import InvalidParameterError
+from power_dict.schema_validator import SchemaValidator
+
+
+class InplaceTests(unittest.TestCase):
+    schema = [
+        {'name': 'id', 'type': "int", 'required': True, 'aliases': ['uid']},
+        {'name': 'price', 'type': "float"},
+        {'name': 'tags', 'type': "list", 'copy': False},
+        {'name': 'sizes', 'type': "list", 'items': {'type': "int"}, 'copy': False},
+        {'name': 'codes', 'type': "list", 'items': {'type': "int"}},
+    ]
+
+    def test_inplace(self):
+        context = {'uid': "1", 'price': "2.5", 'other': 1}
+        result = SchemaValidator.validate(context, self.schema, sanitize_schema=False, inplace=True)
+
+        self.assertIs(result, context)
+        self.assertEqual(context, SchemaValidator.validate({'id': "1", 'price': "2.5"}, self.schema))
+
+    def test_not_changed_on_error(self):
+        context = {'id': "1", 'price': "x"}
+        with self.assertRaises(InvalidParameterError):
+            SchemaValidator.validate(context, self.schema, inplace=True)
+
+        self.assertEqual(context, {'id': "1", 'price': "x"})
+
+        result = SchemaValidator.validate(context, self.schema, collect_errors=True, inplace=True)
+        self.assertFalse(result.is_valid)
+        self.assertEqual(context, {'id': "1", 'price': "x"})
+
+        context['price'] = "1"
+        result = SchemaValidator.validate(context, self.schema, collect_errors=True, inplace=True)
+        self.assertIs(result.data, context)
+        self.assertEqual(context['price'], 1.0)
+
+    def test_copy(self):
+        tags = ["a", "b"]
+        sizes = [1, 2]
+        codes = [1, 2]
+        result = SchemaValidator.validate({'id': 1, 'tags': tags, 'sizes': sizes, 'codes': codes}, self.schema)
+
+        self.assertIs(result['tags'], tags)
+        self.assertIs(result['sizes'], sizes)
+        self.assertIsNot(result['codes'], codes)
+        self.assertEqual(result['codes'], codes)
+
+        sizes = [1, "2"]
+        result = SchemaValidator.validate({'id': 1, 'sizes': sizes}, self.schema)
+        self.assertIsNot(result['sizes'], sizes)
+        self.assertEqual(result['sizes'], [1, 2])
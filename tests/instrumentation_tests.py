@@ -0,0 +1,76 @@
+import unittest
+
+from power_dict.date_parsers import ParseCache
+from power_dict.errors import InvalidParameterError, InvalidSchemeError
+from power_dict.instrumentation import Instrumentation, StatsCollector
+from power_dict.schema_validator import SchemaValidator
+from power_dict.utils import DictUtils
+
+
+class InstrumentationTests(unittest.TestCase):
+    schema = [
+        {'name': 'id', 'type': "int", 'required': True, 'validators': [lambda v: v > 0]},
+        {'name': 'day', 'type': "date", 'required': False},
+        {'name': 'name', 'type': "str", 'required': False},
+    ]
+
+    def setUp(self):
+        self.collector = StatsCollector()
+        Instrumentation.install(self.collector)
+
+    def tearDown(self):
+        Instrumentation.uninstall()
+        ParseCache.disable()
+
+    def test_validate(self):
+        context = {'id': "1", 'day': "2018-11-23"}
+        self.assertEqual(SchemaValidator.validate(context, self.schema),
+                         SchemaValidator.compile(self.schema).validate(context))
+
+        stats = self.collector.snapshot()
+        self.assertEqual(stats['conversions']['id']['count'], 2)
+        self.assertEqual(stats['conversions']['name']['count'], 2)
+        self.assertEqual(stats['validations']['id']['count'], 2)
+        self.assertNotIn('day', stats['validations'])
+        self.assertGreater(stats['conversions']['day']['total'], 0)
+
+    def test_failures(self):
+        with self.assertRaises(InvalidParameterError):
+            SchemaValidator.validate({'id': "x"}, self.schema)
+
+        with self.assertRaises(InvalidSchemeError):
+            SchemaValidator.validate({'id': "-1"}, self.schema)
+
+        with self.assertRaises(InvalidParameterError):
+            DictUtils.get_value({'key': "x"}, 'key', data_type="float")
+
+        self.assertEqual(self.collector.snapshot()['failures'], {
+            ('id', 'InvalidParameterError'): 1,
+            ('id', 'InvalidSchemeError'): 1,
+            ('key', 'InvalidParameterError'): 1,
+        })
+
+    def test_get_value(self):
+        self.assertEqual(DictUtils.get_value({'key': "1"}, 'key', data_type="int"), 1)
+        self.assertEqual(DictUtils.get_required_value({'key': "1"}, 'key', data_type="int"), 1)
+        self.assertEqual(self.collector.snapshot()['conversions']['key']['count'], 2)
+
+    def test_cache(self):
+        ParseCache.enable()
+        for _ in range(3):
+            DictUtils.get_date_dict_property({'day': "2018-11-23"}, 'day')
+
+        self.assertEqual(self.collector.snapshot()['caches'], {'date_parse': {'hits': 2, 'misses': 1}})
+
+    def test_uninstall(self):
+        Instrumentation.uninstall()
+        self.assertIsNone(Instrumentation.get_collector())
+        SchemaValidator.validate({'id': "1"}, self.schema)
+        self.assertEqual(self.collector.snapshot()['conversions'], {})
+
+    def test_invalid_scheme(self):
+        schema = [{'name': 'id', 'type': "int"}, {'name': 'id', 'type': "int"}]
+        self.assertEqual(SchemaValidator.validate({'id': "1"}, schema, sanitize_schema=False), {'id': 1})
+
+        with self.assertRaises(InvalidSchemeError):
+            SchemaValidator.validate({'id': "1"}, schema)
@@ -0,0 +1,99 @@
+import random
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+
+from try_parse.utils import ParseUtils
+
+from power_dict import columnar
+from power_dict.errors import InvalidSchemeError
+from power_dict.internal_validators import items_list
+from power_dict.schema_validator import SchemaValidator
+
+
+class ItemsListTests(unittest.TestCase):
+    parsers = {
+        "int": ParseUtils.try_parse_int,
+        "float": ParseUtils.try_parse_float,
+        "decimal": ParseUtils.try_parse_decimal,
+        "bool": ParseUtils.try_parse_bool,
+        "date": ParseUtils.try_parse_date,
+        "datetime": ParseUtils.try_parse_datetime,
+    }
+
+    values = [None, '', ' 1 ', '007', '1.5', '-2', 'x', 'yes', 'F', '1e3', 'inf', 3, 4.0, 2.7, True, Decimal('1.5'),
+              '2018-11-23', '2018-11-23 01:45:59', '2018-02-30', date(2018, 1, 1), datetime(2018, 1, 1, 1, 1)]
+
+    @staticmethod
+    def parse_item(parse):
+        def parse_item(item):
+            try:
+                return parse(item)
+            except (TypeError, OverflowError):
+                return False, None
+
+        return parse_item
+
+    def test_same_as_try_parse(self):
+        rnd = random.Random(11)
+        for item_type, parse in self.parsers.items():
+            for _ in range(200):
+                value = [rnd.choice(self.values) for _ in range(rnd.randint(0, 8))]
+                expected = [result if status else None for status, result in map(self.parse_item(parse), value)]
+                target = items_list({'items': {'type': item_type}}, value)
+                self.assertEqual(target, expected, (item_type, value))
+                self.assertEqual([type(v) for v in target], [type(v) for v in expected], (item_type, value))
+
+    def test_containers(self):
+        value = ['1', [2], {'x': 1}, 3]
+        self.assertEqual(items_list({'items': {'type': "int"}}, value), [1, None, None, 3])
+        self.assertEqual(items_list({'items': {'type': "float"}}, value), [1.0, None, None, 3.0])
+
+    def test_homogeneous(self):
+        value = [str(i) for i in range(1000)]
+        self.assertEqual(items_list({'items': {'type': "int"}}, value), list(range(1000)))
+        self.assertEqual(items_list({'items': {'type': "float"}}, value), [float(i) for i in range(1000)])
+
+    def test_str_and_unknown(self):
+        value = [1, None, 'a']
+        self.assertEqual(items_list({'items': {'type': "str"}}, value), ['1', 'None', 'a'])
+
+        target = items_list({'items': {'type': "unknown"}}, value)
+        self.assertEqual(target, value)
+        self.assertIsNot(target, value)
+
+    def test_enum(self):
+        items = {'type': "enum", 'choices': ['a', 'b', 1]}
+        self.assertEqual(items_list({'items': items}, ['a', None, 1, True]), ['a', None, 1, True])
+
+        with self.assertRaises(InvalidSchemeError) as e:
+            items_list({'items': items}, ['a', 'c'])
+
+        self.assertEqual(str(e.exception), "The value 'c' is not available for selection. Possible options: ['a', 'b', 1]")
+
+        with self.assertRaises(InvalidSchemeError):
+            items_list({'items': items}, [['a']])
+
+    def test_input_is_not_changed(self):
+        schema = [{'name': 'ids', 'type': "list", 'items': {'type': "int"}}]
+        value = ['1', '2']
+        target = SchemaValidator.compile(schema).validate({'ids': value})
+        self.assertEqual(target['ids'], [1, 2])
+        self.assertEqual(value, ['1', '2'])
+
+    @unittest.skipIf(columnar.numpy is None, "NumPy is not installed")
+    def test_numpy_arrays(self):
+        numpy = columnar.numpy
+        schema = [
+            {'name': 'ids', 'type': "list", 'items': {'type': "int"}},
+            {'name': 'amounts', 'type': "list", 'items': {'type': "float"}},
+            {'name': 'flags', 'type': "list", 'items': {'type': "bool"}},
+        ]
+        context = {'ids': numpy.arange(5), 'amounts': numpy.arange(5, dtype=numpy.float32) / 3,
+                   'flags': numpy.array([1, 0, 2])}
+
+        target = SchemaValidator.compile(schema).validate(context)
+        self.assertEqual(target, SchemaValidator.validate(context, schema))
+        self.assertEqual(target['ids'], [0, 1, 2, 3, 4])
+        self.assertIs(type(target['amounts'][1]), float)
+        self.assertEqual(target['flags'], [True, False, None])
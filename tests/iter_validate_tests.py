@@ -0,0 +1,67 @@
+import io
+import types
+import unittest
+
+from power_dict.errors import InvalidParameterError, NoneParameterError, NotAllowedParameterError
+from power_dict.schema_validator import SchemaValidator
+
+
+class IterValidateTests(unittest.TestCase):
+    schema = [
+        {'name': 'id', 'type': "int", 'required': True},
+        {'name': 'name', 'type': "str", 'required': False},
+    ]
+
+    lines = '\n'.join([
+        '{"id": "1", "name": "first"}',
+        '{"id": "x"}',
+        '',
+        '{"name": "third"}',
+        '{"id": 4, "extra": 1}',
+        'not a json',
+        '[1, 2]',
+        '{"id": 8}',
+    ])
+
+    def test_json_lines(self):
+        errors = []
+        target = SchemaValidator.iter_validate(io.StringIO(self.lines), self.schema,
+                                               error_sink=lambda line, e: errors.append((line, e)))
+        self.assertIsInstance(target, types.GeneratorType)
+        self.assertEqual(list(target), [{'id': 1, 'name': 'first'}, {'id': 8, 'name': ''}])
+
+        self.assertEqual([line for line, _ in errors], [2, 4, 5, 6, 7])
+        self.assertIsInstance(errors[0][1], InvalidParameterError)
+        self.assertIsInstance(errors[1][1], NoneParameterError)
+        self.assertIsInstance(errors[2][1], NotAllowedParameterError)
+        self.assertIsInstance(errors[3][1], InvalidParameterError)
+        self.assertIsInstance(errors[4][1], InvalidParameterError)
+
+    def test_container_values(self):
+        errors = []
+        source = io.StringIO('{"id": 1}\n{"id": [2]}\n{"id": {"x": 1}}\n{"id": 3}\n')
+        target = SchemaValidator.iter_validate(source, self.schema, error_sink=lambda line, e: errors.append((line, e)))
+        self.assertEqual([item['id'] for item in target], [1, 3])
+
+        self.assertEqual([line for line, _ in errors], [2, 3])
+        self.assertIsInstance(errors[0][1], InvalidParameterError)
+        self.assertIsInstance(errors[1][1], InvalidParameterError)
+
+    def test_bytes_lines(self):
+        source = io.BytesIO(b'{"id": "1"}\n{"id": "2"}\n')
+        target = SchemaValidator.iter_validate(source, self.schema)
+        self.assertEqual([item['id'] for item in target], [1, 2])
+
+    def test_dicts(self):
+        source = ({'id': str(i)} for i in range(1000))
+        compiled = SchemaValidator.compile(self.schema)
+        target = compiled.iter_validate(source)
+        self.assertEqual(next(target), {'id': 0, 'name': ''})
+        self.assertEqual(sum(1 for _ in target), 999)
+
+    def test_without_error_sink(self):
+        target = SchemaValidator.iter_validate(io.StringIO(self.lines), self.schema)
+        self.assertEqual(next(target)['id'], 1)
+
+        with self.assertRaises(InvalidParameterError):
+            next(target)
@@ -0,0 +1,63 @@
+import unittest
+
+from power_dict.codegen import CodegenBackend
+from power_dict.errors import InvalidSchemeError, NotAllowedParameterError
+from power_dict.schema_validator import SchemaValidator
+
+
+class KeyAliasesTests(unittest.TestCase):
+    schema = [
+        {'name': 'user_id', 'type': "int", 'required': True, 'aliases': ['uid']},
+        {'name': 'created_at', 'type': "date", 'format': '%d.%m.%Y'},
+        {'name': 'address', 'type': "dict", 'schema': [{'name': 'zip_code', 'type': "str", 'aliases': 'zip'}]},
+    ]
+
+    def validate(self, context, **kwargs):
+        results = []
+        for enabled in (False, True):
+            if enabled:
+                CodegenBackend.enable()
+            try:
+                results.append(SchemaValidator.validate(dict(context), self.schema, **kwargs))
+            finally:
+                CodegenBackend.disable()
+
+        self.assertEqual(results[0], results[1])
+        return results[0]
+
+    def test_aliases(self):
+        self.assertEqual(self.validate({'uid': "1", 'address': {'zip': "101000"}}),
+                         {'user_id': 1, 'created_at': None, 'address': {'zip_code': "101000"}})
+        self.assertEqual(self.validate({'uid': "1", 'user_id': "2"})['user_id'], 2)
+
+        with self.assertRaises(NotAllowedParameterError):
+            self.validate({'uid': "1", 'userId': "2"})
+
+    def test_key_policy(self):
+        context = {'userId': "1", 'createdAt': "01.02.2020"}
+        self.assertEqual(self.validate(context, key_policy='camel'),
+                         self.validate({'user_id': "1", 'created_at': "01.02.2020"}))
+
+        result = self.validate({'user-id': "1", 'CreatedAt': "01.02.2020"}, key_policy=('kebab', 'pascal'))
+        self.assertEqual(result['user_id'], 1)
+        self.assertEqual(result['created_at'].year, 2020)
+
+        result = self.validate({'user-id': "1", 'CreatedAt': "01.02.2020"}, key_policy=['kebab', 'pascal'])
+        self.assertEqual(result['user_id'], 1)
+        self.assertEqual(result['created_at'].year, 2020)
+
+        self.assertEqual(self.validate({'USER_ID': 3}, key_policy=str.upper)['user_id'], 3)
+
+        with self.assertRaisesRegex(InvalidSchemeError, "Unknown key policy 'snake'"):
+            self.validate(context, key_policy='snake')
+
+        with self.assertRaisesRegex(InvalidSchemeError, "The parameter 'uid' is repeated"):
+            SchemaValidator.compile(self.schema + [{'name': 'uid'}])
+
+    def test_strip_unknown(self):
+        self.assertEqual(self.validate({'uid': "1", 'other': 1}, strip_unknown=True)['user_id'], 1)
+        self.assertEqual(SchemaValidator.validate({'other': 1}, [], strip_unknown=True), {})
+
+        result = SchemaValidator.validate({'uid': "1", 'other': 1}, self.schema, collect_errors=True,
+                                          strip_unknown=True)
+        self.assertTrue(result.is_valid)
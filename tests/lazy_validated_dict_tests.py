@@ -0,0 +1,79 @@
+import unittest
+
+from power_dict.errors import InvalidParameterError, NoneParameterError, NotAllowedParameterError
+from power_dict.results import LazyValidatedDict
+from power_dict.schema_validator import SchemaValidator
+
+
+class LazyValidatedDictTests(unittest.TestCase):
+    def setUp(self):
+        self.checked = []
+        self.schema = [
+            {'name': 'id', 'type': "int", 'required': True},
+            {'name': 'price', 'type': "decimal", 'default_value': "0.5"},
+            {'name': 'name', 'type': "str", 'validators': [self.check]},
+            {'name': 'tags', 'type': "list", 'items': {'type': "int"}, 'unique': True},
+        ]
+
+    def check(self, value):
+        self.checked.append(value)
+        return True
+
+    def test_convert_on_access(self):
+        context = {'id': "1", 'name': " abc ", 'tags': ["1", "1"]}
+        result = SchemaValidator.validate_lazy(context, self.schema)
+
+        self.assertIsInstance(result, LazyValidatedDict)
+        self.assertEqual(list(result), ['id', 'price', 'name', 'tags'])
+        self.assertEqual(len(result), 4)
+        self.assertIn('name', result)
+        self.assertNotIn('other', result)
+        self.assertEqual(self.checked, [])
+
+        context['id'] = "2"
+        self.assertEqual(result['id'], 1)
+        self.assertEqual(result['name'], "abc")
+        self.assertEqual(result['name'], "abc")
+        self.assertEqual(self.checked, ["abc"])
+        self.assertEqual(repr(result), "LazyValidatedDict(fields=4, converted=2)")
+
+        self.assertEqual(result.materialize(), SchemaValidator.validate({'id': "1", 'name': " abc ", 'tags': ["1", "1"]},
+                                                                        self.schema))
+        self.assertEqual(self.checked, ["abc", "abc"])
+
+        with self.assertRaises(KeyError):
+            result['other']
+
+    def test_errors(self):
+        with self.assertRaises(NotAllowedParameterError):
+            SchemaValidator.validate_lazy({'id': 1, 'other': 1}, self.schema)
+
+        with self.assertRaisesRegex(NoneParameterError, 'Parameter "id" is none'):
+            SchemaValidator.validate_lazy({'price': "x"}, self.schema)
+
+        result = SchemaValidator.validate_lazy({'id': 1, 'price': "x"}, self.schema)
+        self.assertEqual(result['id'], 1)
+
+        with self.assertRaisesRegex(InvalidParameterError, 'Parameter "price" could not be converted to a decimal'):
+            result['price']
+
+        with self.assertRaises(InvalidParameterError):
+            result.materialize()
+
+    def test_blank_required(self):
+        # the same error as validate for a blank required str or enum
+        schema = [
+            {'name': 'name', 'type': "str", 'required': True},
+            {'name': 'kind', 'type': "enum", 'required': True, 'choices': ['a'], 'required_error': "kind is required"},
+        ]
+
+        for context in [{'name': "", 'kind': "a"}, {'name': "  ", 'kind': "a"}]:
+            with self.assertRaisesRegex(NoneParameterError, 'Parameter "name" is none'):
+                SchemaValidator.validate(context, schema)
+            with self.assertRaisesRegex(NoneParameterError, 'Parameter "name" is none'):
+                SchemaValidator.validate_lazy(context, schema)
+
+        with self.assertRaisesRegex(NoneParameterError, "^kind is required$"):
+            SchemaValidator.validate_lazy({'name': "x", 'kind': " "}, schema)
+
+        self.assertEqual(SchemaValidator.validate_lazy({'name': " x ", 'kind': "a"}, schema)['name'], " x ")
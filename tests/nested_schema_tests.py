@@ -0,0 +1,130 @@
+import unittest
+
+from power_dict import compiled_schema
+from power_dict.compiled_schema import convert_nested, convert_nested_items
+from power_dict.errors import InvalidParameterError, NoneParameterError, NotAllowedParameterError, \
+    InvalidSchemeError
+from power_dict.results import FieldError
+from power_dict.schema_validator import SchemaValidator
+
+
+class NestedSchemaTests(unittest.TestCase):
+    schema = [
+        {'name': 'id', 'type': "int", 'required': True},
+        {'name': 'address', 'type': "dict", 'required': False, 'schema': [
+            {'name': 'city', 'type': "str", 'required': True},
+            {'name': 'zip', 'type': "int", 'required': False},
+        ]},
+        {'name': 'orders', 'type': "list", 'required': True, 'items': {'type': "dict", 'schema': [
+            {'name': 'price', 'type': "float", 'required': True, 'validators': [lambda v: v > 0]},
+            {'name': 'lines', 'type': "list", 'required': False, 'items': {'type': "dict", 'schema': [
+                {'name': 'sku', 'type': "str", 'required': True},
+            ]}},
+        ]}},
+    ]
+
+    def orders(self, size=20):
+        return [{'price': str(i + 1), 'lines': [{'sku': f"sku-{i}"}]} for i in range(size)]
+
+    def validate(self, context):
+        target = SchemaValidator.validate(context, self.schema)
+        self.assertEqual(SchemaValidator.compile(self.schema).validate(context), target)
+        return target
+
+    def assert_raises(self, error, message, context):
+        for validate in (SchemaValidator.validate, SchemaValidator.compile(self.schema).validate):
+            with self.assertRaises(error) as e:
+                validate(context, self.schema) if validate is SchemaValidator.validate else validate(context)
+
+            self.assertEqual(str(e.exception), message)
+
+    def test_valid(self):
+        target = self.validate({'id': "1", 'address': {'city': "Moscow", 'zip': " 101000 "}, 'orders': self.orders()})
+        self.assertEqual(target['address'], {'city': "Moscow", 'zip': 101000})
+        self.assertEqual(target['orders'][3], {'price': 4.0, 'lines': [{'sku': "sku-3"}]})
+
+        target = self.validate({'id': "1", 'orders': []})
+        self.assertIsNone(target['address'])
+
+    def test_error_paths(self):
+        orders = self.orders()
+        orders[17]['price'] = "x"
+        self.assert_raises(InvalidParameterError, 'orders[17].price: Parameter "price" could not be converted to a float',
+                           {'id': "1", 'orders': orders})
+
+        orders = self.orders()
+        orders[2]['lines'].append({})
+        self.assert_raises(NoneParameterError, 'orders[2].lines[1].sku: Parameter "sku" is none',
+                           {'id': "1", 'orders': orders})
+
+        orders = self.orders()
+        orders[0]['price'] = "-1"
+        self.assert_raises(InvalidSchemeError,
+                           "orders[0].price: The parameter 'price does not match the specified condition",
+                           {'id': "1", 'orders': orders})
+
+        self.assert_raises(NotAllowedParameterError, "address.street: The parameter 'street' is not allowed",
+                           {'id': "1", 'address': {'city': "Moscow", 'street': "Tverskaya"}, 'orders': []})
+
+        self.assert_raises(InvalidParameterError, 'Parameter "address" could not be converted to a dict',
+                           {'id': "1", 'address': "Moscow", 'orders': []})
+
+        self.assert_raises(InvalidParameterError, 'orders[1]: The item could not be converted to a dict',
+                           {'id': "1", 'orders': [{'price': "1"}, "2"]})
+
+    def test_collect_errors(self):
+        orders = self.orders()
+        orders[3]['price'] = "x"
+        orders[5]['lines'] = [{'sku': "a"}, {}]
+        target = SchemaValidator.validate({'id': "1", 'address': {'zip': "x"}, 'orders': orders}, self.schema,
+                                          collect_errors=True)
+        self.assertEqual([(e.field, e.code) for e in target.errors], [
+            ('address.city', FieldError.REQUIRED),
+            ('address.zip', FieldError.INVALID),
+            ('orders[3].price', FieldError.INVALID),
+            ('orders[5].lines[1].sku', FieldError.REQUIRED),
+        ])
+        self.assertEqual(target.data, {'id': 1})
+
+    def test_nested_sanitize(self):
+        schema = [{'name': 'meta', 'type': "dict", 'sanitize_schema': False, 'schema': [
+            {'name': 'version', 'type': "int", 'required': True}]}]
+        target = SchemaValidator.validate({'meta': {'version': "2", 'extra': 1}}, schema)
+        self.assertEqual(target, {'meta': {'version': 2}})
+
+    def test_prepared_once(self):
+        address = {'name': 'address', 'type': "dict", 'schema': [{'name': 'zip', 'type': "int"}]}
+        orders = {'name': 'orders', 'type': "list",
+                  'items': {'type': "dict", 'schema': [{'name': 'price', 'type': "float"}]}}
+
+        self.assertEqual(convert_nested(address, {'zip': "1"}), {'zip': 1})
+        self.assertEqual(convert_nested_items(orders, [{'price': "1"}]), [{'price': 1.0}])
+        prepared = {key: entry[2] for key, entry in compiled_schema._nested.items()}
+
+        convert_nested(address, {'zip': "2"})
+        convert_nested_items(orders, [{'price': "2"}])
+        self.assertEqual({key: entry[2] for key, entry in compiled_schema._nested.items()}, prepared)
+
+        # a replaced value of the nested scheme is detected
+        address['schema'][0]['type'] = "str"
+        orders['items']['schema'].append({'name': 'count', 'type': "int", 'required': True})
+        self.assertEqual(convert_nested(address, {'zip': 2}), {'zip': "2"})
+        with self.assertRaises(NoneParameterError):
+            convert_nested_items(orders, [{'price': "2"}])
+
+        # the first replaced list is freed, so its id may be reused by the second one
+        address['schema'][0].update(type="enum", choices=['a'])
+        self.assertEqual(convert_nested(address, {'zip': "a"}), {'zip': "a"})
+        address['schema'][0]['choices'] = ['p', 'q']
+        address['schema'][0]['choices'] = ['x', 'y']
+        self.assertEqual(convert_nested(address, {'zip': "x"}), {'zip': "x"})
+
+        # an in-place change of a nested list is seen after invalidate
+        address['schema'][0].update(type="enum", choices=['a'])
+        convert_nested(address, {'zip': "a"})
+        address['schema'][0]['choices'].append('b')
+        with self.assertRaises(InvalidSchemeError):
+            convert_nested(address, {'zip': "b"})
+
+        SchemaValidator.invalidate()
+        self.assertEqual(convert_nested(address, {'zip': "b"}), {'zip': "b"})
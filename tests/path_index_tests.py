@@ -0,0 +1,83 @@
+import unittest
+
+from power_dict.path_index import PathIndex
+from power_dict.utils import DictUtils
+
+
+class PathIndexTests(unittest.TestCase):
+    def properties(self):
+        return {
+            "object2": {
+                "object_2.1": 1,
+                "object_2.2": {
+                    "object_2.2.1": "2.1"
+                },
+                "none": None,
+                "": {"a": 1},
+            },
+            "str_2": {
+                "str_3": "qwerty"
+            },
+            "list": [1, 2, 3],
+            "flags": {"tenant": {"enabled": "yes"}},
+        }
+
+    paths = [
+        ('object2.object_2.1', {'data_type': "int"}),
+        ('object2.object_2.2.object_2.2.1', {'data_type': "float"}),
+        ('object2->object_2.2->object_2.2.1', {'separator': "->", 'data_type': "float"}),
+        ('object2.none.key', {'data_type': "int", 'default_value': "3"}),
+        ('object2..a', {'default_value': 4}),
+        ('str_2.str_3', {}),
+        ('str_2', {'data_type': "object"}),
+        ('list', {'data_type': "list"}),
+        ('list.0', {'default_value': 5}),
+        ('flags.tenant.enabled', {'data_type': "bool"}),
+        ('flags.tenant.unknown', {'data_type': "bool", 'default_value': False}),
+        ('', {}),
+    ]
+
+    def assert_same_as_get_setting_by_path(self, index, properties):
+        for path, kwargs in self.paths:
+            self.assertEqual(index.get(path, **kwargs), DictUtils.get_setting_by_path(properties, path, **kwargs),
+                             path)
+
+    def test_get(self):
+        properties = self.properties()
+        index = PathIndex(properties)
+        self.assert_same_as_get_setting_by_path(index, properties)
+        self.assertEqual(index.get('flags.tenant.enabled', data_type="bool"), True)
+        self.assertIn('flags.tenant', index)
+        self.assertNotIn('object2.object_2.2', index)
+        self.assertEqual(len(index), 7)
+
+        index = PathIndex(properties, separator="->")
+        self.assertEqual(index.get('object2->object_2.2->object_2.2.1', data_type="float"), 2.1)
+
+    def test_invalidate(self):
+        properties = self.properties()
+        index = PathIndex(properties)
+
+        properties['flags']['tenant'] = {'enabled': 'no', 'limit': '10'}
+        self.assertEqual(index.get('flags.tenant.enabled', data_type="bool"), True)
+
+        index.invalidate('flags.tenant')
+        self.assertEqual(index.get('flags.tenant.enabled', data_type="bool"), False)
+        self.assertEqual(index.get('flags.tenant.limit', data_type="int"), 10)
+
+        del properties['str_2']
+        properties['new'] = {'key': 'value'}
+        index.invalidate('str_2')
+        index.invalidate('new')
+        index.invalidate('missing.key')
+        self.assert_same_as_get_setting_by_path(index, properties)
+        self.assertEqual(index.get('new.key'), 'value')
+
+        properties['object2'] = None
+        index.invalidate()
+        self.assert_same_as_get_setting_by_path(index, properties)
+
+    def test_memory_usage(self):
+        index = PathIndex(self.properties())
+        self.assertGreater(index.memory_usage(), 0)
+        self.assertLess(PathIndex({}).memory_usage(), index.memory_usage())
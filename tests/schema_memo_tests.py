@@ -0,0 +1,76 @@
+import unittest
+
+from power_dict import schema_validator
+from power_dict.errors import InvalidSchemeError, NoneParameterError
+from power_dict.schema_validator import SchemaValidator
+
+
+class SchemaMemoTests(unittest.TestCase):
+    def setUp(self):
+        SchemaValidator.invalidate()
+        self.schema = [
+            {'name': 'id', 'type': "int", 'required': True},
+            {'name': 'kind', 'type': "enum", 'choices': ['a', 'b']},
+        ]
+
+    def test_prepared_once(self):
+        SchemaValidator.validate({'id': "1"}, self.schema)
+        prepared = schema_validator._prepared[id(self.schema)]
+
+        self.assertEqual(SchemaValidator.validate({'id': "2", 'kind': 'b'}, self.schema), {'id': 2, 'kind': 'b'})
+        self.assertIs(schema_validator._prepared[id(self.schema)], prepared)
+
+    def test_changed_schema(self):
+        SchemaValidator.validate({'id': "1"}, self.schema)
+
+        self.schema[0]['required'] = False
+        self.assertEqual(SchemaValidator.validate({}, self.schema), {'id': None, 'kind': None})
+
+        self.schema.append({'name': 'name', 'type': "str", 'required': True})
+        with self.assertRaises(NoneParameterError):
+            SchemaValidator.validate({}, self.schema)
+
+        self.schema[1] = {'name': 'kind', 'type': "str"}
+        self.assertEqual(SchemaValidator.validate({'kind': 'c', 'name': 'x'}, self.schema),
+                         {'id': None, 'kind': 'c', 'name': 'x'})
+
+    def test_replaced_value(self):
+        schema = [{'name': 'c', 'type': "enum", 'choices': ['a', 'b']}]
+        self.assertEqual(SchemaValidator.validate({'c': 'a'}, schema), {'c': 'a'})
+
+        # the first replaced list is freed, so its id may be reused by the second one
+        schema[0]['choices'] = ['p', 'q']
+        schema[0]['choices'] = ['x', 'y']
+        self.assertEqual(SchemaValidator.validate({'c': 'x'}, schema), {'c': 'x'})
+
+        schema[0]['required'] = 1
+        self.assertEqual(SchemaValidator.validate({'c': 'y'}, schema), {'c': 'y'})
+        schema[0]['required'] = True
+        with self.assertRaises(NoneParameterError):
+            SchemaValidator.validate({}, schema)
+
+    def test_invalidate(self):
+        SchemaValidator.validate({'kind': 'a', 'id': 1}, self.schema)
+
+        # in-place change of a nested list is not detected
+        self.schema[1]['choices'].append('c')
+        with self.assertRaises(InvalidSchemeError):
+            SchemaValidator.validate({'kind': 'c', 'id': 1}, self.schema)
+
+        SchemaValidator.invalidate(self.schema)
+        self.assertEqual(SchemaValidator.validate({'kind': 'c', 'id': 1}, self.schema), {'id': 1, 'kind': 'c'})
+
+    def test_bounded(self):
+        for number in range(schema_validator._PREPARED_MAXSIZE + 10):
+            schema = [{'name': 'id', 'type': "int", 'default_value': number}]
+            self.assertEqual(SchemaValidator.validate({}, schema), {'id': number})
+
+        self.assertEqual(len(schema_validator._prepared), schema_validator._PREPARED_MAXSIZE)
+
+    def test_not_compiled(self):
+        schema = [{'name': 'id', 'type': "int"}, {'name': 'id', 'type': "str"}]
+        for _ in range(2):
+            self.assertEqual(SchemaValidator.validate({'id': "1"}, schema, sanitize_schema=False), {'id': "1"})
+
+            with self.assertRaises(InvalidSchemeError):
+                SchemaValidator.validate({'id': "1"}, schema)
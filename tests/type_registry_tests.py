@@ -0,0 +1,92 @@
+import unittest
+import uuid
+
+from power_dict.codegen import CodegenBackend
+from power_dict.errors import InvalidParameterError, InvalidSchemeError, NoneParameterError
+from power_dict.schema_validator import SchemaValidator
+from power_dict.utils import DictUtils, TypeRegistry
+
+
+def try_parse_uuid(value):
+    return True, uuid.UUID(str(value))
+
+
+class TypeRegistryTests(unittest.TestCase):
+    value = uuid.UUID('12345678-1234-5678-1234-567812345678')
+
+    schema = [
+        {'name': 'id', 'type': "uuid", 'required': True},
+        {'name': 'parent', 'type': "uuid", 'default_value': '12345678-1234-5678-1234-567812345678'},
+        {'name': 'children', 'type': "list", 'items': {'type': "uuid"}, 'copy': False},
+    ]
+
+    def setUp(self):
+        TypeRegistry.register('uuid', try_parse_uuid, uuid.UUID, noun="an uuid")
+
+    def tearDown(self):
+        TypeRegistry.unregister()
+
+    def test_get_value(self):
+        properties = {'id': str(self.value), 'same': self.value, 'empty': " ", 'invalid': "x"}
+
+        self.assertEqual(DictUtils.get_value(properties, 'id', data_type="uuid"), self.value)
+        self.assertIs(DictUtils.get_value(properties, 'same', data_type="uuid"), self.value)
+        self.assertIsNone(DictUtils.get_value(properties, 'empty', data_type="uuid"))
+        self.assertEqual(DictUtils.get_value(properties, 'none', data_type="uuid", default_value=str(self.value)),
+                         self.value)
+        self.assertEqual(DictUtils.get_required_value(properties, 'id', data_type="uuid"), self.value)
+
+        with self.assertRaises(InvalidParameterError) as context:
+            DictUtils.get_value(properties, 'invalid', data_type="uuid")
+
+        self.assertEqual(str(context.exception), 'Parameter "invalid" could not be converted to an uuid')
+
+        with self.assertRaises(NoneParameterError):
+            DictUtils.get_required_value(properties, 'none', data_type="uuid")
+
+    def test_schema(self):
+        children = [self.value, self.value]
+        context = {'id': str(self.value), 'children': children}
+
+        for codegen in [False, True]:
+            enabled = CodegenBackend.is_enabled()
+            if codegen:
+                CodegenBackend.enable()
+
+            try:
+                result = SchemaValidator.validate(context, self.schema)
+                self.assertEqual(result, {'id': self.value, 'parent': self.value, 'children': children})
+                self.assertIs(result['children'], children)
+
+                result = SchemaValidator.validate({'id': 1, 'children': [str(self.value), "x"]}, self.schema,
+                                                  collect_errors=True)
+                self.assertEqual(result.errors[0].message, 'Parameter "id" could not be converted to an uuid')
+
+                with self.assertRaises(InvalidParameterError):
+                    SchemaValidator.validate({'id': "x"}, self.schema)
+
+                result = SchemaValidator.validate({'id': self.value, 'children': [str(self.value), "x"]}, self.schema)
+                self.assertEqual(result['children'], [self.value, None])
+            finally:
+                if not enabled:
+                    CodegenBackend.disable()
+
+    def test_register(self):
+        TypeRegistry.unregister('uuid')
+        self.assertFalse(TypeRegistry.is_registered('uuid'))
+        self.assertTrue(TypeRegistry.is_registered('int'))
+
+        # the prepared scheme is dropped when the type is registered
+        self.assertEqual(SchemaValidator.validate({'id': "x"}, self.schema[:1]), {'id': "x"})
+        TypeRegistry.register('uuid', try_parse_uuid)
+        with self.assertRaises(InvalidParameterError):
+            SchemaValidator.validate({'id': "x"}, self.schema[:1])
+
+        with self.assertRaises(InvalidSchemeError):
+            TypeRegistry.register('int', try_parse_uuid)
+
+        with self.assertRaises(InvalidSchemeError):
+            TypeRegistry.unregister('int')
+
+        with self.assertRaises(InvalidSchemeError):
+            TypeRegistry.register('email', None)
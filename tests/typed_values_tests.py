@@ -0,0 +1,36 @@
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+
+from power_dict.utils import DictUtils, is_empty
+
+
+class TypedValuesTests(unittest.TestCase):
+    values = {
+        'int': 5,
+        'float': 1.5,
+        'bool': False,
+        'decimal': Decimal('1.10'),
+        'date': date(2020, 1, 2),
+        'datetime': datetime(2020, 1, 2, 3, 4, 5),
+    }
+
+    def test_passthrough(self):
+        for data_type, value in self.values.items():
+            properties = {'key': value}
+            self.assertIs(DictUtils.get_value(properties, 'key', data_type=data_type), value)
+            self.assertIs(DictUtils.get_required_value(properties, 'key', data_type=data_type), value)
+
+    def test_subclass_is_converted(self):
+        self.assertEqual(DictUtils.get_int_dict_property({'key': True}, 'key'), 1)
+        self.assertEqual(DictUtils.get_float_dict_property({'key': 1}, 'key'), 1.0)
+        self.assertIsInstance(DictUtils.get_float_dict_property({'key': 1}, 'key'), float)
+
+    def test_is_empty(self):
+        for value in (None, '', ' \n'):
+            self.assertTrue(is_empty(value))
+
+        for value in ('0', 0, False, 0.0, Decimal(0), [0]):
+            self.assertFalse(is_empty(value))
+
+        self.assertEqual(is_empty([]), DictUtils.str_is_null_or_empty([]))
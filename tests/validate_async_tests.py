@@ -0,0 +1,81 @@
+import asyncio
+import unittest
+
+from power_dict import codegen
+from power_dict.errors import InvalidParameterError, InvalidSchemeError
+from power_dict.schema_validator import SchemaValidator
+
+
+class ValidateAsyncTests(unittest.TestCase):
+    def setUp(self):
+        self.active = 0
+        self.max_active = 0
+
+    async def slow_positive(self, value):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        return value > 0
+
+    @staticmethod
+    def validate(*args, **kwargs):
+        return asyncio.run(SchemaValidator.validate_async(*args, **kwargs))
+
+    def schema(self):
+        return [
+            {'name': 'a', 'type': "int", 'validators': [self.slow_positive]},
+            {'name': 'b', 'type': "int", 'validators': [lambda v: v < 100, self.slow_positive]},
+            {'name': 'c', 'type': "int", 'validators': [{'f': self.slow_positive, 'message': "#VALUE# is negative"}]},
+        ]
+
+    def test_validate_async(self):
+        result = self.validate({'a': "1", 'b': 2, 'c': "3"}, self.schema())
+
+        self.assertEqual(result, {'a': 1, 'b': 2, 'c': 3})
+        self.assertEqual(self.max_active, 3)
+
+    def test_concurrency(self):
+        self.validate({'a': 1, 'b': 2, 'c': 3}, self.schema(), concurrency=2)
+        self.assertEqual(self.max_active, 2)
+
+        with self.assertRaises(InvalidParameterError):
+            self.validate({}, self.schema(), concurrency=0)
+
+    def test_message(self):
+        with self.assertRaisesRegex(InvalidSchemeError, "^-3 is negative$"):
+            self.validate({'a': 1, 'b': 2, 'c': -3}, self.schema())
+
+        with self.assertRaisesRegex(InvalidSchemeError, "^The parameter 'a does not match the specified condition$"):
+            self.validate({'a': -1, 'c': -3}, self.schema())
+
+    def test_error_order(self):
+        # the same error as validate: the validator of 'a' fails before 'b' is converted
+        schema = self.schema()
+        schema[0]['validators'].append(lambda v: False)
+
+        with self.assertRaisesRegex(InvalidSchemeError, "'a does not match"):
+            self.validate({'a': 1, 'b': "x"}, schema)
+
+        with self.assertRaisesRegex(InvalidParameterError, 'Parameter "b" could not be converted'):
+            self.validate({'b': "x"}, schema)
+
+    def test_sync_validation(self):
+        # a coroutine function validator doesn't pass with an un-awaited coroutine
+        schema = self.schema()
+        schema[1]['adaptive_validators'] = True
+        nested = [{'name': 'item', 'type': "dict", 'schema': schema}]
+        message = "^The validator of the parameter 'a' is a coroutine function, use validate_async$"
+
+        for validate in [lambda c: SchemaValidator.validate(c, schema),
+                         lambda c: SchemaValidator.validate(c, tuple(schema)),
+                         SchemaValidator.compile(schema).validate,
+                         codegen.get_validator(schema),
+                         lambda c: SchemaValidator.validate({'item': c}, nested)]:
+            with self.assertRaisesRegex(InvalidSchemeError, message):
+                validate({'a': 1, 'b': 2, 'c': 3})
+
+        with self.assertRaisesRegex(InvalidSchemeError, "'b' is a coroutine function"):
+            SchemaValidator.validate({'b': 2}, schema)
+
+        self.assertEqual(self.validate({'a': 1, 'b': 2, 'c': 3}, schema), {'a': 1, 'b': 2, 'c': 3})
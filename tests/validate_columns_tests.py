@@ -0,0 +1,100 @@
+import unittest
+from datetime import date, datetime
+from unittest import mock
+
+from power_dict import columnar
+from power_dict.errors import InvalidParameterError, NoneParameterError, InvalidSchemeError, \
+    NotAllowedParameterError
+from power_dict.schema_validator import SchemaValidator
+
+
+class ValidateColumnsTests(unittest.TestCase):
+    schema = [
+        {'name': 'id', 'type': "int", 'required': True},
+        {'name': 'price', 'type': "float", 'required': False, 'default_value': 0.5},
+        {'name': 'active', 'type': "bool", 'required': False, 'default_value': False},
+        {'name': 'day', 'type': "date", 'required': False},
+        {'name': 'created', 'type': "datetime", 'required': False},
+        {'name': 'gender', 'type': "enum", 'required': False, 'choices': ['male', 'female']},
+        {'name': 'name', 'type': "str", 'required': False},
+    ]
+
+    size = 200
+
+    def columns(self):
+        size = self.size
+        return {
+            'id': [str(i) for i in range(size)],
+            'price': [i / 4 for i in range(size)],
+            'active': ['yes', 'no'] * (size // 2),
+            'day': ['2018-11-23'] * size,
+            'created': ['2018-11-23 01:45:59', '2018-11-23T01:45:59'] * (size // 2),
+            'gender': ['male', None] * (size // 2),
+        }
+
+    def assert_same_as_rows(self, columns):
+        target = SchemaValidator.validate_columns(columns, self.schema)
+
+        keys = list(columns.keys())
+        for i in range(self.size):
+            row = SchemaValidator.validate({key: columns[key][i] for key in keys}, self.schema)
+            self.assertEqual({key: values[i] for key, values in target.items()}, row)
+
+        return target
+
+    def test_validate_columns(self):
+        target = self.assert_same_as_rows(self.columns())
+        self.assertEqual(target['id'][:3], [0, 1, 2])
+        self.assertEqual(target['active'][:2], [True, False])
+        self.assertEqual(target['day'][0], date(2018, 11, 23))
+        self.assertEqual(target['created'][1], datetime(2018, 11, 23, 1, 45, 59))
+        self.assertEqual(target['gender'][:2], ['male', None])
+        self.assertEqual(target['name'][:2], ['', ''])
+
+    def test_without_numpy(self):
+        with mock.patch.object(columnar, 'numpy', None):
+            self.assert_same_as_rows(self.columns())
+
+    @unittest.skipIf(columnar.numpy is None, "NumPy is not installed")
+    def test_numpy_arrays(self):
+        numpy = columnar.numpy
+        columns = self.columns()
+        columns['id'] = numpy.arange(self.size)
+        columns['price'] = numpy.arange(self.size, dtype=numpy.float32) / 3
+        columns['active'] = numpy.array([1, 0] * (self.size // 2))
+        target = self.assert_same_as_rows(columns)
+        self.assertIs(type(target['id'][0]), int)
+        self.assertIs(type(target['price'][0]), float)
+        self.assertIs(target['active'][0], True)
+
+    def test_mixed_values(self):
+        columns = self.columns()
+        columns['id'] = [' 1', '007', 3, 4.0] * (self.size // 4)
+        columns['price'] = ['1.5', None, '', 2] * (self.size // 4)
+        columns['active'] = [1, 0, True, 'T'] * (self.size // 4)
+        columns['day'] = ['2018-11-23', date(2018, 1, 1)] * (self.size // 2)
+        self.assert_same_as_rows(columns)
+
+    def test_errors(self):
+        columns = self.columns()
+        columns['id'][10] = None
+        with self.assertRaises(NoneParameterError):
+            SchemaValidator.validate_columns(columns, self.schema)
+
+        columns = self.columns()
+        columns['day'][10] = '2018-02-30'
+        with self.assertRaises(InvalidParameterError):
+            SchemaValidator.validate_columns(columns, self.schema)
+
+        columns = self.columns()
+        columns['gender'][10] = 'unknown'
+        with self.assertRaises(InvalidSchemeError):
+            SchemaValidator.validate_columns(columns, self.schema)
+
+        columns = self.columns()
+        columns['id'] = columns['id'][1:]
+        with self.assertRaises(InvalidParameterError):
+            SchemaValidator.validate_columns(columns, self.schema)
+
+        with self.assertRaises(NotAllowedParameterError):
+            SchemaValidator.validate_columns({'unknown': []}, self.schema)
@@ -0,0 +1,60 @@
+import unittest
+
+from power_dict.errors import InvalidParameterError, NoneParameterError, NotAllowedParameterError
+from power_dict.results import BatchResult
+from power_dict.schema_validator import SchemaValidator
+
+
+class ValidateManyTests(unittest.TestCase):
+    schema = [
+        {'name': 'id', 'type': "int", 'required': True},
+        {'name': 'amount', 'type': "decimal", 'required': False, 'default_value': "0"},
+    ]
+
+    contexts = [
+        {'id': "1", 'amount': "1.5"},
+        {'id': "x"},
+        {'id': "3"},
+        {'amount': "3"},
+        {'id': "5", 'unknown': 1},
+    ]
+
+    def test_collect_all(self):
+        target = SchemaValidator.validate_many(self.contexts, self.schema)
+        self.assertIsInstance(target, BatchResult)
+        self.assertFalse(target.is_valid)
+        self.assertEqual(target.processed, 5)
+        self.assertEqual(target.indexes, [0, 2])
+        self.assertEqual([item['id'] for item in target.data], [1, 3])
+
+        self.assertEqual([e.index for e in target.errors], [1, 3, 4])
+        self.assertIsInstance(target.errors[0].error, InvalidParameterError)
+        self.assertIsInstance(target.errors[1].error, NoneParameterError)
+        self.assertIsInstance(target.errors[2].error, NotAllowedParameterError)
+
+    def test_container_values(self):
+        contexts = [{'id': 1}, {'id': {'x': 1}}, {'id': 3, 'amount': [1]}, {'id': 4}]
+        target = SchemaValidator.validate_many(contexts, self.schema)
+        self.assertEqual(target.indexes, [0, 3])
+        self.assertEqual([e.index for e in target.errors], [1, 2])
+        self.assertIsInstance(target.errors[0].error, InvalidParameterError)
+        self.assertIsInstance(target.errors[1].error, InvalidParameterError)
+
+        target = SchemaValidator.validate_parallel(contexts, self.schema, workers=2)
+        self.assertEqual([e.index for e in target.errors], [1, 2])
+
+    def test_stop_on_error(self):
+        target = SchemaValidator.validate_many(iter(self.contexts), self.schema, stop_on_error=True)
+        self.assertEqual(target.processed, 2)
+        self.assertEqual(len(target.data), 1)
+        self.assertEqual([e.index for e in target.errors], [1])
+
+    def test_sanitize_schema(self):
+        target = SchemaValidator.validate_many(self.contexts, self.schema, sanitize_schema=False)
+        self.assertEqual(target.indexes, [0, 2, 4])
+
+    def test_valid(self):
+        compiled = SchemaValidator.compile(self.schema)
+        target = compiled.validate_many([{'id': i} for i in range(100)])
+        self.assertTrue(target.is_valid)
+        self.assertEqual(target.data, [{'id': i, 'amount': 0} for i in range(100)])
@@ -0,0 +1,74 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from power_dict.errors import InvalidSchemeError, InvalidParameterError
+from power_dict.schema_validator import SchemaValidator, _map_bounded
+
+
+def positive(value) -> bool:
+    return value > 0
+
+
+class ValidateParallelTests(unittest.TestCase):
+    schema = [
+        {'name': 'id', 'type': "int", 'required': True,
+         'validators': [{'f': 'tests.validate_parallel_tests:positive', 'message': 'id #VALUE# is not positive'}]},
+        {'name': 'amount', 'type': "decimal", 'required': False, 'default_value': "0"},
+    ]
+
+    def test_validate_parallel(self):
+        contexts = [{'id': str(i)} for i in range(-5, 995)]
+        contexts[500]['id'] = "x"
+
+        target = SchemaValidator.validate_parallel(contexts, self.schema, workers=2, chunk_size=100)
+        expected = SchemaValidator.validate_many(contexts, self.schema)
+
+        self.assertEqual(target.processed, 1000)
+        self.assertEqual(target.data, expected.data)
+        self.assertEqual(target.indexes, expected.indexes)
+        self.assertEqual([e.index for e in target.errors], [0, 1, 2, 3, 4, 5, 500])
+        self.assertEqual(str(target.errors[0].error), 'id -5 is not positive')
+        self.assertIsInstance(target.errors[6].error, InvalidParameterError)
+
+    def test_single_worker(self):
+        target = SchemaValidator.validate_parallel(({'id': i} for i in range(1, 11)), self.schema, workers=1)
+        self.assertEqual([item['id'] for item in target.data], list(range(1, 11)))
+
+    def test_generator(self):
+        target = SchemaValidator.validate_parallel(({'id': i} for i in range(1, 1001)), self.schema, workers=2,
+                                                   chunk_size=10)
+        self.assertEqual([item['id'] for item in target.data], list(range(1, 1001)))
+
+    def test_bounded_window(self):
+        read = []
+
+        def source():
+            for item in range(100):
+                read.append(item)
+                yield item
+
+        with ThreadPoolExecutor(2) as executor:
+            results = _map_bounded(executor, lambda item: item * 2, source(), 4)
+            self.assertEqual(next(results), 0)
+            self.assertEqual(len(read), 5)
+            self.assertEqual(list(results), [item * 2 for item in range(1, 100)])
+
+    def test_chunk_size(self):
+        for workers in (1, 2):
+            with self.assertRaises(InvalidParameterError):
+                SchemaValidator.validate_parallel([{'id': 1}], self.schema, workers=workers, chunk_size=0)
+
+    def test_not_picklable_schema(self):
+        schema = [{'name': 'id', 'type': "int", 'validators': [lambda v: v > 0]}]
+        with self.assertRaises(InvalidSchemeError):
+            SchemaValidator.validate_parallel([{'id': 1}], schema, workers=2)
+
+    def test_validator_name(self):
+        self.assertEqual(SchemaValidator.validate({'id': "1"}, self.schema)['id'], 1)
+
+        with self.assertRaises(InvalidSchemeError):
+            SchemaValidator.validate({'id': "-1"}, self.schema)
+
+        schema = [{'name': 'id', 'type': "int", 'validators': ['tests.validate_parallel_tests.unknown']}]
+        with self.assertRaises(InvalidSchemeError):
+            SchemaValidator.validate({'id': "1"}, schema)
@@ -0,0 +1,90 @@
+import unittest
+
+from power_dict.errors import InvalidParameterError, NoneParameterError, NotAllowedParameterError
+from power_dict.schema_validator import SchemaValidator
+
+
+class ValidatePatchTests(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        def positive(value):
+            self.calls.append(value)
+            return value > 0
+
+        self.schema = [
+            {'name': 'id', 'type': "int", 'required': True},
+            {'name': 'price', 'type': "float", 'validators': [{'f': positive, 'message': "Invalid price '#VALUE#'"}]},
+            {'name': 'count', 'type': "int", 'default_value': 1, 'validators': [positive]},
+            {'name': 'title', 'type': "str", 'aliases': ['name']},
+        ]
+
+    def test_validate_patch(self):
+        previous = SchemaValidator.validate({'id': "1", 'price': "2.5", 'title': "a"}, self.schema)
+        self.calls.clear()
+
+        result = SchemaValidator.validate_patch(previous, {'price': "3"}, self.schema)
+
+        self.assertEqual(result, {'id': 1, 'price': 3.0, 'count': 1, 'title': "a"})
+        self.assertEqual(self.calls, [3.0])
+        self.assertEqual(previous['price'], 2.5)
+
+        merged = SchemaValidator.validate({'id': "1", 'price': "3", 'title': "a"}, self.schema)
+        self.assertEqual(result, merged)
+
+    def test_alias(self):
+        previous = SchemaValidator.validate({'id': 1, 'title': "a"}, self.schema)
+
+        result = SchemaValidator.validate_patch(previous, {'name': "b"}, self.schema)
+        self.assertEqual(result['title'], "a")
+        self.assertNotIn('name', result)
+
+        result = SchemaValidator.validate_patch(previous, {'title': None, 'name': "b"}, self.schema)
+        self.assertEqual(result['title'], "b")
+
+        result = SchemaValidator.validate_patch(previous, {'title': "c", 'name': "b"}, self.schema)
+        self.assertEqual(result['title'], "c")
+
+    def test_alias_over_name(self):
+        schema = [{'name': 'id', 'type': "int", 'aliases': ['uid']}, {'name': 'price', 'type': "float"}]
+        previous = SchemaValidator.validate({'id': 1}, schema)
+
+        for patch in [{'uid': "5"}, {'uid': "x"}, {'id': None, 'uid': "5"}, {'id': None, 'uid': "x"}]:
+            try:
+                expected = SchemaValidator.validate({**previous, **patch}, schema)
+            except Exception as e:
+                with self.assertRaises(type(e)) as context:
+                    SchemaValidator.validate_patch(previous, patch, schema)
+
+                self.assertEqual(str(context.exception), str(e))
+            else:
+                self.assertEqual(SchemaValidator.validate_patch(previous, patch, schema), expected)
+
+        self.assertEqual(SchemaValidator.validate_patch(previous, {'uid': "5"}, schema)['id'], 1)
+
+        previous = SchemaValidator.validate({'price': 1}, schema)
+        self.assertEqual(SchemaValidator.validate_patch(previous, {'uid': "5"}, schema)['id'], 5)
+
+    def test_errors(self):
+        previous = SchemaValidator.validate({'id': 1, 'price': 1}, self.schema)
+
+        for patch in [{'price': "-1"}, {'price': "x"}, {'id': None}, {'count': 0}, {'other': 1}]:
+            with self.assertRaises(Exception) as full:
+                SchemaValidator.validate({**previous, **patch}, self.schema)
+
+            with self.assertRaises(type(full.exception)) as partial:
+                SchemaValidator.validate_patch(previous, patch, self.schema)
+
+            self.assertEqual(str(partial.exception), str(full.exception))
+
+        with self.assertRaises(InvalidParameterError):
+            SchemaValidator.validate_patch(previous, {'price': "x"}, self.schema)
+
+        with self.assertRaises(NoneParameterError):
+            SchemaValidator.validate_patch(previous, {'id': None}, self.schema)
+
+        with self.assertRaises(NotAllowedParameterError):
+            SchemaValidator.validate_patch(previous, {'other': 1}, self.schema)
+
+        result = SchemaValidator.validate_patch(previous, {'other': 1}, self.schema, sanitize_schema=False)
+        self.assertNotIn('other', result)
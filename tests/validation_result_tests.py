@@ -0,0 +1,88 @@
+import unittest
+
+from power_dict.errors import InvalidSchemeError
+from power_dict.results import FieldError, ValidationResult
+from power_dict.schema_validator import SchemaValidator
+
+
+class ValidationResultTests(unittest.TestCase):
+    schema = [
+        {'name': 'id', 'type': "int", 'required': True},
+        {'name': 'login', 'type': "str", 'required': True, 'required_error': 'Login is not specified'},
+        {'name': 'age', 'type': "int", 'required': False, 'validators': [
+            {'f': lambda v: 0 < v <= 150, 'message': 'Invalid age #VALUE#'}]},
+        {'name': 'gender', 'type': "enum", 'required': False, 'choices': ['male', 'female']},
+        {'name': 'roles', 'type': "list", 'required': True, 'empty': False, 'items': {'type': 'str'}},
+        {'name': 'tags', 'type': "list", 'required': False, 'items': {'type': 'enum', 'choices': ['a', 'b']}},
+        {'name': 'score', 'type': "float", 'required': False, 'validators': [lambda v: v >= 0]},
+    ]
+
+    def test_valid(self):
+        context = {'id': "1", 'login': "user", 'roles': ["admin"]}
+        target = SchemaValidator.validate(context, self.schema, collect_errors=True)
+        self.assertIsInstance(target, ValidationResult)
+        self.assertTrue(target.is_valid)
+        self.assertEqual(target.errors, [])
+        self.assertEqual(target.data, SchemaValidator.validate(context, self.schema))
+
+    def test_all_errors(self):
+        context = {'id': "x", 'age': "200", 'gender': "other", 'roles': [], 'tags': ['a', 'c'], 'score': "-1",
+                   'unknown': 1}
+        target = SchemaValidator.validate(context, self.schema, collect_errors=True)
+        self.assertFalse(target.is_valid)
+        self.assertEqual(target.data, {})
+        self.assertEqual(target.errors, [
+            FieldError('unknown', 'not_allowed', "The parameter 'unknown' is not allowed"),
+            FieldError('id', 'invalid', 'Parameter "id" could not be converted to a int'),
+            FieldError('login', 'required', 'Login is not specified'),
+            FieldError('age', 'validator', 'Invalid age 200'),
+            FieldError('gender', 'choice',
+                       "The value 'other' is not available for selection. Possible options: ['male', 'female']"),
+            FieldError('roles', 'empty', "The list can't be empty."),
+            FieldError('tags', 'choice', "The value 'c' is not available for selection. Possible options: ['a', 'b']"),
+            FieldError('score', 'validator', "The parameter 'score does not match the specified condition"),
+        ])
+
+    def test_partial_data(self):
+        context = {'id': "1", 'login': "user", 'roles': ["admin"], 'age': "x"}
+        target = SchemaValidator.compile(self.schema).validate(context, collect_errors=True)
+        self.assertEqual([e.code for e in target.errors], [FieldError.INVALID])
+        self.assertEqual(target.data['id'], 1)
+        self.assertNotIn('age', target.data)
+
+    def test_same_messages_as_exceptions(self):
+        contexts = [{'id': "x"}, {'id': "1"}, {'id': "1", 'login': "u", 'roles': []}, {'unknown': 1}]
+        for context in contexts:
+            target = SchemaValidator.validate(context, self.schema, collect_errors=True)
+            with self.assertRaises(Exception) as e:
+                SchemaValidator.validate(context, self.schema)
+
+            self.assertEqual(target.errors[0].message, str(e.exception))
+
+    def test_schema_conflict(self):
+        schema = [{'name': 'roles', 'type': "list", 'required': False, 'empty': False}]
+        target = SchemaValidator.validate({'roles': ["admin"]}, schema, collect_errors=True)
+        self.assertEqual(target.errors[0].code, FieldError.SCHEMA)
+
+    def test_unsupported_format(self):
+        schema = [{'name': 'code', 'type': "int", 'format': '%d'}, {'name': 'id', 'type': "int"}]
+        target = SchemaValidator.validate({'code': "1", 'id': "x"}, schema, collect_errors=True)
+
+        self.assertEqual([(error.field, error.code) for error in target.errors],
+                         [('code', FieldError.SCHEMA), ('id', FieldError.INVALID)])
+        self.assertEqual(target.errors[0].message, "The parameter 'code' of type 'int' doesn't support 'format'")
+
+        with self.assertRaises(InvalidSchemeError):
+            SchemaValidator.validate({'code': "1"}, schema)
+
+    def test_unconvertible_values(self):
+        schema = [
+            {'name': 'id', 'type': "int", 'required': True},
+            {'name': 'amount', 'type': "float"},
+            {'name': 'tags', 'type': "list"},
+        ]
+        target = SchemaValidator.validate({'id': "x", 'amount': [1], 'tags': 5}, schema, collect_errors=True)
+
+        self.assertEqual([(error.field, error.code) for error in target.errors],
+                         [('id', FieldError.INVALID), ('amount', FieldError.INVALID), ('tags', FieldError.INVALID)])
+        self.assertEqual(target.errors[2].message, 'Parameter "tags" could not be converted to a list')
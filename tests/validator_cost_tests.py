@@ -0,0 +1,101 @@
+import unittest
+
+from power_dict import compiled_schema
+from power_dict.codegen import CodegenBackend
+from power_dict.errors import InvalidSchemeError
+from power_dict.schema_validator import SchemaValidator
+
+
+class ValidatorCostTests(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+        self.epoch = compiled_schema.ADAPTIVE_EPOCH
+        compiled_schema.ADAPTIVE_EPOCH = 10
+
+    def tearDown(self):
+        compiled_schema.ADAPTIVE_EPOCH = self.epoch
+
+    def validator(self, name, condition, cost=None):
+        def f(value):
+            self.calls.append(name)
+            return condition(value)
+
+        validator = {'f': f, 'message': f"{name} '#VALUE#'"}
+        if cost is not None:
+            validator['cost'] = cost
+
+        return validator
+
+    def schema(self, adaptive=False):
+        return [{'name': 'code', 'type': "str", 'adaptive_validators': adaptive, 'validators': [
+            self.validator('regex', lambda v: v.isalnum(), cost=10),
+            self.validator('lookup', lambda v: not v.startswith("blocked"), cost=10),
+            self.validator('length', lambda v: len(v) < 8),
+            self.validator('prefix', lambda v: not v.startswith("x"), cost=0.5),
+        ]}]
+
+    def test_cost(self):
+        schema = self.schema()
+        SchemaValidator.validate({'code': "abc"}, schema)
+        self.assertEqual(self.calls, ['prefix', 'length', 'regex', 'lookup'])
+
+        self.calls.clear()
+        with self.assertRaises(InvalidSchemeError) as context:
+            SchemaValidator.validate({'code': "a-b-c-d-e"}, schema)
+
+        self.assertEqual(str(context.exception), "length 'a-b-c-d-e'")
+        self.assertEqual(self.calls, ['prefix', 'length'])
+
+        result = SchemaValidator.validate({'code': "a-b"}, schema, collect_errors=True)
+        self.assertEqual(result.errors[0].message, "regex 'a-b'")
+
+    def test_invalid_cost(self):
+        for cost in [0, -1, "x"]:
+            schema = [{'name': 'code', 'validators': [{'f': len, 'cost': cost}]}]
+            with self.assertRaises(Exception):
+                SchemaValidator.validate({'code': "abc"}, schema)
+
+    def test_adaptive(self):
+        schema = self.schema(adaptive=True)
+        for _ in range(10):
+            with self.assertRaises(InvalidSchemeError) as context:
+                SchemaValidator.validate({'code': "blocked"}, schema)
+
+            self.assertEqual(str(context.exception), "lookup 'blocked'")
+
+        self.calls.clear()
+        SchemaValidator.validate({'code': "abc"}, schema)
+        self.assertEqual(self.calls, ['lookup', 'prefix', 'length', 'regex'])
+
+        # the value rejected by several validators gets the error of the first one in the cost order
+        # whatever the current order is
+        with self.assertRaises(InvalidSchemeError) as expected:
+            SchemaValidator.validate({'code': "blocked-"}, self.schema())
+
+        self.calls.clear()
+        with self.assertRaises(InvalidSchemeError) as context:
+            SchemaValidator.validate({'code': "blocked-"}, schema)
+
+        self.assertEqual(str(context.exception), "length 'blocked-'")
+        self.assertEqual(str(context.exception), str(expected.exception))
+        self.assertEqual(self.calls, ['lookup', 'prefix', 'length'])
+
+        result = SchemaValidator.validate({'code': "blocked-"}, schema, collect_errors=True)
+        self.assertEqual(result.errors[0].message, "length 'blocked-'")
+
+        # without rejections the order goes back to the cost order as the counters are halved every epoch
+        for _ in range(50):
+            SchemaValidator.validate({'code': "abc"}, schema)
+
+        self.calls.clear()
+        SchemaValidator.validate({'code': "abc"}, schema)
+        self.assertEqual(self.calls, ['prefix', 'length', 'regex', 'lookup'])
+
+    def test_adaptive_codegen(self):
+        enabled = CodegenBackend.is_enabled()
+        CodegenBackend.enable()
+        try:
+            self.test_adaptive()
+        finally:
+            if not enabled:
+                CodegenBackend.disable()